@@ -1,29 +1,64 @@
 
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_cors import CORS
 import pickle
 import numpy as np
 import pandas as pd
+from scipy import sparse
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import json
 import hashlib
+import uuid
+import bisect
+import ipaddress
+import socket
+import contextvars
+import atexit
+import zlib
 import time
 import os
+import sys
+import threading
+import queue
+import sqlite3
 from datetime import datetime
-from collections import Counter
-from urllib.parse import urlparse
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import logging
 
+try:
+    import fcntl  # Locks METRICS_DIR while exited workers' metrics are folded in (POSIX only)
+except ImportError:
+    fcntl = None
+
 # Configure logging early
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# spaCy is only used for named entities (and sentence boundaries), so the
+# tagger/parser/lemmatizer are never loaded; batch paths run nlp.pipe
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+SPACY_EXCLUDE = [name.strip() for name in os.getenv("SPACY_EXCLUDE", "tagger,parser,attribute_ruler,lemmatizer").split(',') if name.strip()]
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))  # > 1 forks worker processes inside nlp.pipe
+
 # Try to import optional dependencies
 try:
     import spacy
-    nlp = spacy.load("en_core_web_sm")
+    nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+    # The shared tok2vec only feeds the tagger/parser; drop it once nothing listens to it
+    if nlp.has_pipe('tok2vec') and not nlp.get_pipe('tok2vec').listening_components:
+        nlp.remove_pipe('tok2vec')
+    if not nlp.has_pipe('parser') and not nlp.has_pipe('senter'):
+        nlp.add_pipe('sentencizer', first=True)
     SPACY_AVAILABLE = True
 except:
     nlp = None
@@ -35,12 +70,6 @@ try:
 except:
     GEMINI_AVAILABLE = False
 
-try:
-    from serpapi import GoogleSearch
-    SERPAPI_AVAILABLE = True
-except:
-    SERPAPI_AVAILABLE = False
-
 try:
     from newspaper import Article
     NEWSPAPER_AVAILABLE = True
@@ -48,7 +77,7 @@ try:
 except Exception as e:
     NEWSPAPER_AVAILABLE = False
     print(f"❌ Newspaper3k could not be loaded: {e}")
-    print("📰 Article extraction will use BeautifulSoup fallback")
+    print("📰 Article extraction will use lxml fallback")
 
 try:
     import textstat
@@ -100,6 +129,17 @@ stop_words = None
 fact_checker = None
 ai_analyzer = None
 real_time_verifier = None
+response_cache = None
+job_queue = None
+article_extractor = None
+bulk_extractor = None
+credibility_scorer = None
+news_source_finder = None
+fact_verifier = None
+network_clients_pid = None  # Process that built the network clients (reset by fork)
+
+# Load the ML components at import time so a preloading gunicorn master shares them with workers
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "false").lower() in ["1", "true", "yes", "on"]
 
 # API Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "YOUR_GEMINI_API_KEY_HERE")
@@ -107,6 +147,998 @@ SERPAPI_KEY = os.getenv("SERPAPI_KEY", "YOUR_SERPAPI_KEY_HERE")
 GOOGLE_SEARCH_API_KEY = os.getenv("GOOGLE_SEARCH_API_KEY", "YOUR_GOOGLE_SEARCH_API_KEY_HERE")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID", "YOUR_GOOGLE_CSE_ID_HERE")
 
+# Provider base URLs, overridable to point at local stand-ins (fake_providers.py)
+SERPAPI_BASE_URL = os.getenv("SERPAPI_BASE_URL", "https://serpapi.com").rstrip('/')
+GOOGLE_CSE_BASE_URL = os.getenv("GOOGLE_CSE_BASE_URL", "https://www.googleapis.com").rstrip('/')
+GOOGLE_NEWS_BASE_URL = os.getenv("GOOGLE_NEWS_BASE_URL", "https://news.google.com").rstrip('/')
+NEWS_SITES_BASE_URL = os.getenv("NEWS_SITES_BASE_URL", "").rstrip('/')  # Replaces the direct news-site searches
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "").rstrip('/')  # Set to use the REST transport against it
+
+# ML model artifacts: "pickle" loads the sklearn pickles, "arrays" memory-maps the flat
+# NumPy export written by export_model.py, "auto" prefers the export when present
+MODEL_FORMAT = os.getenv("MODEL_FORMAT", "auto").lower()
+MODEL_ARTIFACTS_DIR = os.getenv("MODEL_ARTIFACTS_DIR", "model_artifacts")
+
+# Batch scoring limits
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
+
+# Analysis stage execution: "concurrent" fans the network-bound stages out on a
+# bounded thread pool, "sequential" runs them one after another
+ANALYSIS_EXECUTION_MODE = os.getenv("ANALYSIS_EXECUTION_MODE", "concurrent").lower()
+STAGE_POOL_SIZE = int(os.getenv("STAGE_POOL_SIZE", "8"))
+
+# Per-stage deadlines in seconds (enforced in concurrent mode)
+STAGE_TIMEOUTS = {
+    'ai_analysis': float(os.getenv("STAGE_TIMEOUT_AI", "20")),
+    'real_time_verification': float(os.getenv("STAGE_TIMEOUT_REAL_TIME", "60")),
+    'legacy_fact_verification': float(os.getenv("STAGE_TIMEOUT_LEGACY", "30")),
+    'related_sources': float(os.getenv("STAGE_TIMEOUT_SOURCES", "20"))
+}
+
+stage_executor = ThreadPoolExecutor(max_workers=STAGE_POOL_SIZE, thread_name_prefix='analysis-stage')
+
+# Claims of one article are verified in parallel on this pool
+CLAIM_VERIFICATION_WORKERS = int(os.getenv("CLAIM_VERIFICATION_WORKERS", "5"))
+claim_executor = ThreadPoolExecutor(max_workers=CLAIM_VERIFICATION_WORKERS, thread_name_prefix='claim-verify')
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)  # Tokens added per second (<= 0 disables limiting)
+        self.capacity = max(1.0, float(capacity))  # A bucket smaller than one token could never fill
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1, timeout=None):
+        """Block until tokens are available; returns False if timeout elapses first"""
+        if self.rate <= 0:
+            return True
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity:g}")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                wait = (tokens - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+# Per-provider rate limiters, shared by every request and thread in this process.
+# The configured rate and burst are server-wide quotas: gunicorn.conf.py calls
+# share_rate_limits() after fork so each worker only gets its share.
+RATE_LIMIT_WAIT = float(os.getenv("RATE_LIMIT_WAIT", "30"))
+RATE_LIMITS = {
+    'serpapi': (float(os.getenv("SERPAPI_RATE_PER_SEC", "2")), float(os.getenv("SERPAPI_BURST", "5"))),
+    'google_cse': (float(os.getenv("GOOGLE_CSE_RATE_PER_SEC", "1")), float(os.getenv("GOOGLE_CSE_BURST", "5"))),
+    'gemini': (float(os.getenv("GEMINI_RATE_PER_SEC", "1")), float(os.getenv("GEMINI_BURST", "5")))
+}
+rate_limiters = {provider: TokenBucket(rate, burst) for provider, (rate, burst) in RATE_LIMITS.items()}
+
+def share_rate_limits(workers):
+    """Give this process 1/workers of every provider's rate and burst
+
+    Burst is kept at one token or more, so with fewer burst tokens than workers
+    the combined burst can exceed the configured one; the sustained rate cannot."""
+    workers = max(1, int(workers))
+    for provider, (rate, burst) in RATE_LIMITS.items():
+        rate_limiters[provider] = TokenBucket(rate / workers, burst / workers)
+    if workers > 1:
+        logger.info(f"🚦 Provider rate limits split across {workers} workers")
+
+def acquire_rate_limit(provider):
+    """Wait for a provider token, raising if the provider stays saturated"""
+    with trace_span(f"rate_limit:{provider}"):
+        acquired = rate_limiters[provider].acquire(timeout=RATE_LIMIT_WAIT)
+    if not acquired:
+        raise RuntimeError(f"{provider} rate limit wait exceeded {RATE_LIMIT_WAIT:.0f}s")
+
+# Metrics: each process keeps its own counters, gauges and histograms and (with
+# METRICS_DIR set, as gunicorn.conf.py does) periodically writes them to
+# METRICS_DIR/metrics-<pid>.json. /metrics merges every file, so whichever worker
+# answers the scrape reports totals for the whole server.
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+EXITED_METRICS_FILE = 'metrics-exited.json'  # Running totals of workers that have exited
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+# name -> (type, help); gauges also say how live workers combine ("sum" or "max").
+# Counters and histograms of exited workers keep counting so totals never go backwards.
+METRIC_DEFINITIONS = {
+    'fakenews_stage_duration_seconds': ('histogram', 'Analysis stage latency'),
+    'fakenews_stage_timeouts_total': ('counter', 'Stages replaced by their fallback after missing the deadline'),
+    'fakenews_stage_failures_total': ('counter', 'Stages replaced by their fallback after raising'),
+    'fakenews_provider_requests_total': ('counter', 'Calls to external providers'),
+    'fakenews_provider_errors_total': ('counter', 'Provider calls that raised or answered with HTTP >= 400'),
+    'fakenews_provider_request_duration_seconds': ('histogram', 'Provider call latency'),
+    'fakenews_cache_hits_total': ('counter', 'Cache lookups that found an entry'),
+    'fakenews_cache_misses_total': ('counter', 'Cache lookups that found nothing'),
+    'fakenews_cache_hit_ratio': ('gauge', 'Hits over lookups per cache, across all workers'),
+    'fakenews_responses_total': ('counter', 'Analyze responses by X-Cache status'),
+    'fakenews_http_requests_total': ('counter', 'API requests by endpoint and status code'),
+    'fakenews_http_request_duration_seconds': ('histogram', 'API request latency (until the first byte for streams)'),
+    'fakenews_http_requests_in_flight': ('gauge', 'API requests being handled', 'sum'),
+    'fakenews_analyses_in_flight': ('gauge', 'Analyses running (including streams and jobs)', 'sum'),
+    'fakenews_model_load_seconds': ('gauge', 'Time taken to load the ML model and vectorizer', 'max'),
+}
+
+def _label_key(labels):
+    return tuple(sorted(labels.items())) if labels else ()
+
+class Metrics:
+    """Process-local metrics registry, merged across worker processes at scrape time"""
+
+    def __init__(self, directory, flush_interval):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.counters = {}  # (name, label key) -> value
+        self.gauges = {}
+        self.histograms = {}  # (name, label key) -> [bucket counts..., +Inf count, sum]
+        self.flusher_pid = None
+
+    def inc(self, name, labels=None, amount=1):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, labels=None):
+        with self.lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def add_gauge(self, name, amount, labels=None):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.gauges[key] = self.gauges.get(key, 0) + amount
+
+    def observe(self, name, seconds, labels=None):
+        key = (name, _label_key(labels))
+        index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(LATENCY_BUCKETS) + 2)
+            histogram[index] += 1
+            histogram[-1] += seconds
+
+    def snapshot(self):
+        """This process's metrics (plus cache counters) as a JSON-serializable dict"""
+        with self.lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            histograms = {key: list(values) for key, values in self.histograms.items()}
+        for name, cache in caches.items():
+            counters[('fakenews_cache_hits_total', (('cache', name),))] = cache.hits
+            counters[('fakenews_cache_misses_total', (('cache', name),))] = cache.misses
+
+        def encode(series):
+            return [[name, dict(labels), value] for (name, labels), value in series.items()]
+        return {
+            'pid': os.getpid(),
+            'counters': encode(counters),
+            'gauges': encode(gauges),
+            'histograms': encode(histograms)
+        }
+
+    def flush(self):
+        """Write this process's snapshot to METRICS_DIR (atomically replacing the last one)"""
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"metrics-{os.getpid()}.json")
+            with open(path + '.tmp', 'w') as f:
+                json.dump(self.snapshot(), f)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            logger.warning(f"⚠️ Metrics flush failed: {str(e)}")
+
+    def start_flusher(self):
+        """Flush every flush_interval seconds from a background thread (once per process, after fork)"""
+        if not self.directory or self.flusher_pid == os.getpid():
+            return
+        self.flusher_pid = os.getpid()
+
+        def run():
+            while True:
+                time.sleep(self.flush_interval)
+                self.flush()
+
+        threading.Thread(target=run, daemon=True, name='metrics-flush').start()
+        atexit.register(self.flush)
+
+    def _snapshots(self):
+        """Snapshots of every process writing to METRICS_DIR, this one freshly taken"""
+        own = self.snapshot()
+        if not self.directory:
+            return [own]
+        self.flush()
+        snapshots = [own]
+        with self._directory_lock():
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return snapshots
+            exited = []
+            retired = None
+            for name in names:
+                if not (name.startswith('metrics-') and name.endswith('.json')) or name == f"metrics-{own['pid']}.json":
+                    continue
+                try:
+                    with open(os.path.join(self.directory, name)) as f:
+                        snapshot = json.load(f)
+                except (OSError, ValueError):
+                    continue  # Being replaced, or a worker died mid-write
+                if name == EXITED_METRICS_FILE:
+                    retired = snapshot
+                elif _process_alive(snapshot['pid']):
+                    snapshots.append(snapshot)
+                else:
+                    exited.append((name, snapshot))
+            if exited:
+                retired = self._retire(retired, exited)
+            if retired:
+                snapshots.append(retired)
+        return snapshots
+
+    @contextmanager
+    def _directory_lock(self):
+        """Serialize scrapes so an exited worker's file is folded into the totals exactly once"""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, '.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _retire(self, retired, exited):
+        """Fold exited workers' counters and histograms into EXITED_METRICS_FILE and delete their files
+
+        retired is the file's current content (or None); returns the updated totals (gauges dropped)."""
+        path = os.path.join(self.directory, EXITED_METRICS_FILE)
+        counters, histograms = {}, {}
+        if retired:
+            _merge_totals(counters, histograms, retired)
+        for _, snapshot in exited:
+            _merge_totals(counters, histograms, snapshot)
+
+        def encode(series):
+            return [[name, dict(labels), value] for (name, labels), value in series.items()]
+        retired = {'pid': 0, 'counters': encode(counters), 'gauges': [], 'histograms': encode(histograms)}
+        try:
+            with open(path + '.tmp', 'w') as f:
+                json.dump(retired, f)
+            os.replace(path + '.tmp', path)
+            for name, _ in exited:
+                os.remove(os.path.join(self.directory, name))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not retire exited worker metrics: {str(e)}")
+        return retired
+
+    def collect(self):
+        """Merged series: {(name, label key): value} for counters, gauges and histograms"""
+        counters, gauges, histograms = {}, {}, {}
+        for snapshot in self._snapshots():
+            _merge_totals(counters, histograms, snapshot)
+            if snapshot['pid'] != os.getpid() and not _process_alive(snapshot['pid']):
+                continue  # A dead worker's in-flight requests are gone
+            for name, labels, value in snapshot['gauges']:
+                key = (name, _label_key(labels))
+                definition = METRIC_DEFINITIONS.get(name, ())
+                if key not in gauges:
+                    gauges[key] = value
+                elif len(definition) > 2 and definition[2] == 'max':
+                    gauges[key] = max(gauges[key], value)
+                else:
+                    gauges[key] += value
+
+        # Hit ratios only make sense over the merged counts
+        for (name, labels), hits in list(counters.items()):
+            if name == 'fakenews_cache_hits_total':
+                lookups = hits + counters.get(('fakenews_cache_misses_total', labels), 0)
+                gauges[('fakenews_cache_hit_ratio', labels)] = hits / lookups if lookups else 0.0
+        return counters, gauges, histograms
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)"""
+        counters, gauges, histograms = self.collect()
+        series_by_name = {}
+        for series in (counters, gauges, histograms):
+            for (name, labels), value in series.items():
+                series_by_name.setdefault(name, []).append((labels, value))
+
+        lines = []
+        for name in sorted(series_by_name):
+            metric_type, help_text = METRIC_DEFINITIONS.get(name, ('untyped', name))[:2]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in sorted(series_by_name[name]):
+                if metric_type != 'histogram':
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), value[:-1]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', str(bound)),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-1])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return '\n'.join(lines) + '\n'
+
+def _merge_totals(counters, histograms, snapshot):
+    """Add a snapshot's counters and histogram buckets into the running totals"""
+    for name, labels, value in snapshot['counters']:
+        key = (name, _label_key(labels))
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, values in snapshot['histograms']:
+        key = (name, _label_key(labels))
+        merged = histograms.setdefault(key, [0] * len(values))
+        for index, value in enumerate(values):
+            merged[index] += value
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+metrics = Metrics(METRICS_DIR, METRICS_FLUSH_INTERVAL)
+
+# Per-request tracing: analyses asked for "timings" record a span for every stage
+# and provider call. The trace travels in a ContextVar that the stage and claim
+# pools copy into their threads. "profile" also samples the stacks of every thread
+# working on the request and writes them as folded stacks (flamegraph.pl, speedscope).
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ["1", "true", "yes", "on"]
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+
+current_trace = contextvars.ContextVar('current_trace', default=None)
+current_span = contextvars.ContextVar('current_span', default=None)  # Parent id for new spans
+
+class RequestTrace:
+    """Timing spans of one analysis, recorded from every thread that works on it"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.lock = threading.Lock()
+        self.spans = []
+        self.active_threads = Counter()  # Thread ident -> spans open on that thread
+
+    def _elapsed_ms(self):
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        ident = threading.get_ident()
+        span = {
+            'name': name,
+            'parent': current_span.get(),
+            'thread': threading.current_thread().name,
+            'start_ms': self._elapsed_ms(),
+            'duration_ms': None  # Still None in the report if the span outlived the request
+        }
+        if attributes:
+            span['attributes'] = attributes
+        with self.lock:
+            span['id'] = len(self.spans)
+            self.spans.append(span)
+            self.active_threads[ident] += 1
+        token = current_span.set(span['id'])
+        try:
+            yield span
+        finally:
+            current_span.reset(token)
+            with self.lock:
+                span['duration_ms'] = round(self._elapsed_ms() - span['start_ms'], 3)
+                self.active_threads[ident] -= 1
+                if not self.active_threads[ident]:
+                    del self.active_threads[ident]
+
+    def threads(self):
+        """Idents of the threads currently inside one of this trace's spans"""
+        with self.lock:
+            return set(self.active_threads)
+
+    def report(self):
+        """The response's timings block: total, per-stage durations and every span by start time"""
+        with self.lock:
+            spans = sorted((dict(span) for span in self.spans), key=lambda span: span['start_ms'])
+        return {
+            'total_ms': self._elapsed_ms(),
+            'stages': {
+                span['name'].split(':', 1)[1]: span['duration_ms']
+                for span in spans if span['name'].startswith('stage:')
+            },
+            'spans': spans
+        }
+
+@contextmanager
+def trace_span(name, **attributes):
+    """A span in the current request's trace; a no-op for untraced requests"""
+    trace = current_trace.get()
+    if trace is None:
+        yield None
+        return
+    with trace.span(name, **attributes) as span:
+        yield span
+
+class SamplingProfiler:
+    """Samples the stacks of a trace's active threads into folded stack counts"""
+
+    def __init__(self, trace, interval):
+        self.trace = trace
+        self.interval = interval
+        self.stacks = Counter()  # "outer;...;inner" -> samples
+        self.samples = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True, name='request-profiler')
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for ident in self.trace.threads():
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.stacks[';'.join(reversed(stack))] += 1
+                self.samples += 1
+
+    def dump(self, directory):
+        """Write the folded stacks to a new file; returns the profile summary for the response"""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"analysis-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}.folded")
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        # Hot spots: the functions that were running (innermost frame) most often
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return {
+            'path': path,
+            'format': 'folded',
+            'samples': self.samples,
+            'interval_ms': self.interval * 1000,
+            'hot_spots': [
+                {'function': function, 'samples': count, 'share': round(count / self.samples, 4)}
+                for function, count in leaves.most_common(10)
+            ]
+        }
+
+@contextmanager
+def timed_stage(stage):
+    """Record the enclosed block in the per-stage latency histogram and the request's trace"""
+    started = time.perf_counter()
+    try:
+        with trace_span(f"stage:{stage}"):
+            yield
+    finally:
+        metrics.observe('fakenews_stage_duration_seconds', time.perf_counter() - started, {'stage': stage})
+
+class ProviderCall:
+    """Handle yielded by provider_call(); mark_failed() counts a call that returned an error"""
+
+    def __init__(self):
+        self.failed = False
+
+    def mark_failed(self):
+        self.failed = True
+
+@contextmanager
+def provider_call(provider):
+    """Count and time one call to an external provider; exceptions count as errors"""
+    call = ProviderCall()
+    started = time.perf_counter()
+    try:
+        with trace_span(f"provider:{provider}") as span:
+            try:
+                yield call
+            except Exception:
+                call.mark_failed()
+                raise
+            finally:
+                if span is not None and call.failed:
+                    span['error'] = True
+    finally:
+        labels = {'provider': provider}
+        metrics.inc('fakenews_provider_requests_total', labels)
+        if call.failed:
+            metrics.inc('fakenews_provider_errors_total', labels)
+        metrics.observe('fakenews_provider_request_duration_seconds', time.perf_counter() - started, labels)
+
+# Outbound HTTP: one pooled keep-alive session per process for every provider and
+# article fetch. Timeouts are (connect, read); call sites pass their read budget.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "20"))  # Hosts kept in the pool
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))  # Idle connections kept per host
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+SERPAPI_ENDPOINT = f"{SERPAPI_BASE_URL}/search.json"
+
+class HTTPClient:
+    """Process-wide pooled requests.Session (rebuilt after fork so workers never share sockets)"""
+
+    def __init__(self, pool_connections, pool_maxsize, connect_timeout, read_timeout):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.lock = threading.Lock()
+        self.session = None
+        self.session_pid = None
+        self.requests = 0
+        self.errors = 0
+
+    def _session(self):
+        """Open (or re-open after fork) this process's session"""
+        with self.lock:
+            if self.session is None or self.session_pid != os.getpid():
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.session = session
+                self.session_pid = os.getpid()
+                self.requests = 0
+                self.errors = 0
+            self.requests += 1
+            return self.session
+
+    def _timeout(self, timeout):
+        """A bare number is the read timeout; the connect timeout is always bounded"""
+        if timeout is None:
+            return (self.connect_timeout, self.read_timeout)
+        if isinstance(timeout, tuple):
+            return timeout
+        return (min(self.connect_timeout, timeout), timeout)
+
+    def request(self, method, url, timeout=None, provider=None, **kwargs):
+        """Send a request; with provider set it is counted and timed in that provider's metrics"""
+        if provider is None:
+            return self._send(method, url, timeout, **kwargs)
+        with provider_call(provider) as call:
+            response = self._send(method, url, timeout, **kwargs)
+            if response.status_code >= 400:
+                call.mark_failed()
+            return response
+
+    def _send(self, method, url, timeout, **kwargs):
+        session = self._session()
+        try:
+            return session.request(method, url, timeout=self._timeout(timeout), **kwargs)
+        except requests.RequestException:
+            with self.lock:
+                self.errors += 1
+            raise
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def stats(self):
+        """Request count and how many of them reused a pooled connection"""
+        with self.lock:
+            if self.session is None or self.session_pid != os.getpid():
+                return {'requests': 0, 'errors': 0, 'connections_opened': 0, 'reuse_ratio': None}
+            connections = 0
+            for adapter in set(self.session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        connections += pool.num_connections
+            requests_made = self.requests
+            return {
+                'requests': requests_made,
+                'errors': self.errors,
+                'connections_opened': connections,
+                'reuse_ratio': round(1 - connections / requests_made, 4) if requests_made else None
+            }
+
+http_client = HTTPClient(HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+# Cache configuration: "memory" keeps entries per process, "sqlite" stores them on
+# disk so they survive restarts and are shared by all workers on the host
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "cache.sqlite3")
+VERIFICATION_CACHE_TTL = int(os.getenv("VERIFICATION_CACHE_TTL", "21600"))
+VERIFICATION_CACHE_MAX_BYTES = int(os.getenv("VERIFICATION_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "3600"))
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+
+# Extracted articles keyed by canonical URL: reused without a request for
+# ARTICLE_REVALIDATE_AFTER seconds, then revalidated with a conditional GET
+ARTICLE_CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", "604800"))
+ARTICLE_CACHE_MAX_BYTES = int(os.getenv("ARTICLE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+ARTICLE_REVALIDATE_AFTER = int(os.getenv("ARTICLE_REVALIDATE_AFTER", "300"))
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(5 * 1024 * 1024)))  # Larger pages are truncated
+
+# Bulk URL extraction (/api/extract/bulk, bulk_extract.py): BULK_EXTRACT_WORKERS caps
+# concurrent downloads per process, BULK_PER_DOMAIN and BULK_DOMAIN_DELAY keep each site polite
+MAX_BULK_URLS = int(os.getenv("MAX_BULK_URLS", "500"))
+BULK_EXTRACT_WORKERS = int(os.getenv("BULK_EXTRACT_WORKERS", "16"))
+BULK_PER_DOMAIN = int(os.getenv("BULK_PER_DOMAIN", "2"))  # Concurrent downloads per domain
+BULK_DOMAIN_DELAY = float(os.getenv("BULK_DOMAIN_DELAY", "0.5"))  # Seconds between request starts per domain
+BULK_RETRIES = int(os.getenv("BULK_RETRIES", "2"))
+BULK_RETRY_BACKOFF = float(os.getenv("BULK_RETRY_BACKOFF", "1.0"))  # Doubles after every attempt
+BULK_SCORE_BATCH_SIZE = int(os.getenv("BULK_SCORE_BATCH_SIZE", "32"))
+bulk_executor = ThreadPoolExecutor(max_workers=BULK_EXTRACT_WORKERS, thread_name_prefix='bulk-extract')
+
+# Whole-response cache for /api/analyze: fresh for RESPONSE_CACHE_TTL seconds, then
+# served stale (while revalidating in the background) for RESPONSE_CACHE_STALE_TTL more
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() in ["1", "true", "yes", "on"]
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "600"))
+RESPONSE_CACHE_STALE_TTL = int(os.getenv("RESPONSE_CACHE_STALE_TTL", "3600"))
+# Responses with a stage that fell back or failed are kept this long, never served stale (0 = not cached)
+RESPONSE_CACHE_DEGRADED_TTL = int(os.getenv("RESPONSE_CACHE_DEGRADED_TTL", "60"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Asynchronous analysis jobs (/api/jobs): persisted in SQLite, run on a local worker pool
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", "jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", "86400"))  # Seconds finished jobs stay queryable
+JOB_CALLBACK_TIMEOUT = float(os.getenv("JOB_CALLBACK_TIMEOUT", "10"))
+# Comma-separated hosts callbacks may target (subdomains included); when empty, any host
+# resolving only to public addresses is accepted
+JOB_CALLBACK_ALLOWED_HOSTS = [host.strip().lower() for host in os.getenv("JOB_CALLBACK_ALLOWED_HOSTS", "").split(',')
+                              if host.strip()]
+job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='analysis-job')
+
+def _cache_entry_size(value):
+    """Approximate size of a cached value in bytes (its JSON encoding)"""
+    return len(json.dumps(value, default=str).encode('utf-8'))
+
+class MemoryCache:
+    """In-process LRU cache with per-entry TTL and a size limit in bytes"""
+
+    def __init__(self, name, max_bytes, default_ttl):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.entries = OrderedDict()  # key -> (value, size, expires_at)
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[2] <= time.time():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value, ttl=None):
+        size = _cache_entry_size(value)
+        if size > self.max_bytes:
+            return
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, size, expires_at)
+            self.total_bytes += size
+            # Evict least recently used entries until we are back under budget
+            while self.total_bytes > self.max_bytes:
+                oldest_key = next(iter(self.entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.total_bytes -= size
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory',
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+class SQLiteCache:
+    """On-disk LRU cache with per-entry TTL, shared by every process using the same file"""
+
+    def __init__(self, name, path, max_bytes, default_ttl):
+        self.name = name
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.lock = threading.Lock()
+        self.connection = None
+        self.connection_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self):
+        """Open (or re-open after fork) this process's connection"""
+        if self.connection is None or self.connection_pid != os.getpid():
+            self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache_entries ('
+                'namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                'size INTEGER NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL, '
+                'PRIMARY KEY (namespace, key))'
+            )
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS cache_entries_lru ON cache_entries (namespace, last_access)'
+            )
+            self.connection.commit()
+            self.connection_pid = os.getpid()
+        return self.connection
+
+    def get(self, key, default=None):
+        try:
+            with self.lock:
+                connection = self._connect()
+                row = connection.execute(
+                    'SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?',
+                    (self.name, key)
+                ).fetchone()
+                now = time.time()
+                if row is None or row[1] <= now:
+                    if row is not None:
+                        connection.execute('DELETE FROM cache_entries WHERE namespace = ? AND key = ?', (self.name, key))
+                        connection.commit()
+                    self.misses += 1
+                    return default
+                connection.execute(
+                    'UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?',
+                    (now, self.name, key)
+                )
+                connection.commit()
+                self.hits += 1
+            return json.loads(row[0])
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache '{self.name}' read failed: {str(e)}")
+            return default
+
+    def set(self, key, value, ttl=None):
+        encoded = json.dumps(value, default=str)
+        size = len(encoded.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        try:
+            with self.lock:
+                connection = self._connect()
+                connection.execute(
+                    'INSERT OR REPLACE INTO cache_entries (namespace, key, value, size, expires_at, last_access) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (self.name, key, encoded, size, expires_at, now)
+                )
+                self._enforce_budget(connection, now)
+                connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache '{self.name}' write failed: {str(e)}")
+
+    def _enforce_budget(self, connection, now):
+        """Drop expired entries, then least recently used ones until under max_bytes"""
+        connection.execute('DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?', (self.name, now))
+        total = connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?', (self.name,)
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = connection.execute(
+            'SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY last_access', (self.name,)
+        )
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((self.name, key))
+            total -= size
+        connection.executemany('DELETE FROM cache_entries WHERE namespace = ? AND key = ?', evicted)
+        self.evictions += len(evicted)
+
+    def delete(self, key):
+        try:
+            with self.lock:
+                connection = self._connect()
+                connection.execute('DELETE FROM cache_entries WHERE namespace = ? AND key = ?', (self.name, key))
+                connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache '{self.name}' delete failed: {str(e)}")
+
+    def clear(self):
+        try:
+            with self.lock:
+                connection = self._connect()
+                connection.execute('DELETE FROM cache_entries WHERE namespace = ?', (self.name,))
+                connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Cache '{self.name}' clear failed: {str(e)}")
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        stats = {
+            'backend': 'sqlite',
+            'path': self.path,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
+        try:
+            with self.lock:
+                entries, total = self._connect().execute(
+                    'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?', (self.name,)
+                ).fetchone()
+            stats.update({'entries': entries, 'bytes': total})
+        except sqlite3.Error:
+            pass
+        return stats
+
+# Every cache created through create_cache(), for health/metrics reporting
+caches = {}
+
+def create_cache(name, max_bytes, default_ttl):
+    """Create a named cache on the configured backend"""
+    if CACHE_BACKEND == 'sqlite':
+        cache = SQLiteCache(name, CACHE_DB_PATH, max_bytes, default_ttl)
+    else:
+        cache = MemoryCache(name, max_bytes, default_ttl)
+    caches[name] = cache
+    return cache
+
+class ResponseCache:
+    """Memoizes whole analysis responses with stale-while-revalidate and request coalescing"""
+
+    def __init__(self, cache, ttl, stale_ttl, degraded_ttl=0):
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.degraded_ttl = min(degraded_ttl, ttl)  # Expires while still fresh, so it is never served stale
+        self.in_flight = {}  # key -> Future shared by every concurrent identical request
+        self.lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """Return (response, cache_status) where cache_status is HIT, STALE, MISS or COALESCED"""
+        entry = self.cache.get(key)
+        if entry is not None:
+            if time.time() - entry['stored_at'] < self.ttl:
+                return entry['response'], 'HIT'
+            # Serve the stale copy now and refresh it in the background (once)
+            future, owner = self._claim(key)
+            if owner:
+                threading.Thread(target=self._fill, args=(key, compute, future, True), daemon=True).start()
+            return entry['response'], 'STALE'
+
+        future, owner = self._claim(key)
+        if owner:
+            self._fill(key, compute, future)
+            return future.result(), 'MISS'
+        return future.result(), 'COALESCED'
+
+    def get_fresh(self, key):
+        """Return the cached response if it is still within its TTL, else None"""
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry['stored_at'] < self.ttl:
+            return entry['response']
+        return None
+
+    def store(self, key, response):
+        """Cache a response computed outside get_or_compute (e.g. by the streaming endpoint)
+
+        Degraded responses (a stage fell back or failed) only live for degraded_ttl,
+        so a provider outage doesn't pin fallback results for the whole stale window."""
+        ttl = self.ttl + self.stale_ttl
+        if response.get('degraded_stages'):
+            if self.degraded_ttl <= 0:
+                return
+            ttl = self.degraded_ttl
+        self.cache.set(key, {'stored_at': time.time(), 'response': response}, ttl=ttl)
+
+    def _claim(self, key):
+        """Return the in-flight future for key and whether the caller must compute it"""
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self.in_flight[key] = future
+            return future, True
+
+    def _fill(self, key, compute, future, background=False):
+        try:
+            response = compute()
+            self.store(key, response)
+            future.set_result(response)
+        except Exception as e:
+            # Failures are shared with coalesced waiters but never cached
+            if background:
+                # Nobody reads a stale refresh's future, so this is the only trace of the failure
+                logger.error(f"Response cache refresh failed: {str(e)}")
+            future.set_exception(e)
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+
+TRACKING_QUERY_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+def canonicalize_url(url):
+    """Canonical form of a URL so trivially different links share cache entries"""
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'http').lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = parsed.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not name.lower().startswith(TRACKING_QUERY_PARAMS)
+    ))
+    return urlunparse((scheme, netloc, path, '', query, ''))
+
+def response_cache_key(text, url, enable_ai, find_sources, enable_real_time_check):
+    """Hash of the normalized input (canonical URL wins over text) plus the analysis flags"""
+    if url:
+        basis = 'url:' + canonicalize_url(url)
+    else:
+        basis = 'text:' + ' '.join(text.split())
+    flags = f"ai={bool(enable_ai)};sources={bool(find_sources)};real_time={bool(enable_real_time_check)}"
+    return hashlib.sha256(f"{basis}|{flags}".encode('utf-8')).hexdigest()
+
 # Helper function to check if API key is configured (not default placeholder)
 def is_api_key_configured(api_key, default_placeholder="YOUR_"):
     """Check if an API key is properly configured (not a placeholder)"""
@@ -118,18 +1150,316 @@ def is_api_key_configured(api_key, default_placeholder="YOUR_"):
         return False  # Demo keys are not real API keys
     return True
 
-# Initialize Gemini AI
-if GEMINI_AVAILABLE and is_api_key_configured(GEMINI_API_KEY):
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        logger.info("✅ Gemini AI configured successfully")
-    except Exception as e:
-        logger.error(f"❌ Failed to configure Gemini AI: {str(e)}")
-else:
-    if not GEMINI_AVAILABLE:
-        logger.warning("⚠️ Gemini AI package not available")
+def gemini_client_options(api_key):
+    """genai.configure() arguments: a GEMINI_BASE_URL switches to REST against that endpoint"""
+    options = {'api_key': api_key}
+    if GEMINI_BASE_URL:
+        options.update(transport='rest', client_options={'api_endpoint': GEMINI_BASE_URL})
+    return options
+
+def configure_gemini():
+    """Initialize Gemini AI (per process, after fork)"""
+    if GEMINI_AVAILABLE and is_api_key_configured(GEMINI_API_KEY):
+        try:
+            genai.configure(**gemini_client_options(GEMINI_API_KEY))
+            logger.info("✅ Gemini AI configured successfully")
+        except Exception as e:
+            logger.error(f"❌ Failed to configure Gemini AI: {str(e)}")
     else:
-        logger.warning("⚠️ Gemini AI API key not configured or using demo key")
+        if not GEMINI_AVAILABLE:
+            logger.warning("⚠️ Gemini AI package not available")
+        else:
+            logger.warning("⚠️ Gemini AI API key not configured or using demo key")
+
+# Claim extraction: the text is split into sentences once, then each rule is a chain of
+# precompiled trigger patterns found with successive forward searches inside a sentence.
+# Nothing can backtrack across the article, so cost grows linearly with text size.
+CLAIM_WHITESPACE_PATTERN = re.compile(r'\s+')
+CLAIM_SUBJECT_BREAK_PATTERN = re.compile(r'[^a-zA-Z\s]', re.IGNORECASE)
+CLAIM_NUMBER_PATTERN = re.compile(r'\d+')
+
+# Claim leads, as in the old patterns (which ran with re.IGNORECASE, so any letter counts)
+CLAIM_NAME_PATTERN = re.compile(r'[A-Z][a-z]+ [A-Z][a-z]+', re.IGNORECASE)
+CLAIM_WORD_PATTERN = re.compile(r'[A-Z][a-z]+', re.IGNORECASE)
+CLAIM_PLACE_PATTERN = re.compile(r'\b(?:in|at)\s+[A-Z](?P<run>[a-zA-Z\s]+)', re.IGNORECASE)
+CLAIM_NAMED_PLACE_PATTERN = re.compile(r'\b(?:in|at) [A-Z][a-z]+', re.IGNORECASE)
+
+def _claim_triggers(*alternatives):
+    """Compile one case-insensitive, word-bounded alternation per trigger step"""
+    return [re.compile(r'\b(?:' + step + r')\b', re.IGNORECASE) for step in alternatives]
+
+class ClaimExtractor:
+    """Sentence-level claim extractor built from ordered trigger rules
+
+    Each rule is (start, triggers): the triggers must occur in order within a
+    sentence, and the claim runs from its start to the end of the earliest
+    possible last trigger. start is 'anchor' (the first trigger itself),
+    'subject' (the letter/space run leading into the first trigger, extended
+    to the run's last first trigger that still completes the chain, as the
+    old greedy [A-Z][a-zA-Z\\s]+ prefix did) or a lead pattern whose first
+    match must precede the first trigger."""
+
+    def __init__(self, rules, keywords, claim_length=(10, 200), keyword_sentence_length=(20, None),
+                 span_lines=True, normalize_whitespace=True):
+        self.rules = rules
+        self.keyword_pattern = re.compile('|'.join(map(re.escape, keywords)))
+        self.min_claim_length, self.max_claim_length = claim_length
+        self.min_sentence_length, self.max_sentence_length = keyword_sentence_length
+        # span_lines: claims may run across line breaks (the old pattern ran with re.DOTALL)
+        self.span_lines = span_lines
+        self.normalize_whitespace = normalize_whitespace
+
+    def extract(self, text):
+        """Rule matches first (in rule order, as before), then keyword sentences"""
+        sentences = AnalysisDocument.of(text).sentences
+        if self.span_lines:
+            segments = sentences
+        else:
+            segments = [line for sentence in sentences for line in sentence.split('\n')]
+
+        claims = []
+        for start, triggers in self.rules:
+            for segment in segments:
+                for claim in self._match_rule(segment, start, triggers):
+                    claim = claim.strip()
+                    if self.normalize_whitespace:
+                        claim = CLAIM_WHITESPACE_PATTERN.sub(' ', claim)
+                    if self.min_claim_length < len(claim) and (
+                            self.max_claim_length is None or len(claim) < self.max_claim_length):
+                        claims.append(claim)
+
+        # Also extract sentences with high-confidence keywords
+        for sentence in sentences:
+            if len(sentence) <= self.min_sentence_length:
+                continue
+            if self.max_sentence_length is not None and len(sentence) >= self.max_sentence_length:
+                continue
+            if self.keyword_pattern.search(sentence.lower()):
+                claims.append(sentence)
+        return claims
+
+    @staticmethod
+    def _match_chain(sentence, position, triggers):
+        """End of the earliest in-order match of every trigger from position, or None"""
+        for trigger in triggers:
+            match = trigger.search(sentence, position)
+            if not match:
+                return None
+            position = match.end()
+        return position
+
+    def _match_rule(self, sentence, start, triggers):
+        """Yield every non-overlapping match of one rule in a sentence
+
+        Whenever the chain cannot be completed the rule stops: any later start
+        only sees a suffix of the same tail."""
+        position = 0
+        subject_breaks = None
+        while position < len(sentence):
+            if start == 'subject':
+                if subject_breaks is None:
+                    subject_breaks = [m.start() for m in CLAIM_SUBJECT_BREAK_PATTERN.finditer(sentence)]
+                span = self._match_subject(sentence, position, triggers, subject_breaks)
+                if span is None:
+                    return
+                begin, end = span
+            elif start == 'anchor':
+                first = triggers[0].search(sentence, position)
+                if not first:
+                    return
+                begin = first.start()
+                end = self._match_chain(sentence, first.end(), triggers[1:])
+            else:
+                lead = start.search(sentence, position)
+                if not lead:
+                    return
+                begin = lead.start()
+                end = self._match_chain(sentence, lead.end(), triggers)
+                if end is None and 'run' in start.groupindex:
+                    # The lead's greedy run gives characters back, as the old pattern backtracked
+                    first = triggers[0].search(sentence, lead.start('run'), lead.end() + 1)
+                    end = self._last_completion(sentence, first, lead.end(), triggers)
+            if end is None:
+                return
+            yield sentence[begin:end]
+            position = end
+
+    def _match_subject(self, sentence, position, triggers, subject_breaks):
+        """(start, end) of the next subject-led match at or after position, or None"""
+        # The earliest first trigger with a subject (a letter in its run) in front of it
+        search_from = position
+        while True:
+            first = triggers[0].search(sentence, search_from)
+            if not first:
+                return None
+            index = bisect.bisect_left(subject_breaks, first.start())
+            subject_start = max(position, subject_breaks[index - 1] + 1 if index else 0)
+            subject = sentence[subject_start:first.start()]
+            if subject.strip():
+                break
+            search_from = first.start() + 1
+
+        # The old greedy subject ran on to the last first trigger in its run
+        run_end = subject_breaks[index] if index < len(subject_breaks) else len(sentence)
+        end = self._last_completion(sentence, first, run_end, triggers)
+        if end is None:
+            return None
+        return subject_start + len(subject) - len(subject.lstrip()), end
+
+    def _last_completion(self, sentence, first, run_end, triggers):
+        """Chain end from the last first trigger before run_end that completes the chain
+
+        first is the earliest first trigger match (or None); None is returned when
+        it cannot complete the chain, as no later one can. Completion is monotonic
+        in the first trigger's end, so the later candidates are bisected."""
+        if first is None or self._match_chain(sentence, first.end(), triggers[1:]) is None:
+            return None
+        candidates = [first]
+        while True:
+            # endpos one past the run keeps the trailing \b honest
+            match = triggers[0].search(sentence, candidates[-1].start() + 1, run_end + 1)
+            if not match:
+                break
+            candidates.append(match)
+        low, high = 0, len(candidates) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._match_chain(sentence, candidates[middle].end(), triggers[1:]) is None:
+                high = middle - 1
+            else:
+                low = middle
+        return self._match_chain(sentence, candidates[low].end(), triggers[1:])
+
+# Real-time checker: specific, verifiable claims worth a search-engine lookup
+VERIFIABLE_CLAIM_EXTRACTOR = ClaimExtractor(
+    rules=[
+        # Death/Life status claims
+        ('subject', _claim_triggers(r'is dead|died|passed away|was killed|is alive|is living')),
+        # Current positions/titles
+        ('subject', _claim_triggers(r'is the|is a|serves as|became',
+                                    r'Prime Minister|President|CEO|Minister|Chief|Director|Leader')),
+        # Recent events with dates
+        ('anchor', _claim_triggers(r'yesterday|today|last week|this month|recently',
+                                   r'announced|declared|happened|occurred|died|was elected')),
+        # Specific numbers and statistics
+        ('anchor', _claim_triggers(r'killed|affected|saved|earned|lost|spent') + [CLAIM_NUMBER_PATTERN] +
+                   _claim_triggers(r'people|dollars|lives|years')),
+        # Company/Organization events ("Inc." and "Ltd." end a sentence, so only the
+        # spelled-out forms can lead into a trigger within one)
+        ('subject', _claim_triggers(r'Company|Corporation', r'announced|reported|filed|launched')),
+        # Location-based events
+        (CLAIM_PLACE_PATTERN, _claim_triggers(r'earthquake|fire|explosion|attack|election|protest')),
+        # Age and biographical facts
+        ('subject', _claim_triggers(r'age|aged|years old|born in') + [CLAIM_NUMBER_PATTERN]),
+        # Scientific/Medical claims
+        ('anchor', _claim_triggers(r'scientists|researchers|doctors|studies',
+                                   r'discovered|found|proved|showed|revealed')),
+    ],
+    keywords=[
+        'prime minister', 'president', 'died', 'killed', 'announced', 'elected',
+        'discovered', 'research shows', 'study found', 'experts say', 'according to'
+    ],
+    claim_length=(10, 200),
+    keyword_sentence_length=(20, 150)
+)
+
+# Legacy fact verification: broader factual claims for the Gemini-only check
+FACTUAL_CLAIM_EXTRACTOR = ClaimExtractor(
+    rules=[
+        # Death claims
+        (CLAIM_NAME_PATTERN, _claim_triggers(r'is dead|died|passed away|killed', r'yesterday|today|ago|recently')),
+        # Position/Title claims
+        (CLAIM_NAME_PATTERN, _claim_triggers(r'is|was|became', r'Prime Minister|President|CEO|Minister|Chief')),
+        # Number/Statistics claims
+        ('anchor', _claim_triggers(r'killed|murdered|saved|affected') + [CLAIM_NUMBER_PATTERN] +
+                   _claim_triggers(r'people|persons|individuals')),
+        # Recent events
+        ('anchor', _claim_triggers(r'just|recently|yesterday|today|last week',
+                                   r'happened|occurred|announced|declared')),
+        # Company/Organization claims
+        (CLAIM_WORD_PATTERN, _claim_triggers(r'company|corporation|organization', r'announced|declared|reported')),
+        # Scientific/Medical claims
+        ('anchor', _claim_triggers(r'scientists|researchers|doctors', r'discovered|found|proved|showed')),
+        # Geographic/Political events
+        ('anchor', [CLAIM_NAMED_PLACE_PATTERN] + _claim_triggers(r'election|war|conflict|disaster|earthquake')),
+    ],
+    keywords=[
+        'prime minister', 'president', 'died', 'killed', 'murdered',
+        'announced', 'declared', 'discovered', 'proved', 'election',
+        'war', 'disaster', 'company', 'billion', 'million'
+    ],
+    claim_length=(10, None),
+    keyword_sentence_length=(20, None),
+    # The old patterns ran without re.DOTALL and kept claims as matched
+    span_lines=False,
+    normalize_whitespace=False
+)
+
+class ClaimDeduplicator:
+    """Greedy near-duplicate filter: a claim is dropped when its word-set Jaccard
+    similarity with an already kept claim exceeds the threshold
+
+    Each claim gets a MinHash signature once; LSH banding (bands x rows) turns it
+    into bucket keys, so only kept claims sharing a bucket are compared exactly.
+    With 20 bands of 5 rows, a pair at similarity 0.8 shares a bucket with
+    probability ~0.9997, and higher similarities are even safer."""
+
+    MERSENNE_PRIME = (1 << 31) - 1
+
+    def __init__(self, threshold=0.8, bands=20, rows=5, seed=1):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.RandomState(seed)
+        num_perm = bands * rows
+        # (a*h + b) mod p with a, b, h < p = 2**31 - 1 never overflows uint64
+        self.perm_a = rng.randint(1, self.MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+        self.perm_b = rng.randint(0, self.MERSENNE_PRIME, size=(num_perm, 1)).astype(np.uint64)
+
+    def signature(self, words):
+        """MinHash signature of a non-empty word set"""
+        hashes = np.fromiter(
+            (zlib.crc32(word.encode('utf-8')) % self.MERSENNE_PRIME for word in words),
+            dtype=np.uint64, count=len(words)
+        )
+        return ((self.perm_a * hashes + self.perm_b) % np.uint64(self.MERSENNE_PRIME)).min(axis=1)
+
+    def deduplicate(self, claims, limit=None):
+        """Keep claims in order, skipping near-duplicates of earlier kept ones"""
+        kept = []
+        kept_words = []
+        buckets = {}
+        for claim in claims:
+            words = set(claim.lower().split())
+            if not words:
+                # Empty claims have similarity 0 with everything, as before
+                kept.append(claim)
+                kept_words.append(words)
+            else:
+                signature = self.signature(words)
+                keys = [
+                    (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+                    for band in range(self.bands)
+                ]
+                candidates = {index for key in keys for index in buckets.get(key, ())}
+                if any(self._jaccard(words, kept_words[index]) > self.threshold for index in candidates):
+                    continue
+                for key in keys:
+                    buckets.setdefault(key, []).append(len(kept))
+                kept.append(claim)
+                kept_words.append(words)
+            if limit is not None and len(kept) >= limit:
+                # Later claims are only compared against earlier ones, so nothing above changes
+                break
+        return kept
+
+    @staticmethod
+    def _jaccard(words1, words2):
+        if not words1 or not words2:
+            return 0
+        return len(words1 & words2) / len(words1 | words2)
+
+CLAIM_DEDUPLICATOR = ClaimDeduplicator(threshold=0.8)
 
 class RealTimeFactChecker:
     """Enhanced real-time fact checker using Google Search API and Gemini AI"""
@@ -140,7 +1470,9 @@ class RealTimeFactChecker:
         self.google_api_key = google_api_key
         self.google_cse_id = google_cse_id
         self.gemini_model = None
-        self.cache = {}
+        self.cache = create_cache('verifications', VERIFICATION_CACHE_MAX_BYTES, VERIFICATION_CACHE_TTL)
+        # Raw search-engine responses, keyed by normalized query so different claims share them
+        self.search_cache = create_cache('search_results', SEARCH_CACHE_MAX_BYTES, SEARCH_CACHE_TTL)
         
         # Initialize Gemini
         if gemini_api_key and is_api_key_configured(gemini_api_key):
@@ -152,38 +1484,37 @@ class RealTimeFactChecker:
         else:
             logger.info("ℹ️ Real-time fact checker running without Gemini AI (demo/test mode)")
     
-    def comprehensive_fact_check(self, text, url=None):
-        """Perform comprehensive fact-checking with real-time verification"""
+    def comprehensive_fact_check(self, text, url=None, on_claim_verified=None):
+        """Perform comprehensive fact-checking with real-time verification
+
+        on_claim_verified(index, total, claim, verification) is called as each claim finishes."""
         try:
             logger.info("🔍 Starting comprehensive fact-checking process...")
             
             # Step 1: Extract factual claims
-            claims = self._extract_verifiable_claims(text)
+            with trace_span('claims.extract'):
+                claims = self._extract_verifiable_claims(text)
             logger.info(f"📋 Extracted {len(claims)} verifiable claims")
             
-            # Step 2: Search and verify each claim
-            verification_results = []
-            for i, claim in enumerate(claims[:5]):  # Limit to 5 claims to avoid API limits
-                logger.info(f"🔍 Verifying claim {i+1}/{min(len(claims), 5)}: {claim[:100]}...")
-                
-                # Check cache first
-                cache_key = hashlib.md5(claim.encode()).hexdigest()[:16]
-                if cache_key in self.cache:
-                    verification_results.append(self.cache[cache_key])
-                    continue
-                
-                # Get search results
-                search_results = self._search_for_claim(claim)
-                
-                # Analyze with Gemini AI
-                verification = self._verify_with_gemini(claim, search_results)
-                verification_results.append(verification)
-                
-                # Cache result
-                self.cache[cache_key] = verification
-                
-                # Rate limiting
-                time.sleep(0.5)
+            # Step 2: Search and verify claims in parallel (limit to 5 claims to avoid API limits);
+            # provider rate limiters keep the combined request rate within quota
+            claims_to_verify = claims[:5]
+            total = len(claims_to_verify)
+            futures = [
+                claim_executor.submit(contextvars.copy_context().run, self._verify_claim, index, claim, total)
+                for index, claim in enumerate(claims_to_verify)
+            ]
+            # A failed claim (or callback) only affects that claim, never the others
+            indices = {future: index for index, future in enumerate(futures)}
+            verification_results = [None] * total
+            for future in as_completed(futures):
+                index = indices[future]
+                verification_results[index] = self._claim_result(future, claims_to_verify[index])
+                if on_claim_verified:
+                    try:
+                        on_claim_verified(index, total, claims_to_verify[index], verification_results[index])
+                    except Exception as e:
+                        logger.error(f"❌ Claim callback error: {str(e)}")
             
             # Step 3: Calculate overall credibility
             overall_score = self._calculate_credibility_score(verification_results)
@@ -206,92 +1537,105 @@ class RealTimeFactChecker:
                 'fallback_analysis': self._fallback_analysis(text)
             }
     
+    def _claim_result(self, future, claim):
+        """A claim's verification, or an INSUFFICIENT_INFO error verification if it raised"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"❌ Claim verification error: {str(e)}")
+            return {
+                'claim': claim,
+                'verification_status': 'INSUFFICIENT_INFO',
+                'confidence_score': 0.0,
+                'explanation': f'Verification failed: {str(e)}',
+                'current_facts': 'Requires manual verification',
+                'error': str(e)
+            }
+    
+    def _verify_claim(self, index, claim, total):
+        """Search for and verify a single claim, using the cache when possible"""
+        logger.info(f"🔍 Verifying claim {index+1}/{total}: {claim[:100]}...")
+        
+        with trace_span('claim', index=index, claim=claim[:100]) as span:
+            # Check cache first
+            cache_key = hashlib.md5(claim.encode()).hexdigest()[:16]
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if span is not None:
+                    span['attributes']['cached'] = True
+                return cached
+            
+            # Get search results
+            with trace_span('claim.search'):
+                search_results = self._search_for_claim(claim)
+            
+            # Analyze with Gemini AI
+            with trace_span('claim.verify'):
+                verification = self._verify_with_gemini(claim, search_results)
+            
+            # Cache result
+            self.cache.set(cache_key, verification)
+            return verification
+    
     def _extract_verifiable_claims(self, text):
         """Extract specific, verifiable factual claims from text"""
-        claims = []
-        
-        # Enhanced patterns for factual claims
-        patterns = [
-            # Death/Life status claims
-            r'([A-Z][a-zA-Z\s]+(?:is dead|died|passed away|was killed|is alive|is living).*?)',
-            # Current positions/titles
-            r'([A-Z][a-zA-Z\s]+(?:is the|is a|serves as|became).*?(?:Prime Minister|President|CEO|Minister|Chief|Director|Leader).*?)',
-            # Recent events with dates
-            r'((?:yesterday|today|last week|this month|recently).*?(?:announced|declared|happened|occurred|died|was elected).*?)',
-            # Specific numbers and statistics
-            r'((?:killed|affected|saved|earned|lost|spent).*?\d+.*?(?:people|dollars|lives|years).*?)',
-            # Company/Organization events
-            r'([A-Z][a-zA-Z\s]+(?:Company|Corporation|Inc\.|Ltd\.).*?(?:announced|reported|filed|launched).*?)',
-            # Location-based events
-            r'((?:in|at)\s+[A-Z][a-zA-Z\s]+.*?(?:earthquake|fire|explosion|attack|election|protest).*?)',
-            # Age and biographical facts
-            r'([A-Z][a-zA-Z\s]+(?:age|aged|years old|born in).*?\d+.*?)',
-            # Scientific/Medical claims
-            r'((?:scientists|researchers|doctors|studies).*?(?:discovered|found|proved|showed|revealed).*?)'
-        ]
+        claims = VERIFIABLE_CLAIM_EXTRACTOR.extract(text)
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                cleaned_claim = re.sub(r'\s+', ' ', match.strip())
-                if 10 < len(cleaned_claim) < 200:  # Reasonable length
-                    claims.append(cleaned_claim)
-        
-        # Also extract sentences with high-confidence keywords
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if 20 < len(sentence) < 150:  # Reasonable length
-                if any(keyword in sentence.lower() for keyword in [
-                    'prime minister', 'president', 'died', 'killed', 'announced', 'elected',
-                    'discovered', 'research shows', 'study found', 'experts say', 'according to'
-                ]):
-                    claims.append(sentence)
-        
-        # Remove duplicates and return top claims
-        unique_claims = []
-        for claim in claims:
-            if not any(self._similarity(claim, existing) > 0.8 for existing in unique_claims):
-                unique_claims.append(claim)
-        
-        return unique_claims[:10]  # Return top 10 claims
-    
-    def _similarity(self, text1, text2):
-        """Simple similarity check between two texts"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        if not words1 or not words2:
-            return 0
-        return len(words1.intersection(words2)) / len(words1.union(words2))
+        # Remove near-duplicates (word Jaccard > 0.8) and return top claims
+        return CLAIM_DEDUPLICATOR.deduplicate(claims, limit=10)  # Return top 10 claims
     
     def _search_for_claim(self, claim):
         """Search for information about the claim using available APIs"""
-        search_results = []
-        
         # Try SerpAPI first (most comprehensive)
-        if is_api_key_configured(self.serpapi_key) and SERPAPI_AVAILABLE:
-            search_results = self._search_with_serpapi(claim)
+        if is_api_key_configured(self.serpapi_key):
+            provider, search = 'serpapi', self._search_with_serpapi
         
         # Fallback to Google Custom Search API
         elif is_api_key_configured(self.google_api_key):
-            search_results = self._search_with_google_api(claim)
+            provider, search = 'google_cse', self._search_with_google_api
         
         # Fallback to basic web search simulation
         else:
-            search_results = self._simulate_search_results(claim)
+            return self._simulate_search_results(claim)
+        
+        # Near-identical claims reduce to the same query, so reuse earlier responses
+        query = self._create_search_query(claim)
+        cache_key = self._search_cache_key(provider, query)
+        if cache_key:
+            cached = self.search_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"🔍 Search cache hit for query: {query}")
+                return cached
+        
+        search_results = search(claim, query)
+        
+        # Only cache real answers; errors come back as empty lists
+        if cache_key and search_results:
+            self.search_cache.set(cache_key, search_results)
         
         return search_results
     
-    def _search_with_serpapi(self, claim):
+    def _search_cache_key(self, provider, query):
+        """Cache key for a search query (None for queries too empty to share)"""
+        normalized_query = ' '.join(query.lower().split())
+        if not normalized_query:
+            return None
+        return f"{provider}:{normalized_query}"
+    
+    def _search_with_serpapi(self, claim, query=None):
         """Search using SerpAPI"""
         try:
-            query = self._create_search_query(claim)
-            search = GoogleSearch({
+            query = query or self._create_search_query(claim)
+            acquire_rate_limit('serpapi')
+            response = http_client.get(SERPAPI_ENDPOINT, params={
+                "engine": "google",
                 "q": query,
                 "api_key": self.serpapi_key,
                 "num": 5
-            })
-            results = search.get_dict()
+            }, timeout=10, provider='serpapi')
+            results = response.json()
+            if "error" in results:
+                raise RuntimeError(results["error"])
             
             search_results = []
             if "organic_results" in results:
@@ -310,11 +1654,11 @@ class RealTimeFactChecker:
             logger.error(f"❌ SerpAPI search error: {str(e)}")
             return []
     
-    def _search_with_google_api(self, claim):
+    def _search_with_google_api(self, claim, query=None):
         """Search using Google Custom Search API"""
         try:
-            query = self._create_search_query(claim)
-            url = "https://www.googleapis.com/customsearch/v1"
+            query = query or self._create_search_query(claim)
+            url = f"{GOOGLE_CSE_BASE_URL}/customsearch/v1"
             params = {
                 'key': self.google_api_key,
                 'cx': self.google_cse_id,
@@ -322,7 +1666,8 @@ class RealTimeFactChecker:
                 'num': 5
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            acquire_rate_limit('google_cse')
+            response = http_client.get(url, params=params, timeout=10, provider='google_cse')
             data = response.json()
             
             search_results = []
@@ -420,7 +1765,9 @@ Important considerations:
 
 Provide your assessment:"""
 
-            response = self.gemini_model.generate_content(prompt)
+            acquire_rate_limit('gemini')
+            with provider_call('gemini'):
+                response = self.gemini_model.generate_content(prompt)
             return self._parse_gemini_verification(response.text, claim, search_results)
             
         except Exception as e:
@@ -673,11 +2020,12 @@ Provide your assessment:"""
     
     def _fallback_analysis(self, text):
         """Fallback analysis when API verification fails"""
+        document = AnalysisDocument.of(text)
         return {
             'type': 'fallback',
             'message': 'Real-time verification unavailable. Basic analysis performed.',
-            'word_count': len(text.split()),
-            'sentences': len(re.split(r'[.!?]+', text)),
+            'word_count': document.word_count,
+            'sentences': len(document.sentence_parts),
             'potential_claims': len(self._extract_verifiable_claims(text))
         }
 
@@ -716,11 +2064,13 @@ class AIAnalyzer:
                 6. related_topics: What to search for to verify this story
                 """
 
-                response = self.model.generate_content(prompt)
+                acquire_rate_limit('gemini')
+                with provider_call('gemini'):
+                    response = self.model.generate_content(prompt)
                 result['ai_analysis'] = self._parse_ai_response(response.text)
             except Exception as e:
                 logger.error(f"AI analysis error: {str(e)}")
-                result['ai_analysis'] = self._fallback_analysis(text)
+                result['ai_analysis'] = dict(self._fallback_analysis(text), error=str(e))
         else:
             result['ai_analysis'] = self._fallback_analysis(text)
 
@@ -748,8 +2098,7 @@ class AIAnalyzer:
 
     def _fallback_analysis(self, text):
         """Fallback analysis without AI"""
-        sentences = re.split(r'[.!?]+', text)
-        key_sentences = [s.strip() for s in sentences if len(s.strip()) > 20][:3]
+        key_sentences = [s for s in AnalysisDocument.of(text).sentences if len(s) > 20][:3]
 
         # Extract potential entities
         entities = re.findall(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b', text)[:5]
@@ -769,13 +2118,13 @@ class FactVerificationSystem:
     def __init__(self, gemini_api_key=None):
         self.gemini_api_key = gemini_api_key
         self.gemini_model = None
-        self.fact_check_cache = {}
+        self.fact_check_cache = create_cache('fact_checks', VERIFICATION_CACHE_MAX_BYTES, VERIFICATION_CACHE_TTL)
         
         # Initialize Gemini if API key is provided
         if gemini_api_key:
             try:
                 import google.generativeai as genai
-                genai.configure(api_key=gemini_api_key)
+                genai.configure(**gemini_client_options(gemini_api_key))
                 self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
                 logger.info("✅ Fact verification Gemini model initialized")
             except Exception as e:
@@ -796,8 +2145,9 @@ class FactVerificationSystem:
                 
                 # Check cache first
                 cache_key = hashlib.md5(claim.encode()).hexdigest()[:16]
-                if cache_key in self.fact_check_cache:
-                    verification_results.append(self.fact_check_cache[cache_key])
+                cached = self.fact_check_cache.get(cache_key)
+                if cached is not None:
+                    verification_results.append(cached)
                     continue
                 
                 # Verify using Google Search (simplified without API)
@@ -807,12 +2157,11 @@ class FactVerificationSystem:
                 if self.gemini_model:
                     ai_result = self._verify_with_gemini(claim, search_result)
                     verification_results.append(ai_result)
-                    self.fact_check_cache[cache_key] = ai_result
-                    self.fact_check_cache[cache_key] = ai_result
+                    self.fact_check_cache.set(cache_key, ai_result)
                 else:
                     # Use search-only verification
                     verification_results.append(search_result)
-                    self.fact_check_cache[cache_key] = search_result
+                    self.fact_check_cache.set(cache_key, search_result)
             
             return {
                 'claims_verified': len(claims),
@@ -831,45 +2180,11 @@ class FactVerificationSystem:
     
     def _extract_factual_claims(self, text):
         """Extract specific factual claims that can be verified"""
-        claims = []
-        
-        # Look for specific patterns that indicate factual claims
-        patterns = [
-            # Death claims
-            r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is dead|died|passed away|killed).*?(?:yesterday|today|ago|recently))',
-            # Position/Title claims  
-            r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is|was|became).*?(?:Prime Minister|President|CEO|Minister|Chief).*?)',
-            # Number/Statistics claims
-            r'((?:killed|murdered|saved|affected).*?\d+.*?(?:people|persons|individuals))',
-            # Recent events
-            r'((?:just|recently|yesterday|today|last week).*?(?:happened|occurred|announced|declared).*?)',
-            # Company/Organization claims
-            r'([A-Z][a-z]+.*?(?:company|corporation|organization).*?(?:announced|declared|reported).*?)',
-            # Scientific/Medical claims
-            r'((?:scientists|researchers|doctors).*?(?:discovered|found|proved|showed).*?)',
-            # Geographic/Political events
-            r'((?:in|at) [A-Z][a-z]+.*?(?:election|war|conflict|disaster|earthquake).*?)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) > 10:  # Only meaningful claims
-                    claims.append(match.strip())
-        
-        # Also extract sentences with specific keywords
-        sentences = re.split(r'[.!?]+', text)
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) > 20 and any(keyword in sentence.lower() for keyword in [
-                'prime minister', 'president', 'died', 'killed', 'murdered', 
-                'announced', 'declared', 'discovered', 'proved', 'election',
-                'war', 'disaster', 'company', 'billion', 'million'
-            ]):
-                claims.append(sentence)
+        claims = FACTUAL_CLAIM_EXTRACTOR.extract(text)
         
         # Remove duplicates and limit
-        unique_claims = list(set(claims))[:5]  # Max 5 claims to verify
+        # dict.fromkeys keeps extraction order, so the same text always yields the same claims
+        unique_claims = list(dict.fromkeys(claims))[:5]  # Max 5 claims to verify
         return unique_claims
     
     def _verify_with_search(self, claim):
@@ -933,7 +2248,9 @@ class FactVerificationSystem:
             FACTS: [Current accurate information as of August 2025]
             """
             
-            response = self.gemini_model.generate_content(prompt)
+            acquire_rate_limit('gemini')
+            with provider_call('gemini'):
+                response = self.gemini_model.generate_content(prompt)
             ai_text = response.text
             
             # Parse AI response
@@ -1163,7 +2480,8 @@ class NewsSourceFinder:
     def _extract_search_terms(self, text):
         """Extract key terms for news search"""
         # Remove common stop words and extract meaningful terms
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+        document = AnalysisDocument.of(text)
+        words = document.search_words
         
         # Common news-related stop words to exclude
         stop_words = {
@@ -1187,7 +2505,7 @@ class NewsSourceFinder:
         entities = []
         if SPACY_AVAILABLE and nlp:
             try:
-                doc = nlp(text[:500])  # Limit text for performance
+                doc = document.lead_doc  # Limit text for performance
                 for ent in doc.ents:
                     if ent.label_ in ['PERSON', 'ORG', 'GPE'] and len(ent.text) > 2:
                         entities.append(ent.text.lower())
@@ -1210,13 +2528,13 @@ class NewsSourceFinder:
             
             # Use Google News RSS feed approach (more reliable)
             encoded_query = '+'.join(query.replace('"', '').split())
-            search_url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en&gl=US&ceid=US:en"
+            search_url = f"{GOOGLE_NEWS_BASE_URL}/rss/search?q={encoded_query}&hl=en&gl=US&ceid=US:en"
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(search_url, headers=headers, timeout=15)
+            response = http_client.get(search_url, headers=headers, timeout=15, provider='google_news')
             if response.status_code == 200:
                 # Parse RSS feed
                 soup = BeautifulSoup(response.content, 'xml')
@@ -1283,6 +2601,8 @@ class NewsSourceFinder:
                 ('cnn.com', 'https://www.cnn.com/search?q={}'),
                 ('apnews.com', 'https://apnews.com/search?q={}')
             ]
+            if NEWS_SITES_BASE_URL:
+                search_sites = [(domain, f"{NEWS_SITES_BASE_URL}/{domain}/search?q={{}}") for domain, _ in search_sites]
             
             query = '+'.join(search_terms[:2]) if search_terms else 'news'
             
@@ -1293,7 +2613,7 @@ class NewsSourceFinder:
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                     }
                     
-                    response = requests.get(search_url, headers=headers, timeout=10)
+                    response = http_client.get(search_url, headers=headers, timeout=10, provider='news_sites')
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.content, 'html.parser')
                         
@@ -1588,15 +2908,105 @@ class NewsSourceFinder:
         
         return ranked_sources[:6]  # Limit to 6 sources
 
+class ArticleDownloadError(Exception):
+    """Article download failure; retryable for network errors, 429 and 5xx"""
+
+    def __init__(self, message, retryable=False):
+        super().__init__(message)
+        self.retryable = retryable
+
 class ArticleExtractor:
     """Enhanced article extraction from URLs"""
-    def extract_article(self, url):
-        """Extract article content from URL"""
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    # XPath forms of the selectors 'article', '[role="main"]', '.content', '.article-body'
+    CONTENT_XPATHS = (
+        '//article',
+        '//*[@role="main"]',
+        '//*[contains(concat(" ", normalize-space(@class), " "), " content ")]',
+        '//*[contains(concat(" ", normalize-space(@class), " "), " article-body ")]'
+    )
+
+    # <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+    META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+    def __init__(self, cache=None):
+        self.cache = cache  # Canonical URL -> extraction plus ETag/Last-Modified validators
+
+    def extract_article(self, url, raise_errors=False):
+        """Extract article content from URL
+
+        With raise_errors, download failures raise ArticleDownloadError instead of returning None."""
+        key = canonicalize_url(url)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached and time.time() - cached['fetched_at'] < ARTICLE_REVALIDATE_AFTER:
+            logger.info(f"📰 Article cache hit for {key}")
+            return dict(cached['article'])
+
+        headers = {'User-Agent': self.USER_AGENT}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response, body = self._download(url, headers)
+        except Exception as e:
+            logger.error(f"Article download failed: {str(e)}")
+            if cached:
+                return dict(cached['article'])
+            if raise_errors:
+                raise ArticleDownloadError(str(e), retryable=isinstance(e, requests.RequestException)) from e
+            return None
+
+        # Unchanged since the cached copy: no download body, no re-parse
+        if cached and response.status_code == 304:
+            logger.info(f"📰 Article not modified, reusing cached extraction for {key}")
+            self.cache.set(key, dict(cached, fetched_at=time.time()))
+            return dict(cached['article'])
+
+        status = response.status_code
+        if raise_errors and status >= 400:
+            raise ArticleDownloadError(f"HTTP {status}", retryable=status == 429 or status >= 500)
+
+        article = self._parse(url, response, body)
+        if article and self.cache is not None and response.status_code == 200:
+            self.cache.set(key, {
+                'article': article,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'fetched_at': time.time()
+            })
+        return article
+
+    def _download(self, url, headers):
+        """Stream the page body once, stopping at ARTICLE_MAX_BYTES"""
+        response = http_client.get(url, headers=headers, timeout=15, stream=True, provider='articles')
+        body = bytearray()
         try:
-            # Method 1: newspaper3k
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= ARTICLE_MAX_BYTES:
+                    logger.warning(f"⚠️ Article at {url} exceeds {ARTICLE_MAX_BYTES} bytes, truncating")
+                    del body[ARTICLE_MAX_BYTES:]
+                    break
+        finally:
+            response.close()
+        return response, bytes(body)
+
+    def _parse(self, url, response, body):
+        """Parse the downloaded bytes, newspaper3k first with an lxml fallback"""
+        # Only trust an explicit charset; otherwise lxml reads the page's <meta charset>
+        encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '').lower() else None
+
+        try:
+            # Method 1: newspaper3k (parses the page already downloaded)
             if NEWSPAPER_AVAILABLE:
+                response.raise_for_status()
                 article = Article(url)
-                article.download()
+                article.download(input_html=self._decode(body, encoding))
                 article.parse()
                 return {
                     'title': article.title,
@@ -1608,43 +3018,419 @@ class ArticleExtractor:
         except Exception as e:
             logger.warning(f"newspaper3k failed: {str(e)}")
 
-        # Method 2: BeautifulSoup fallback
+        # Method 2: lxml fallback on the same bytes
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.get(url, headers=headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Clean up
-            for element in soup(['script', 'style', 'nav', 'footer', 'aside']):
-                element.decompose()
-
-            # Extract content
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else ''
-
-            # Try multiple content selectors
-            content_selectors = ['article', '[role="main"]', '.content', '.article-body']
-            text = ''
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    text = ' '.join([elem.get_text() for elem in elements])
-                    break
+            return self._parse_with_lxml(body, encoding)
+        except Exception as e:
+            logger.error(f"Article extraction failed: {str(e)}")
+            return None
 
-            if not text:
-                paragraphs = soup.find_all('p')
-                text = ' '.join([p.get_text() for p in paragraphs])
+    def _decode(self, body, encoding=None):
+        """Page text for newspaper3k: the header charset, else the page's <meta charset>,
+        else the encoding requests would detect (response.apparent_encoding)"""
+        if not encoding:
+            match = self.META_CHARSET_PATTERN.search(body, 0, 4096)
+            if match:
+                encoding = match.group(1).decode('ascii')
+            else:
+                encoding = requests.compat.chardet.detect(body)['encoding']
+        try:
+            return body.decode(encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
 
-            return {
-                'title': title_text,
-                'text': text.strip(),
-                'authors': [],
-                'publish_date': None,
-                'extraction_method': 'beautifulsoup'
-            }
+    def _parse_with_lxml(self, body, encoding=None):
+        """Title and main text from one lxml tree"""
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        tree = lxml.html.document_fromstring(body, parser=parser)
+
+        # Clean up
+        etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', 'aside', with_tail=False)
+
+        # Extract content
+        title = tree.find('.//title')
+        title_text = title.text_content().strip() if title is not None else ''
+
+        # Try multiple content selectors
+        text = ''
+        for xpath in self.CONTENT_XPATHS:
+            elements = tree.xpath(xpath)
+            if elements:
+                text = ' '.join([elem.text_content() for elem in elements])
+                break
+
+        if not text:
+            text = ' '.join([p.text_content() for p in tree.iter('p')])
+
+        return {
+            'title': title_text,
+            'text': text.strip(),
+            'authors': [],
+            'publish_date': None,
+            'extraction_method': 'lxml'
+        }
+
+class BulkExtractor:
+    """Concurrent extraction of many URLs with per-domain politeness and retries
+
+    Downloads run on a shared executor (the process-wide concurrency cap). A URL
+    is only submitted once its domain has a free slot, so one slow site never
+    ties up workers other domains could use; slots and request spacing are
+    shared by every bulk run in the process."""
+
+    def __init__(self, extractor, executor, per_domain, domain_delay, retries, backoff):
+        self.extractor = extractor
+        self.executor = executor
+        self.per_domain = max(1, per_domain)
+        self.domain_delay = domain_delay
+        self.retries = retries
+        self.backoff = backoff
+        self.lock = threading.Lock()
+        self.domain_active = Counter()  # domain -> downloads in flight
+        self.domain_next_start = {}  # domain -> earliest monotonic time of its next request
+
+    def extract(self, urls):
+        """Yield one record per URL, in completion order"""
+        pending = OrderedDict()  # domain -> [(index, url)], visited round-robin
+        for index, url in enumerate(urls):
+            parsed = urlparse(url.strip()) if isinstance(url, str) else None
+            if not parsed or parsed.scheme not in ('http', 'https') or not parsed.netloc:
+                yield {'index': index, 'url': url, 'success': False, 'attempts': 0,
+                       'error': 'URL must be an absolute http(s) URL'}
+                continue
+            pending.setdefault(parsed.netloc.lower(), []).append((index, url.strip()))
+        for queued in pending.values():
+            queued.reverse()  # pop() from the end keeps submission order
+
+        futures = {}
+        try:
+            while pending or futures:
+                submitted = True
+                while submitted:
+                    submitted = False
+                    for domain in list(pending):
+                        if not self._acquire_slot(domain):
+                            continue
+                        index, url = pending[domain].pop()
+                        if not pending[domain]:
+                            del pending[domain]
+                        futures[self.executor.submit(self._extract_one, index, url, domain)] = domain
+                        submitted = True
+
+                if not futures:
+                    # Every remaining domain is saturated by other bulk runs
+                    time.sleep(0.05)
+                    continue
+                done, _ = wait(futures, timeout=0.5 if pending else None, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.pop(future)
+                    yield future.result()
+        finally:
+            # Client went away: drop downloads that have not started yet
+            for future, domain in futures.items():
+                if future.cancel():
+                    self._release_slot(domain)
+
+    def _acquire_slot(self, domain):
+        with self.lock:
+            if self.domain_active[domain] >= self.per_domain:
+                return False
+            self.domain_active[domain] += 1
+            return True
+
+    def _release_slot(self, domain):
+        with self.lock:
+            self.domain_active[domain] -= 1
+            if self.domain_active[domain] <= 0:
+                del self.domain_active[domain]
+                if self.domain_next_start.get(domain, 0) <= time.monotonic():
+                    self.domain_next_start.pop(domain, None)
+
+    def _wait_turn(self, domain):
+        """Space request starts to one domain at least domain_delay seconds apart"""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.domain_next_start.get(domain, now))
+            self.domain_next_start[domain] = start + self.domain_delay
+        if start > now:
+            time.sleep(start - now)
+
+    def _extract_one(self, index, url, domain):
+        """Download and parse one URL (retrying transient failures), then free its domain slot"""
+        started = time.monotonic()
+        record = {'index': index, 'url': url, 'success': False, 'attempts': 0}
+        try:
+            while True:
+                record['attempts'] += 1
+                self._wait_turn(domain)
+                try:
+                    article = self.extractor.extract_article(url, raise_errors=True)
+                except ArticleDownloadError as e:
+                    if not e.retryable or record['attempts'] > self.retries:
+                        record['error'] = str(e)
+                        break
+                    time.sleep(self.backoff * 2 ** (record['attempts'] - 1))
+                    continue
+                if article and article['text']:
+                    record['success'] = True
+                    record['article'] = article
+                else:
+                    record['error'] = 'Could not extract text from URL'
+                break
         except Exception as e:
-            logger.error(f"Article extraction failed: {str(e)}")
+            record['error'] = str(e)
+        finally:
+            self._release_slot(domain)
+        record['elapsed'] = round(time.monotonic() - started, 3)
+        return record
+
+def bulk_extract(urls, extractor=None, score=False, batch_size=BULK_SCORE_BATCH_SIZE, entities=False):
+    """Yield one extraction record per URL as it completes
+
+    With score, successful records also carry the batch-scoring analysis
+    (ML + content quality), and with entities their named entities; such
+    records are held back until batch_size of them can be processed in one
+    vectorized pass (one nlp.pipe run for the entities)."""
+    extractor = extractor or bulk_extractor
+    batch = []
+    for record in extractor.extract(urls):
+        if not (score or entities) or not record['success']:
+            yield record
+            continue
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield from _score_bulk_records(batch, score, entities)
+            batch = []
+    if batch:
+        yield from _score_bulk_records(batch, score, entities)
+
+def _score_bulk_records(records, score=True, entities=False):
+    """Attach calculate_final_scores output and/or named entities to each extracted article"""
+    texts = [f"{record['article'].get('title', '')} {record['article']['text']}".strip() for record in records]
+    start_time = time.time()
+    if score:
+        for record, credibility_result in zip(records, credibility_scorer.calculate_final_scores(texts)):
+            record['analysis'] = credibility_result
+    if entities:
+        for record, text_entities in zip(records, credibility_scorer.analyzer.extract_entities_batch(texts)):
+            record['entities'] = text_entities
+    logger.info(f"📦 Processed {len(records)} extracted articles in {time.time() - start_time:.2f}s")
+    return records
+
+# Precompiled text patterns shared by ML preprocessing, quality analysis and fact detection
+URL_PATTERN = re.compile(r'http\S+|www\S+|https\S+')
+LETTER_RUN_PATTERN = re.compile(r'[a-z]+')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+QUOTE_PATTERN = re.compile(r'"[^"]+"')
+
+FACTUAL_WORDS = (
+    # Research and official sources
+    'according', 'research', 'study', 'report', 'data', 'statistics',
+    'survey', 'analysis', 'findings', 'evidence', 'documented',
+
+    # Official and authoritative terms
+    'government', 'official', 'ministry', 'department', 'agency',
+    'authority', 'commission', 'parliament', 'congress',
+
+    # Academic and scientific terms
+    'university', 'institute', 'published', 'journal', 'peer-reviewed',
+    'professor', 'doctor', 'phd', 'researcher',
+
+    # Factual statement indicators
+    'established', 'founded', 'located', 'situated', 'population',
+    'capital', 'currency', 'area', 'distance', 'height', 'depth'
+)
+# Letter-only words can only occur inside a single [a-z]+ run, so they are counted per
+# distinct token; anything with punctuation is counted directly on the text
+FACTUAL_TOKEN_WORDS = tuple(word for word in FACTUAL_WORDS if word.isalpha())
+FACTUAL_TEXT_WORDS = tuple(word for word in FACTUAL_WORDS if not word.isalpha())
+FACTUAL_WORD_PATTERN = re.compile('|'.join(map(re.escape, sorted(FACTUAL_TOKEN_WORDS, key=len, reverse=True))))
+
+QUALITY_FACTUAL_PATTERNS = [re.compile(pattern) for pattern in (
+    r'\d{4}',  # Years
+    r'\d+(?:,\d{3})*',  # Large numbers
+    r'\d+\s*(?:million|billion|thousand|percent|km|miles|meters)',  # Numbers with units
+    r'(born|died|established|founded) (?:in|on) \d{4}',  # Dates
+    r'(prime minister|president|capital|currency) (?:of|is)',  # Government facts
+    r'(located|situated) in \w+',  # Geographic facts
+)]
+
+AUTHORITATIVE_PHRASES = (
+    'according to', 'official statement', 'government announced',
+    'research shows', 'study reveals', 'data indicates',
+    'confirmed by', 'verified by', 'reported by'
+)
+
+# Specific person status patterns (HIGH CONFIDENCE), as one alternation
+PERSON_STATUS_PATTERN = re.compile('|'.join((
+    r'(salman khan|shah rukh khan|aamir khan|akshay kumar) is (alive|living)',
+    r'(narendra modi|modi) is (alive|living|prime minister)',
+    r'(apj abdul kalam|kalam) is (dead|deceased|died)',
+    r'(mahatma gandhi|gandhi) is (dead|deceased|died)',
+    r'(jawaharlal nehru|nehru) is (dead|deceased|died)',
+)))
+
+FACT_STATEMENT_PATTERNS = [re.compile(pattern) for pattern in (
+    # Government/Political facts
+    r'(prime minister|president|king|queen|chancellor|governor) (of|is)',
+    r'(capital|currency) (of|is)',
+    r'(born|died) (in|on|at)',
+
+    # Geographic facts
+    r'(located|situated) in',
+    r'(border|borders|bounded) (by|with)',
+    r'(population|area|size) (of|is)',
+
+    # Scientific/Historical facts
+    r'(discovered|invented|founded) (in|by)',
+    r'(temperature|distance|speed|weight) (of|is)',
+    r'(world war|independence|revolution) (started|ended|began)',
+
+    # Basic definitions
+    r'(known as|also called|referred to as)',
+    r'(consists of|composed of|made of)',
+    r'(established|founded|created) (in|on)',
+
+    # Large numbers with units
+    r'\d+\s*(million|billion|thousand|percent|km|miles)',
+)]
+MONEY_PATTERN = re.compile(r'\$\d+(?:,\d{3})*(?:\.\d{2})?')
+PERCENT_PATTERN = re.compile(r'\d+(?:\.\d+)?%')
+SEARCH_WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+YEAR_DIGITS_PATTERN = re.compile(r'\d{4}')
+YEAR_MARKER_PATTERN = re.compile(r'year|ad|bc|ce')
+
+FACT_KEYWORDS = (
+    'prime minister', 'president', 'capital', 'currency', 'population',
+    'area', 'located', 'founded', 'established', 'discovered', 'invented',
+    'born', 'died', 'known as', 'also called', 'consists of'
+)
+
+@lru_cache(maxsize=65536)
+def _factual_word_hits(token):
+    """Total str.count of every letter-only factual word inside one token"""
+    if not FACTUAL_WORD_PATTERN.search(token):
+        return 0
+    return sum(token.count(word) for word in FACTUAL_TOKEN_WORDS)
+
+def _has_year_reference(text_lower):
+    r"""Linear-time equivalent of re.search(r'\d{4}.*?(year|ad|bc|ce)', text_lower)
+
+    Only the first 4-digit run on each line needs checking, since every later run
+    on that line sees a subset of its tail (the original lazy scan was quadratic)."""
+    position = 0
+    while True:
+        match = YEAR_DIGITS_PATTERN.search(text_lower, position)
+        if not match:
+            return False
+        line_end = text_lower.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(text_lower)
+        if YEAR_MARKER_PATTERN.search(text_lower, match.end(), line_end):
+            return True
+        position = line_end + 1
+
+def _ml_tokens(text_lower, letter_runs=None):
+    """ML token stream: letter runs of the lowercased text with URLs removed"""
+    if 'http' in text_lower or 'www' in text_lower:
+        return LETTER_RUN_PATTERN.findall(URL_PATTERN.sub('', text_lower))
+    if letter_runs is None:
+        letter_runs = LETTER_RUN_PATTERN.findall(text_lower)
+    return letter_runs
+
+def _ml_text(tokens):
+    """Join ML tokens, dropping stopwords and words of two letters or fewer"""
+    if stop_words:
+        return ' '.join([word for word in tokens if len(word) > 2 and word not in stop_words])
+    return ' '.join(tokens)
+
+class memoized_view:
+    """Lazily computed per-instance attribute
+
+    Like functools.cached_property without its class-wide lock (Python < 3.12),
+    which would serialize concurrent requests computing the same view; threads
+    racing on one document at worst compute a view twice."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+class AnalysisDocument(str):
+    """One text plus lazily memoized derived views, parsed once per request
+
+    A str subclass, so it flows unchanged through every stage; each consumer
+    wraps its input with AnalysisDocument.of() and reuses whatever views
+    (lowercase text, sentences, tokens, keyword hits, spaCy doc) an earlier
+    stage already computed."""
+
+    @classmethod
+    def of(cls, text):
+        """The text itself if it already is a document, else a new one"""
+        return text if isinstance(text, cls) else cls(text)
+
+    @memoized_view
+    def text_lower(self):
+        return self.lower()
+
+    @memoized_view
+    def word_count(self):
+        return len(self.split())
+
+    @memoized_view
+    def sentence_parts(self):
+        """Raw SENTENCE_SPLIT_PATTERN pieces, empty ones included"""
+        return SENTENCE_SPLIT_PATTERN.split(self)
+
+    @memoized_view
+    def sentences(self):
+        """Stripped, non-empty sentences"""
+        return [part.strip() for part in self.sentence_parts if part.strip()]
+
+    @memoized_view
+    def sentence_count(self):
+        return len(self.sentences)
+
+    @memoized_view
+    def letter_runs(self):
+        return LETTER_RUN_PATTERN.findall(self.text_lower)
+
+    @memoized_view
+    def ml_text(self):
+        return _ml_text(_ml_tokens(self.text_lower, self.letter_runs))
+
+    @memoized_view
+    def factual_word_count(self):
+        """FACTUAL_WORDS hits, counted per distinct token instead of rescanning the text"""
+        return sum(
+            count * _factual_word_hits(token) for token, count in Counter(self.letter_runs).items()
+        ) + sum(self.text_lower.count(word) for word in FACTUAL_TEXT_WORDS)
+
+    @memoized_view
+    def fact_keyword_hits(self):
+        return sum(1 for keyword in FACT_KEYWORDS if keyword in self.text_lower)
+
+    @memoized_view
+    def search_words(self):
+        """Words of three or more letters, for news search terms"""
+        return SEARCH_WORD_PATTERN.findall(self.text_lower)
+
+    @memoized_view
+    def spacy_doc(self):
+        return nlp(str(self)) if nlp else None
+
+    @memoized_view
+    def lead_doc(self):
+        """spaCy doc of the first 500 characters (enough for search-term entities)"""
+        if not nlp:
             return None
+        return self.spacy_doc if len(self) <= 500 else nlp(self[:500])
 
 class AdvancedAnalyzer:
     """Advanced NLP and content analysis"""
@@ -1654,64 +3440,48 @@ class AdvancedAnalyzer:
     def extract_entities(self, text):
         """Extract named entities"""
         if self.nlp:
-            doc = self.nlp(text)
-            entities = {}
-            for ent in doc.ents:
-                if ent.label_ not in entities:
-                    entities[ent.label_] = []
-                entities[ent.label_].append(ent.text)
-            return entities
+            return self._group_entities(AnalysisDocument.of(text).spacy_doc)
+        return self.extract_entities_batch([text])[0]
+
+    def extract_entities_batch(self, texts):
+        """Named entities for many texts, streamed through nlp.pipe in batches"""
+        if self.nlp:
+            # Plain strings: with n_process > 1 the texts are pickled to the workers
+            docs = self.nlp.pipe([str(text) for text in texts], batch_size=SPACY_BATCH_SIZE, n_process=SPACY_N_PROCESS)
+            return [self._group_entities(doc) for doc in docs]
         else:
             # Simple pattern matching fallback
-            entities = {}
-            entities['MONEY'] = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d{2})?', text)
-            entities['PERCENT'] = re.findall(r'\d+(?:\.\d+)?%', text)
-            return entities
+            return [{
+                'MONEY': MONEY_PATTERN.findall(text),
+                'PERCENT': PERCENT_PATTERN.findall(text)
+            } for text in texts]
+
+    def _group_entities(self, doc):
+        """{label: [entity text, ...]} for one spaCy doc"""
+        entities = {}
+        for ent in doc.ents:
+            if ent.label_ not in entities:
+                entities[ent.label_] = []
+            entities[ent.label_].append(ent.text)
+        return entities
 
     def analyze_content_quality(self, text):
         """Enhanced content quality analysis with factual statement detection"""
-        word_count = len(text.split())
-        sentences = re.split(r'[.!?]+', text)
-        sentence_count = len([s for s in sentences if s.strip()])
-        text_lower = text.lower()
-
-        # Enhanced factual indicators
-        factual_words = [
-            # Research and official sources
-            'according', 'research', 'study', 'report', 'data', 'statistics',
-            'survey', 'analysis', 'findings', 'evidence', 'documented',
-            
-            # Official and authoritative terms
-            'government', 'official', 'ministry', 'department', 'agency',
-            'authority', 'commission', 'parliament', 'congress',
-            
-            # Academic and scientific terms
-            'university', 'institute', 'published', 'journal', 'peer-reviewed',
-            'professor', 'doctor', 'phd', 'researcher',
-            
-            # Factual statement indicators
-            'established', 'founded', 'located', 'situated', 'population',
-            'capital', 'currency', 'area', 'distance', 'height', 'depth'
-        ]
-        
-        factual_count = sum(text_lower.count(word) for word in factual_words)
+        document = AnalysisDocument.of(text)
+        word_count = document.word_count
+        sentence_count = document.sentence_count
+        text_lower = document.text_lower
+
+        # Enhanced factual indicators (FACTUAL_WORDS, counted during tokenization)
+        factual_count = document.factual_word_count
 
         # Check for specific factual patterns
-        factual_patterns = [
-            r'\d{4}',  # Years
-            r'\d+(?:,\d{3})*',  # Large numbers
-            r'\d+\s*(?:million|billion|thousand|percent|km|miles|meters)',  # Numbers with units
-            r'(born|died|established|founded) (?:in|on) \d{4}',  # Dates
-            r'(prime minister|president|capital|currency) (?:of|is)',  # Government facts
-            r'(located|situated) in \w+',  # Geographic facts
-        ]
-        
         pattern_matches = 0
-        for pattern in factual_patterns:
-            pattern_matches += len(re.findall(pattern, text_lower))
+        for pattern in QUALITY_FACTUAL_PATTERNS:
+            pattern_matches += len(pattern.findall(text_lower))
 
         # Check for quotes
-        quotes = len(re.findall(r'"[^"]+"', text))
+        quotes = len(QUOTE_PATTERN.findall(text))
 
         # Readability score
         readability = 50  # Default
@@ -1722,13 +3492,7 @@ class AdvancedAnalyzer:
                 pass
 
         # Check for authoritative language
-        authoritative_phrases = [
-            'according to', 'official statement', 'government announced',
-            'research shows', 'study reveals', 'data indicates',
-            'confirmed by', 'verified by', 'reported by'
-        ]
-        
-        authoritative_count = sum(1 for phrase in authoritative_phrases if phrase in text_lower)
+        authoritative_count = sum(1 for phrase in AUTHORITATIVE_PHRASES if phrase in text_lower)
         
         # Detect if this is a simple factual statement
         is_factual_statement = False
@@ -1756,116 +3520,104 @@ class CredibilityScorer:
 
     def get_ml_prediction(self, text):
         """Get enhanced ML model prediction with factual statement detection"""
+        return self.get_ml_predictions([text])[0]
+
+    def get_ml_predictions(self, texts):
+        """Vectorized ML prediction for a batch of texts (one transform, one predict_proba)"""
         try:
-            # Check if this is a basic factual statement
-            fact_boost = self._detect_factual_statements(text)
-            
-            processed_text = preprocess_text(text)
-            text_vectorized = self.vectorizer.transform([processed_text])
-            prediction = self.ml_model.predict(text_vectorized)[0]
-            probabilities = self.ml_model.predict_proba(text_vectorized)[0]
-            
-            # Apply fact boost if detected
-            if fact_boost > 0:
-                # Boost the real probability for factual statements
-                boosted_real_prob = min(0.95, probabilities[1] + fact_boost)
-                boosted_fake_prob = 1 - boosted_real_prob
-                probabilities = [boosted_fake_prob, boosted_real_prob]
-                prediction = 1 if boosted_real_prob > 0.5 else 0
+            documents = [AnalysisDocument.of(text) for text in texts]
+
+            # Check which texts are basic factual statements
+            fact_boosts = [self._detect_factual_statements(document) for document in documents]
             
-            return {
-                'prediction': 'Real' if prediction == 1 else 'Fake',
-                'confidence': float(max(probabilities)),
-                'fake_probability': float(probabilities[0]),
-                'real_probability': float(probabilities[1]),
-                'fact_boost_applied': fact_boost > 0,
-                'fact_boost_amount': fact_boost
-            }
+            processed_texts = [document.ml_text for document in documents]
+            texts_vectorized = self.vectorizer.transform(processed_texts)
+            all_probabilities = self.ml_model.predict_proba(texts_vectorized)
+            # predict() is the argmax of predict_proba, so derive it instead of a second pass
+            all_predictions = self.ml_model.classes_.take(np.argmax(all_probabilities, axis=1))
+            
+            results = []
+            for prediction, probabilities, fact_boost in zip(all_predictions, all_probabilities, fact_boosts):
+                # Apply fact boost if detected
+                if fact_boost > 0:
+                    # Boost the real probability for factual statements
+                    boosted_real_prob = min(0.95, probabilities[1] + fact_boost)
+                    boosted_fake_prob = 1 - boosted_real_prob
+                    probabilities = [boosted_fake_prob, boosted_real_prob]
+                    prediction = 1 if boosted_real_prob > 0.5 else 0
+                
+                results.append({
+                    'prediction': 'Real' if prediction == 1 else 'Fake',
+                    'confidence': float(max(probabilities)),
+                    'fake_probability': float(probabilities[0]),
+                    'real_probability': float(probabilities[1]),
+                    'fact_boost_applied': fact_boost > 0,
+                    'fact_boost_amount': fact_boost
+                })
+            return results
         except Exception as e:
             logger.error(f"ML prediction error: {str(e)}")
-            return {'prediction': 'Unknown', 'confidence': 0.5}
+            return [{'prediction': 'Unknown', 'confidence': 0.5} for _ in texts]
     
     def _detect_factual_statements(self, text):
         """Detect basic factual statements and return confidence boost"""
-        text_lower = text.lower()
-        
-        # Specific person status patterns (HIGH CONFIDENCE)
-        person_status_patterns = [
-            r'(salman khan|shah rukh khan|aamir khan|akshay kumar) is (alive|living)',
-            r'(narendra modi|modi) is (alive|living|prime minister)',
-            r'(apj abdul kalam|kalam) is (dead|deceased|died)',
-            r'(mahatma gandhi|gandhi) is (dead|deceased|died)',
-            r'(jawaharlal nehru|nehru) is (dead|deceased|died)',
-        ]
+        document = AnalysisDocument.of(text)
+        text_lower = document.text_lower
         
         # Check for high-confidence person status facts
-        for pattern in person_status_patterns:
-            if re.search(pattern, text_lower):
-                logger.info(f"🎯 High-confidence factual statement detected: {text[:50]}...")
-                return 0.4  # High boost for person status facts
-        
-        # General factual patterns
-        factual_patterns = [
-            # Government/Political facts
-            r'(prime minister|president|king|queen|chancellor|governor) (of|is)',
-            r'(capital|currency) (of|is)',
-            r'(born|died) (in|on|at)',
-            
-            # Geographic facts
-            r'(located|situated) in',
-            r'(border|borders|bounded) (by|with)',
-            r'(population|area|size) (of|is)',
-            
-            # Scientific/Historical facts
-            r'(discovered|invented|founded) (in|by)',
-            r'(temperature|distance|speed|weight) (of|is)',
-            r'(world war|independence|revolution) (started|ended|began)',
-            
-            # Basic definitions
-            r'(known as|also called|referred to as)',
-            r'(consists of|composed of|made of)',
-            r'(established|founded|created) (in|on)',
-            
-            # Numerical facts
-            r'\d{4}.*?(year|ad|bc|ce)',  # Years
-            r'\d+\s*(million|billion|thousand|percent|km|miles)',  # Large numbers with units
-        ]
+        if PERSON_STATUS_PATTERN.search(text_lower):
+            logger.info(f"🎯 High-confidence factual statement detected: {text[:50]}...")
+            return 0.4  # High boost for person status facts
         
+        # General factual patterns, plus the year reference check
         boost = 0.0
         matches = 0
-        
-        for pattern in factual_patterns:
-            if re.search(pattern, text_lower):
+
+        for pattern in FACT_STATEMENT_PATTERNS:
+            if pattern.search(text_lower):
                 matches += 1
                 boost += 0.1
+        if _has_year_reference(text_lower):
+            matches += 1
+            boost += 0.1
         
         # Additional checks for very short factual statements
-        word_count = len(text.split())
-        if word_count <= 15 and matches > 0:
+        if document.word_count <= 15 and matches > 0:
             boost += 0.15  # Extra boost for short factual statements
         
         # Check for specific factual keywords
-        factual_keywords = [
-            'prime minister', 'president', 'capital', 'currency', 'population',
-            'area', 'located', 'founded', 'established', 'discovered', 'invented',
-            'born', 'died', 'known as', 'also called', 'consists of'
-        ]
-        
-        keyword_matches = sum(1 for keyword in factual_keywords if keyword in text_lower)
+        keyword_matches = document.fact_keyword_hits
         if keyword_matches > 0:
             boost += keyword_matches * 0.05
         
         # Cap the boost at 0.4 to avoid over-correction
         return min(0.4, boost)
 
-    def calculate_final_score(self, text, ai_analysis=None):
-        """Calculate enhanced credibility score with factual statement detection"""
-        # ML Analysis with factual boost
-        ml_result = self.get_ml_prediction(text)
+    def calculate_final_score(self, text, ai_analysis=None, ml_result=None, quality_metrics=None):
+        """Calculate enhanced credibility score with factual statement detection
+
+        ml_result and quality_metrics may be precomputed (e.g. while network stages run)."""
+        # ML Analysis with factual boost
+        if ml_result is None:
+            ml_result = self.get_ml_prediction(text)
+        return self._combine_scores(text, ml_result, ai_analysis, quality_metrics)
+
+    def calculate_final_scores(self, texts):
+        """Calculate credibility scores for a batch of texts with a single ML pass"""
+        documents = [AnalysisDocument.of(text) for text in texts]
+        ml_results = self.get_ml_predictions(documents)
+        return [
+            self._combine_scores(document, ml_result, quality_metrics=self.analyzer.analyze_content_quality(document))
+            for document, ml_result in zip(documents, ml_results)
+        ]
+
+    def _combine_scores(self, text, ml_result, ai_analysis=None, quality_metrics=None):
+        """Combine ML, content quality and AI signals into the final credibility score"""
         ml_credibility = ml_result['confidence'] if ml_result['prediction'] == 'Real' else 1 - ml_result['confidence']
 
         # Content Quality Analysis
-        quality_metrics = self.analyzer.analyze_content_quality(text)
+        if quality_metrics is None:
+            quality_metrics = self.analyzer.analyze_content_quality(text)
         
         # Enhanced content scoring for factual statements
         base_content_score = min(1.0, (
@@ -1907,7 +3659,6 @@ class CredibilityScorer:
         final_score = min(1.0, preliminary_score + factual_boost)
         
         # Enhanced assessment with higher thresholds for factual content
-        word_count = len(text.split())
         if quality_metrics['is_factual_statement'] and final_score >= 0.7:
             # Give factual statements benefit of doubt
             if final_score >= 0.9:
@@ -1949,48 +3700,301 @@ class CredibilityScorer:
         }
 
 def preprocess_text(text):
-    """Preprocess text for ML model"""
+    """Preprocess text for ML model (URLs removed, letters only, stopwords dropped)"""
+    if isinstance(text, AnalysisDocument):
+        return text.ml_text
     if pd.isna(text) or text is None:
         return ""
-    text = str(text).lower()
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    if stop_words:
-        words = text.split()
-        words = [word for word in words if word not in stop_words and len(word) > 2]
-        return ' '.join(words)
-    return text
+    return _ml_text(_ml_tokens(str(text).lower()))
+
+def preprocess_texts(texts):
+    """Preprocess a batch of texts for the ML model"""
+    return [preprocess_text(text) for text in texts]
+
+class ArrayTfidfVectorizer:
+    """TF-IDF transform backed by memory-mapped arrays instead of a pickled vocabulary dict
+
+    The vocabulary is a sorted fixed-width byte-string array looked up with
+    np.searchsorted, so loading it costs a page mapping rather than rebuilding
+    a Python dict, and forked workers share the same pages."""
+
+    def __init__(self, meta, terms, columns, idf):
+        self.lowercase = meta['lowercase']
+        self.token_pattern = re.compile(meta['token_pattern'])
+        self.ngram_range = tuple(meta['ngram_range'])
+        self.stop_words = frozenset(meta.get('stop_words') or [])
+        self.binary = meta['binary']
+        self.sublinear_tf = meta['sublinear_tf']
+        self.norm = meta['norm']
+        self.n_features = meta['n_features']
+        self.term_width = meta['term_width']
+        self.terms = terms
+        self.columns = columns
+        self.idf = idf
+
+    def _analyze(self, doc):
+        """Same token stream as sklearn's word analyzer"""
+        if self.lowercase:
+            doc = doc.lower()
+        tokens = self.token_pattern.findall(doc)
+        if self.stop_words:
+            tokens = [token for token in tokens if token not in self.stop_words]
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        ngrams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            ngrams.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return ngrams
+
+    def transform(self, raw_documents):
+        rows = []
+        encoded_terms = []
+        for row, doc in enumerate(raw_documents):
+            for term in self._analyze(doc):
+                encoded = term.encode('utf-8')
+                # Longer terms cannot be in the vocabulary (and would be truncated by the dtype)
+                if len(encoded) <= self.term_width:
+                    rows.append(row)
+                    encoded_terms.append(encoded)
+
+        n_docs = len(raw_documents)
+        if encoded_terms:
+            lookup = np.array(encoded_terms, dtype=self.terms.dtype)
+            positions = np.searchsorted(self.terms, lookup)
+            positions[positions == len(self.terms)] = 0
+            found = self.terms[positions] == lookup
+            matrix = sparse.coo_matrix(
+                (np.ones(int(found.sum())), (np.asarray(rows)[found], self.columns[positions[found]])),
+                shape=(n_docs, self.n_features)
+            ).tocsr()
+        else:
+            matrix = sparse.csr_matrix((n_docs, self.n_features))
+        matrix.sum_duplicates()
+        matrix.sort_indices()
+        return _apply_tfidf_weighting(matrix, self.idf, self.binary, self.sublinear_tf, self.norm)
+
+class HashingTfidfVectorizer:
+    """Stateless hashing vectorizer plus a stored IDF vector sized to the hash space
+
+    There is no vocabulary at all: terms are hashed straight to columns, so the
+    only state is the (memory-mapped) IDF array and inference needs no locks."""
+
+    def __init__(self, meta, idf):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.hasher = HashingVectorizer(
+            n_features=meta['n_features'],
+            ngram_range=tuple(meta['ngram_range']),
+            token_pattern=meta['token_pattern'],
+            lowercase=meta['lowercase'],
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float64
+        )
+        self.binary = meta['binary']
+        self.sublinear_tf = meta['sublinear_tf']
+        self.norm = meta['norm']
+        self.idf = idf
+
+    def transform(self, raw_documents):
+        matrix = self.hasher.transform(raw_documents).tocsr()
+        matrix.sort_indices()
+        return _apply_tfidf_weighting(matrix, self.idf, self.binary, self.sublinear_tf, self.norm)
+
+def _apply_tfidf_weighting(matrix, idf, binary, sublinear_tf, norm):
+    """TF scaling, IDF weighting and row normalisation (same as sklearn's TfidfTransformer)"""
+    if binary:
+        matrix.data[:] = 1.0
+    if sublinear_tf:
+        np.log(matrix.data, matrix.data)
+        matrix.data += 1
+    if idf is not None:
+        matrix.data *= idf[matrix.indices]
+    if norm == 'l2':
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    elif norm == 'l1':
+        norms = np.asarray(abs(matrix).sum(axis=1)).ravel()
+    else:
+        return matrix
+    norms[norms == 0.0] = 1.0
+    matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+    return matrix
+
+class ArrayForestClassifier:
+    """Random forest predict_proba over flat node arrays (all trees concatenated)"""
+
+    def __init__(self, meta, arrays):
+        self.classes_ = np.asarray(meta['classes'])
+        self.n_features = meta['n_features']
+        self.roots = arrays['tree_offsets'][:-1]
+        self.children_left = arrays['children_left']
+        self.children_right = arrays['children_right']
+        self.feature = arrays['feature']
+        self.threshold = arrays['threshold']
+        self.leaf_proba = arrays['leaf_proba']
+
+    def predict_proba(self, X):
+        X = sparse.csr_matrix(X)
+        X.sort_indices()
+        n_samples, n_trees = X.shape[0], len(self.roots)
+
+        # Every stored value is addressable by a single sorted key: row * n_features + column
+        nz_rows = np.repeat(np.arange(n_samples, dtype=np.int64), np.diff(X.indptr))
+        keys = nz_rows * self.n_features + X.indices
+        values = X.data.astype(np.float32)  # sklearn trees compare float32 inputs
+
+        # Walk all (sample, tree) pairs down one level per iteration
+        nodes = np.tile(self.roots, n_samples).astype(np.int64)
+        samples = np.repeat(np.arange(n_samples, dtype=np.int64), n_trees)
+        active = np.nonzero(self.children_left[nodes] != -1)[0]
+        while active.size:
+            current = nodes[active]
+            features = self.feature[current]
+            query = samples[active] * self.n_features + features
+            if keys.size:
+                positions = np.minimum(np.searchsorted(keys, query), keys.size - 1)
+                x = np.where(keys[positions] == query, values[positions], np.float32(0))
+            else:
+                x = np.zeros(query.shape, dtype=np.float32)
+            nodes[active] = np.where(x <= self.threshold[current],
+                                     self.children_left[current], self.children_right[current])
+            active = active[self.children_left[nodes[active]] != -1]
+
+        proba = self.leaf_proba[nodes].reshape(n_samples, n_trees, -1)
+        return proba.mean(axis=1)
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+class ArrayLinearClassifier:
+    """Logistic-regression style predict_proba over flat coefficient arrays"""
+
+    def __init__(self, meta, arrays):
+        self.classes_ = np.asarray(meta['classes'])
+        self.coef = arrays['coef']
+        self.intercept = arrays['intercept']
+
+    def predict_proba(self, X):
+        decision = np.asarray(X @ self.coef.T) + self.intercept
+        if decision.shape[1] == 1:
+            positive = 1.0 / (1.0 + np.exp(-decision[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        decision = decision - decision.max(axis=1, keepdims=True)
+        exp_decision = np.exp(decision)
+        return exp_decision / exp_decision.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+def load_array_artifacts(directory):
+    """Memory-map a model/vectorizer pair exported by export_model.py or train_hashing_model.py"""
+    with open(os.path.join(directory, 'meta.json')) as f:
+        meta = json.load(f)
+
+    def load_array(name):
+        return np.load(os.path.join(directory, f'{name}.npy'), mmap_mode='r')
+
+    vectorizer_meta = meta['vectorizer']
+    idf = load_array('idf') if vectorizer_meta['use_idf'] else None
+    if vectorizer_meta.get('type', 'tfidf') == 'hashing':
+        array_vectorizer = HashingTfidfVectorizer(vectorizer_meta, idf)
+    else:
+        array_vectorizer = ArrayTfidfVectorizer(
+            vectorizer_meta,
+            load_array('vocab_terms'),
+            load_array('vocab_columns'),
+            idf
+        )
+
+    model_meta = meta['model']
+    if model_meta['type'] == 'random_forest':
+        names = ['tree_offsets', 'children_left', 'children_right', 'feature', 'threshold', 'leaf_proba']
+        array_model = ArrayForestClassifier(model_meta, {name: load_array(name) for name in names})
+    elif model_meta['type'] == 'linear':
+        array_model = ArrayLinearClassifier(model_meta, {name: load_array(name) for name in ['coef', 'intercept']})
+    else:
+        raise ValueError(f"Unsupported model type in artifacts: {model_meta['type']}")
+
+    return array_model, array_vectorizer
+
+def _load_ml_model_and_vectorizer():
+    """Load the classifier and vectorizer in the configured artifact format"""
+    use_arrays = MODEL_FORMAT == 'arrays' or (
+        MODEL_FORMAT == 'auto' and os.path.exists(os.path.join(MODEL_ARTIFACTS_DIR, 'meta.json'))
+    )
+    start_time = time.time()
+    if use_arrays:
+        loaded_model, loaded_vectorizer = load_array_artifacts(MODEL_ARTIFACTS_DIR)
+        source = f"memory-mapped arrays in {MODEL_ARTIFACTS_DIR}/"
+    else:
+        with open('fake_news_model.pkl', 'rb') as f:
+            loaded_model = pickle.load(f)
+        with open('tfidf_vectorizer.pkl', 'rb') as f:
+            loaded_vectorizer = pickle.load(f)
+        source = "pickles"
+    load_seconds = time.time() - start_time
+    metrics.set_gauge('fakenews_model_load_seconds', load_seconds)
+    logger.info(f"✅ ML model loaded from {source} in {load_seconds:.2f}s")
+    return loaded_model, loaded_vectorizer
+
+def load_stop_words():
+    """Stopwords used by preprocess_text (training-time set first, then NLTK, then a basic list)"""
+    try:
+        with open('preprocessing_components.pkl', 'rb') as f:
+            components = pickle.load(f)
+            return components['stop_words']
+    except:
+        try:
+            if NLTK_READY:
+                return set(stopwords.words('english'))
+        except:
+            pass
+        return set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
 
 def load_models():
     """Load all required models and components"""
-    global model, vectorizer, stop_words, ai_analyzer, article_extractor, credibility_scorer, news_source_finder, fact_verifier, real_time_verifier
+    return load_ml_components() and init_network_clients()
+
+def load_ml_components():
+    """Load the fork-shareable pieces: ML model, vectorizer and stopwords
+
+    Safe to call in the gunicorn master before fork (PRELOAD_MODELS=true); the
+    spaCy pipeline is already loaded at import time."""
+    global model, vectorizer, stop_words, credibility_scorer
 
     try:
         # Load ML models
-        with open('fake_news_model.pkl', 'rb') as f:
-            model = pickle.load(f)
-        with open('tfidf_vectorizer.pkl', 'rb') as f:
-            vectorizer = pickle.load(f)
+        model, vectorizer = _load_ml_model_and_vectorizer()
 
         # Load preprocessing components
-        try:
-            with open('preprocessing_components.pkl', 'rb') as f:
-                components = pickle.load(f)
-                stop_words = components['stop_words']
-        except:
-            try:
-                if NLTK_READY:
-                    stop_words = set(stopwords.words('english'))
-                else:
-                    stop_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
-            except:
-                stop_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
+        stop_words = load_stop_words()
+
+        credibility_scorer = CredibilityScorer(model, vectorizer)
+        logger.info("✅ ML components loaded successfully!")
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error loading models: {str(e)}")
+        return False
+
+def init_network_clients():
+    """Create the per-process network clients (Gemini, search, extraction, caches)
+
+    Must run after fork: gRPC/HTTP clients and their connections are not fork-safe.
+    gunicorn.conf.py calls this from its post_fork hook."""
+    global ai_analyzer, article_extractor, bulk_extractor, news_source_finder, fact_verifier, real_time_verifier, response_cache, job_queue, network_clients_pid
+
+    try:
+        configure_gemini()
 
         # Initialize components
         ai_analyzer = AIAnalyzer(GEMINI_API_KEY)
-        article_extractor = ArticleExtractor()
-        credibility_scorer = CredibilityScorer(model, vectorizer)
+        article_extractor = ArticleExtractor(
+            create_cache('articles', ARTICLE_CACHE_MAX_BYTES, ARTICLE_CACHE_TTL)
+        )
+        bulk_extractor = BulkExtractor(
+            article_extractor, bulk_executor, BULK_PER_DOMAIN, BULK_DOMAIN_DELAY, BULK_RETRIES, BULK_RETRY_BACKOFF
+        )
         news_source_finder = NewsSourceFinder()
         fact_verifier = FactVerificationSystem(GEMINI_API_KEY)
         
@@ -2002,7 +4006,23 @@ def load_models():
             google_cse_id=GOOGLE_CSE_ID
         )
 
-        logger.info("✅ All models and components loaded successfully!")
+        # Whole-response cache in front of analyze()
+        if RESPONSE_CACHE_ENABLED:
+            response_cache = ResponseCache(
+                create_cache('responses', RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_TTL + RESPONSE_CACHE_STALE_TTL),
+                RESPONSE_CACHE_TTL,
+                RESPONSE_CACHE_STALE_TTL,
+                RESPONSE_CACHE_DEGRADED_TTL
+            )
+
+        # Persistent job queue; picks up jobs left behind by a restarted process
+        job_queue = JobQueue(JOBS_DB_PATH, job_executor)
+        job_queue.resume()
+
+        metrics.start_flusher()
+
+        network_clients_pid = os.getpid()
+        logger.info(f"✅ All models and components loaded successfully! (pid {network_clients_pid})")
         
         # Log API availability with more detailed status
         logger.info("🔧 API Configuration Status:")
@@ -2026,24 +4046,90 @@ def load_models():
         
         return True
     except Exception as e:
-        logger.error(f"❌ Error loading models: {str(e)}")
+        logger.error(f"❌ Error initializing network clients: {str(e)}")
         return False
 
 def ensure_models_loaded():
-    """Ensure models are loaded (lazy loading for gunicorn)"""
-    global model, vectorizer, stop_words, ai_analyzer, article_extractor, credibility_scorer, news_source_finder, fact_verifier, real_time_verifier
-    
+    """Ensure models and this process's network clients are ready (lazy fallback)"""
     if model is None or vectorizer is None:
         logger.info("🔄 Loading models for first request...")
-        if not load_models():
+        if not load_ml_components():
             logger.error("❌ Failed to load models on demand")
             return False
+    if network_clients_pid != os.getpid():
+        # Preloaded without the post_fork hook (or forked since): build clients here
+        if not init_network_clients():
+            return False
     return True
 
 @app.route('/')
 def home():
     return render_template('index.html')
 
+@app.before_request
+def _start_request_metrics():
+    request.environ['metrics.started'] = time.perf_counter()
+    request.environ['metrics.endpoint'] = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.add_gauge('fakenews_http_requests_in_flight', 1, {'endpoint': request.environ['metrics.endpoint']})
+
+@app.after_request
+def _record_request_metrics(response):
+    endpoint = request.environ.get('metrics.endpoint', 'unmatched')
+    metrics.inc('fakenews_http_requests_total', {'endpoint': endpoint, 'status': response.status_code})
+    if response.is_streamed and 'metrics.started' in request.environ:
+        # Teardown runs before a streamed body is sent, so finish once the server closes it
+        started = request.environ.pop('metrics.started')
+        response.call_on_close(lambda: _observe_request(endpoint, started))
+    return response
+
+@app.teardown_request
+def _finish_request_metrics(error=None):
+    started = request.environ.pop('metrics.started', None)
+    if started is None:
+        return
+    _observe_request(request.environ['metrics.endpoint'], started)
+
+def _observe_request(endpoint, started):
+    """Leave the in-flight gauge and record the request's latency"""
+    metrics.add_gauge('fakenews_http_requests_in_flight', -1, {'endpoint': endpoint})
+    metrics.observe('fakenews_http_request_duration_seconds', time.perf_counter() - started, {'endpoint': endpoint})
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus scrape endpoint, merged across every worker sharing METRICS_DIR"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+class AnalysisInputError(Exception):
+    """Raised for analysis requests that cannot be processed (reported as HTTP 400)"""
+    pass
+
+def parse_analysis_request(data):
+    """Validate an analysis request body into (text, url, enable_ai, find_sources, enable_real_time_check)"""
+    if not data:
+        raise AnalysisInputError('No data provided')
+    if not isinstance(data, dict):
+        raise AnalysisInputError('Request body must be a JSON object')
+
+    if not all(isinstance(data.get(field) or '', str) for field in ('text', 'url')):
+        raise AnalysisInputError('text and url must be strings')
+
+    text = (data.get('text') or '').strip()
+    url = (data.get('url') or '').strip()
+    enable_ai = data.get('ai_analysis', True)
+    find_sources = data.get('find_sources', True)
+    enable_real_time_check = data.get('real_time_verification', True)
+
+    if not text and not url:
+        raise AnalysisInputError('Either text or URL must be provided')
+    return text, url, enable_ai, find_sources, enable_real_time_check
+
+def parse_trace_options(data):
+    """(timings, profile) flags of an analysis request; profiling implies timings"""
+    profile = bool(data.get('profile', False))
+    if profile and not PROFILING_ENABLED:
+        raise AnalysisInputError('Profiling is disabled on this server (set PROFILING_ENABLED=true)')
+    return bool(data.get('timings', False)) or profile, profile
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze():
     """Main analysis endpoint with enhanced real-time fact checking"""
@@ -2053,134 +4139,764 @@ def analyze():
             return jsonify({'error': 'System not ready - models failed to load'}), 503
             
         data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
+        text, url, enable_ai, find_sources, enable_real_time_check = parse_analysis_request(data)
+        timings, profile = parse_trace_options(data)
+
+        def compute():
+            return analyze_input(text, url, enable_ai, find_sources, enable_real_time_check,
+                                 timings=timings, profile=profile)
+
+        # Identical submissions (same normalized text or canonical URL, same flags) share one result;
+        # timed requests always run fresh so the timings describe this request
+        if response_cache and data.get('cache', True) and not timings:
+            key = response_cache_key(text, url, enable_ai, find_sources, enable_real_time_check)
+            response_data, cache_status = response_cache.get_or_compute(key, compute)
+        else:
+            response_data, cache_status = compute(), 'BYPASS'
+
+        metrics.inc('fakenews_responses_total', {'cache_status': cache_status})
+        response = jsonify(response_data)
+        response.headers['X-Cache'] = cache_status
+        return response
+
+    except AnalysisInputError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Analysis error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+class AnalysisEventStream:
+    """Thread-safe queue of analysis events, read back as NDJSON lines
+
+    Stages emit from worker threads; once the stream is closed with the final
+    event, late emits (e.g. a claim finishing after its stage timed out) are dropped."""
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def emit(self, event, data):
+        with self.lock:
+            if not self.closed:
+                self.events.put({'event': event, 'data': data})
+
+    def close(self, event, data):
+        with self.lock:
+            if not self.closed:
+                self.closed = True
+                self.events.put({'event': event, 'data': data})
+                self.events.put(None)
+
+    def __iter__(self):
+        while True:
+            item = self.events.get()
+            if item is None:
+                return
+            yield json.dumps(item, default=str) + '\n'
+
+@app.route('/api/analyze/stream', methods=['POST'])
+def analyze_stream():
+    """Streaming analysis endpoint: one NDJSON event per stage as soon as it finishes
+
+    Events arrive in completion order: article_info (URLs only), ml_result,
+    content_quality, claim_verified (one per claim), each network stage, and
+    finally result (the same body /api/analyze returns) or error."""
+    try:
+        if not ensure_models_loaded():
+            return jsonify({'error': 'System not ready - models failed to load'}), 503
+        data = request.get_json(silent=True)  # Malformed JSON becomes a JSON 400 below, not an HTML error page
+        text, url, enable_ai, find_sources, enable_real_time_check = parse_analysis_request(data)
+        timings, profile = parse_trace_options(data)
+    except AnalysisInputError as e:
+        return jsonify({'error': str(e)}), 400
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}  # Don't let proxies buffer the stream
+    stream = AnalysisEventStream()
+
+    cache_key = None
+    if response_cache and data.get('cache', True) and not timings:
+        cache_key = response_cache_key(text, url, enable_ai, find_sources, enable_real_time_check)
+        cached = response_cache.get_fresh(cache_key)
+        if cached is not None:
+            stream.close('result', cached)
+            headers['X-Cache'] = 'HIT'
+            metrics.inc('fakenews_responses_total', {'cache_status': 'HIT'})
+            return Response(iter(stream), mimetype='application/x-ndjson', headers=headers)
+        headers['X-Cache'] = 'MISS'
+    else:
+        headers['X-Cache'] = 'BYPASS'
+    metrics.inc('fakenews_responses_total', {'cache_status': headers['X-Cache']})
+
+    def run():
+        try:
+            response_data = analyze_input(text, url, enable_ai, find_sources, enable_real_time_check,
+                                          emit=stream.emit, timings=timings, profile=profile)
+            if cache_key:
+                response_cache.store(cache_key, response_data)
+            stream.close('result', response_data)
+        except AnalysisInputError as e:
+            stream.close('error', {'error': str(e), 'status': 400})
+        except Exception as e:
+            logger.error(f"Streaming analysis error: {str(e)}")
+            stream.close('error', {'error': str(e), 'status': 500})
 
-        text = data.get('text', '').strip()
-        url = data.get('url', '').strip()
-        enable_ai = data.get('ai_analysis', True)
-        find_sources = data.get('find_sources', True)
-        enable_real_time_check = data.get('real_time_verification', True)
+    # A dedicated thread, not the stage pool: run_analysis itself submits to that pool
+    threading.Thread(target=run, daemon=True).start()
+    return Response(iter(stream), mimetype='application/x-ndjson', headers=headers)
 
-        if not text and not url:
-            return jsonify({'error': 'Either text or URL must be provided'}), 400
+def analyze_input(text, url='', enable_ai=True, find_sources=True, enable_real_time_check=True, emit=None,
+                  timings=False, profile=False):
+    """Extract the article (for URLs), validate the text and run the full analysis
 
-        article_info = {}
+    emit(event, data), when given, receives each partial result as soon as it is ready.
+    timings adds a 'timings' block with a span per stage and provider call; profile also
+    samples every thread working on the analysis and writes the stacks to PROFILE_DIR."""
+    if not (timings or profile):
+        return _analyze_input(text, url, enable_ai, find_sources, enable_real_time_check, emit)
 
+    trace = RequestTrace()
+    token = current_trace.set(trace)
+    profiler = SamplingProfiler(trace, PROFILE_SAMPLE_INTERVAL).start() if profile else None
+    try:
+        with trace.span('analysis'):
+            response_data = _analyze_input(text, url, enable_ai, find_sources, enable_real_time_check, emit)
+    finally:
+        current_trace.reset(token)
+        if profiler:
+            profiler.stop()
+
+    report = trace.report()
+    if profiler:
+        report['profile'] = profiler.dump(PROFILE_DIR)
+        logger.info(f"🔥 Wrote analysis profile ({profiler.samples} samples) to {report['profile']['path']}")
+    return dict(response_data, timings=report)
+
+def _analyze_input(text, url, enable_ai, find_sources, enable_real_time_check, emit):
+    """analyze_input() without tracing"""
+    article_info = {}
+    metrics.add_gauge('fakenews_analyses_in_flight', 1)
+    try:
         # Extract from URL if provided
         if url:
             try:
-                article_info = article_extractor.extract_article(url)
-                if article_info and article_info['text']:
-                    text = f"{article_info.get('title', '')} {article_info['text']}".strip()
-                else:
-                    return jsonify({'error': 'Could not extract text from URL'}), 400
+                with timed_stage('article_extraction'):
+                    article_info = article_extractor.extract_article(url)
             except Exception as e:
-                return jsonify({'error': f'URL extraction failed: {str(e)}'}), 400
+                raise AnalysisInputError(f'URL extraction failed: {str(e)}')
+            if article_info and article_info['text']:
+                text = f"{article_info.get('title', '')} {article_info['text']}".strip()
+            else:
+                raise AnalysisInputError('Could not extract text from URL')
+            if emit:
+                emit('article_info', article_info)
 
         if len(text) < 10:
-            return jsonify({'error': 'Text too short for analysis (minimum 10 characters)'}), 400
+            raise AnalysisInputError('Text too short for analysis (minimum 10 characters)')
+
+        return run_analysis(text, url, article_info, enable_ai, find_sources, enable_real_time_check, emit)
+    finally:
+        metrics.add_gauge('fakenews_analyses_in_flight', -1)
+
+def run_analysis(text, url='', article_info=None, enable_ai=True, find_sources=True, enable_real_time_check=True,
+                 emit=None):
+    """Run every analysis stage for a validated text and compile the API response"""
+    # Every stage receives the same document and shares its parsed views
+    text = AnalysisDocument.of(text)
+    stages = _build_analysis_stages(text, url, enable_ai, find_sources, enable_real_time_check, emit)
+
+    if ANALYSIS_EXECUTION_MODE == 'concurrent':
+        # Fan the network-bound stages out first, then score locally while they run
+        started = time.monotonic()
+        futures = _submit_stages(stages)
+        ml_result, quality_metrics = _run_local_stages(text)
+        _emit_local_results(emit, text, ml_result, quality_metrics)
+        stage_results, fallen_back = _join_stages(stages, futures, started, on_result=emit)
+    else:
+        # Sequential mode keeps the original stage order: AI first, then ML, then the rest
+        stage_results, fallen_back = {}, []
+        if 'ai_analysis' in stages:
+            stage_results['ai_analysis'] = stages['ai_analysis']['run']()
+            if emit:
+                emit('ai_analysis', stage_results['ai_analysis'])
+        ml_result, quality_metrics = _run_local_stages(text)
+        _emit_local_results(emit, text, ml_result, quality_metrics)
+        for name, stage in stages.items():
+            if name not in stage_results:
+                stage_results[name] = stage['run']()
+                if emit:
+                    emit(name, stage_results[name])
+
+    # Stages that hit their deadline or raised, plus those that reported a failure of their own
+    degraded_stages = [
+        name for name, stage in stages.items()
+        if name in fallen_back or stage['failed'](stage_results[name])
+    ]
+    if degraded_stages:
+        logger.warning(f"⚠️ Analysis degraded: {', '.join(degraded_stages)}")
+
+    ai_analysis = stage_results.get('ai_analysis')
+    real_time_verification = stage_results.get('real_time_verification')
+    fact_verification = stage_results.get('legacy_fact_verification')
+    related_sources = stage_results.get('related_sources')
 
-        # Perform basic AI analysis
-        ai_analysis = None
-        if enable_ai and ai_analyzer:
-            ai_result = ai_analyzer.analyze_article(text, url)
-            ai_analysis = ai_result.get('ai_analysis')
+    # Get basic credibility score from ML model
+    credibility_result = credibility_scorer.calculate_final_score(
+        text, ai_analysis, ml_result=ml_result, quality_metrics=quality_metrics
+    )
 
-        # Get basic credibility score from ML model
-        credibility_result = credibility_scorer.calculate_final_score(text, ai_analysis)
+    # Adjust overall credibility based on real-time verification
+    if real_time_verification and real_time_verification.get('success'):
+        rt_score = real_time_verification.get('overall_credibility_score', 0.5)
+        original_score = credibility_result.get('credibility_score', 0.5)
         
-        # Perform enhanced real-time fact verification
-        real_time_verification = None
-        if enable_real_time_check and real_time_verifier:
-            try:
-                logger.info("🔍 Starting enhanced real-time fact verification...")
-                real_time_verification = real_time_verifier.comprehensive_fact_check(text, url)
-                logger.info(f"✅ Real-time verification completed")
-                
-                # Adjust overall credibility based on real-time verification
-                if real_time_verification and real_time_verification.get('success'):
-                    rt_score = real_time_verification.get('overall_credibility_score', 0.5)
-                    original_score = credibility_result.get('credibility_score', 0.5)
-                    
-                    # Weighted combination: 60% real-time verification, 40% ML model
-                    # This gives more weight to real-time verification as it's more current
-                    final_score = (rt_score * 0.6) + (original_score * 0.4)
-                    
-                    credibility_result['credibility_score'] = final_score
-                    credibility_result['original_ml_score'] = original_score
-                    credibility_result['real_time_score'] = rt_score
-                    credibility_result['adjusted_by_real_time'] = True
-                    
-                    logger.info(f"📊 Combined credibility: ML={original_score:.2f}, RT={rt_score:.2f}, Final={final_score:.2f}")
-                    
-            except Exception as e:
-                logger.error(f"Real-time verification failed: {str(e)}")
-                real_time_verification = {'success': False, 'error': str(e)}
+        # Weighted combination: 60% real-time verification, 40% ML model
+        # This gives more weight to real-time verification as it's more current
+        final_score = (rt_score * 0.6) + (original_score * 0.4)
+        
+        credibility_result['credibility_score'] = final_score
+        credibility_result['original_ml_score'] = original_score
+        credibility_result['real_time_score'] = rt_score
+        credibility_result['adjusted_by_real_time'] = True
+        
+        logger.info(f"📊 Combined credibility: ML={original_score:.2f}, RT={rt_score:.2f}, Final={final_score:.2f}")
 
-        # Legacy fact verification (keeping for backward compatibility)
-        fact_verification = None
-        if fact_verifier and not enable_real_time_check:  # Only run if real-time is disabled
-            try:
-                logger.info("🔍 Starting legacy fact verification...")
-                fact_verification = fact_verifier.verify(text)
-                logger.info(f"🔍 Legacy fact verification completed")
-            except Exception as e:
-                logger.error(f"Legacy fact verification failed: {str(e)}")
-                fact_verification = {'error': str(e)}
+    # Determine final credibility assessment
+    final_assessment = _determine_final_assessment(credibility_result, real_time_verification)
 
-        # Find related sources for verification
-        related_sources = None
-        if find_sources and news_source_finder:
-            try:
-                logger.info(f"🔍 Starting source search...")
-                source_result = news_source_finder.find_related_sources(text)
-                if source_result['success']:
-                    related_sources = source_result
-                    logger.info(f"✅ Found {len(source_result.get('sources', []))} related sources")
-                else:
-                    logger.warning("⚠️ Source search was not successful")
-            except Exception as e:
-                logger.error(f"Source finding failed: {str(e)}")
+    # Compile response
+    return {
+        'success': True,
+        'analysis': credibility_result,
+        'final_assessment': final_assessment,
+        'real_time_verification': real_time_verification,
+        'ai_insights': ai_analysis,
+        'fact_verification': fact_verification,  # Legacy
+        'article_info': article_info or {},
+        'related_sources': related_sources,
+        'input_source': 'url' if url else 'text',
+        'degraded_stages': degraded_stages,
+        'features_enabled': {
+            'ml_classification': True,
+            'ai_analysis': ai_analysis is not None,
+            'real_time_verification': real_time_verification is not None,
+            'legacy_fact_verification': fact_verification is not None,
+            'content_quality': True,
+            'entity_extraction': SPACY_AVAILABLE,
+            'source_verification': related_sources is not None
+        },
+        'api_status': {
+            'gemini_ai': is_api_key_configured(GEMINI_API_KEY),
+            'search_api': (is_api_key_configured(SERPAPI_KEY) or 
+                          is_api_key_configured(GOOGLE_SEARCH_API_KEY)),
+            'serpapi': is_api_key_configured(SERPAPI_KEY),
+            'google_search': is_api_key_configured(GOOGLE_SEARCH_API_KEY)
+        }
+    }
 
-        # Determine final credibility assessment
-        final_assessment = _determine_final_assessment(credibility_result, real_time_verification)
+def _run_local_stages(text):
+    """ML prediction and content quality, both computed in the calling thread"""
+    with timed_stage('ml_prediction'):
+        ml_result = credibility_scorer.get_ml_prediction(text)
+    with timed_stage('content_quality'):
+        quality_metrics = credibility_scorer.analyzer.analyze_content_quality(text)
+    return ml_result, quality_metrics
 
-        # Compile response
-        response_data = {
-            'success': True,
-            'analysis': credibility_result,
-            'final_assessment': final_assessment,
-            'real_time_verification': real_time_verification,
-            'ai_insights': ai_analysis,
-            'fact_verification': fact_verification,  # Legacy
-            'article_info': article_info,
-            'related_sources': related_sources,
-            'input_source': 'url' if url else 'text',
-            'features_enabled': {
-                'ml_classification': True,
-                'ai_analysis': ai_analysis is not None,
-                'real_time_verification': real_time_verification is not None,
-                'legacy_fact_verification': fact_verification is not None,
-                'content_quality': True,
-                'entity_extraction': SPACY_AVAILABLE,
-                'source_verification': related_sources is not None
+def _emit_local_results(emit, text, ml_result, quality_metrics):
+    """Emit the ML verdict (scored without AI input yet) and the content quality metrics"""
+    if emit is None:
+        return
+    emit('ml_result', credibility_scorer.calculate_final_score(
+        text, ml_result=ml_result, quality_metrics=quality_metrics
+    ))
+    emit('content_quality', quality_metrics)
+
+def _build_analysis_stages(text, url, enable_ai, find_sources, enable_real_time_check, emit=None):
+    """Describe the independent analysis stages as {name: {'run': fn, 'fallback': fn, 'failed': fn}}
+
+    failed(result) tells whether a stage that did return reported a failure of its own."""
+    stages = {}
+
+    on_claim_verified = None
+    if emit:
+        def on_claim_verified(index, total, claim, verification):
+            emit('claim_verified', {'index': index, 'total': total, 'claim': claim, 'verification': verification})
+
+    # Perform basic AI analysis
+    if enable_ai and ai_analyzer:
+        stages['ai_analysis'] = {
+            'run': lambda: _run_ai_stage(text, url),
+            'fallback': lambda: ai_analyzer._fallback_analysis(text),
+            'failed': lambda result: 'error' in result
+        }
+
+    # Perform enhanced real-time fact verification
+    if enable_real_time_check and real_time_verifier:
+        stages['real_time_verification'] = {
+            'run': lambda: _run_real_time_stage(text, url, on_claim_verified),
+            'fallback': lambda: {
+                'success': False,
+                'error': 'Real-time verification timed out',
+                'timed_out': True,
+                'fallback_analysis': real_time_verifier._fallback_analysis(text)
             },
-            'api_status': {
-                'gemini_ai': is_api_key_configured(GEMINI_API_KEY),
-                'search_api': (is_api_key_configured(SERPAPI_KEY) or 
-                              is_api_key_configured(GOOGLE_SEARCH_API_KEY)),
-                'serpapi': is_api_key_configured(SERPAPI_KEY),
-                'google_search': is_api_key_configured(GOOGLE_SEARCH_API_KEY)
-            }
+            'failed': lambda result: not result.get('success')
+        }
+
+    # Legacy fact verification (keeping for backward compatibility)
+    if fact_verifier and not enable_real_time_check:  # Only run if real-time is disabled
+        stages['legacy_fact_verification'] = {
+            'run': lambda: _run_legacy_fact_stage(text),
+            'fallback': lambda: {'error': 'Legacy fact verification timed out'},
+            'failed': lambda result: 'error' in result
         }
 
-        return jsonify(response_data)
+    # Find related sources for verification
+    if find_sources and news_source_finder:
+        stages['related_sources'] = {
+            'run': lambda: _run_sources_stage(text),
+            'fallback': lambda: {
+                'success': True,
+                'sources': news_source_finder._get_emergency_fallback_sources(),
+                'search_terms': [],
+                'total_found': 3,
+                'note': 'Using emergency fallback sources due to timeout'
+            },
+            'failed': lambda result: result is None
+        }
+
+    for name, stage in stages.items():
+        stage['run'] = _timed_stage_runner(name, stage['run'])
+    return stages
+
+def _timed_stage_runner(name, run):
+    """Wrap a stage so its real duration is recorded, even when it outlives its deadline"""
+    def timed_run():
+        with timed_stage(name):
+            return run()
+    return timed_run
+
+def _submit_stages(stages):
+    """Submit every stage to the shared stage pool"""
+    return {
+        name: stage_executor.submit(contextvars.copy_context().run, stage['run'])  # Carries the request trace along
+        for name, stage in stages.items()
+    }
+
+def _join_stages(stages, futures, started, on_result=None):
+    """Collect submitted stages in completion order, degrading each one to its fallback past its deadline
+
+    on_result(name, result), when given, is called as soon as each stage is settled.
+    Returns (results, names of the stages that fell back)."""
+    results = {}
+    fallen_back = []
+    deadlines = {name: started + STAGE_TIMEOUTS.get(name, 30) for name in futures}
+    pending = dict(futures)
+    while pending:
+        next_deadline = min(deadlines[name] for name in pending)
+        wait(list(pending.values()), timeout=max(0.0, next_deadline - time.monotonic()),
+             return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        for name, future in list(pending.items()):
+            if future.done():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Stage '{name}' failed: {str(e)}")
+                    metrics.inc('fakenews_stage_failures_total', {'stage': name})
+                    results[name] = stages[name]['fallback']()
+                    fallen_back.append(name)
+            elif now >= deadlines[name]:
+                future.cancel()  # Only helps if the stage never started; a running stage finishes in the background
+                logger.warning(f"⏱️ Stage '{name}' exceeded its {STAGE_TIMEOUTS.get(name, 30):.0f}s deadline - using fallback")
+                metrics.inc('fakenews_stage_timeouts_total', {'stage': name})
+                results[name] = stages[name]['fallback']()
+                fallen_back.append(name)
+            else:
+                continue
+            del pending[name]
+            if on_result:
+                on_result(name, results[name])
+    return results, fallen_back
+
+def _run_ai_stage(text, url):
+    """AI analysis stage"""
+    ai_result = ai_analyzer.analyze_article(text, url)
+    return ai_result.get('ai_analysis')
+
+def _run_real_time_stage(text, url, on_claim_verified=None):
+    """Real-time fact verification stage"""
+    try:
+        logger.info("🔍 Starting enhanced real-time fact verification...")
+        real_time_verification = real_time_verifier.comprehensive_fact_check(text, url, on_claim_verified)
+        logger.info(f"✅ Real-time verification completed")
+        return real_time_verification
+    except Exception as e:
+        logger.error(f"Real-time verification failed: {str(e)}")
+        return {'success': False, 'error': str(e)}
 
+def _run_legacy_fact_stage(text):
+    """Legacy fact verification stage"""
+    try:
+        logger.info("🔍 Starting legacy fact verification...")
+        fact_verification = fact_verifier.verify(text)
+        logger.info(f"🔍 Legacy fact verification completed")
+        return fact_verification
     except Exception as e:
-        logger.error(f"Analysis error: {str(e)}")
+        logger.error(f"Legacy fact verification failed: {str(e)}")
+        return {'error': str(e)}
+
+def _run_sources_stage(text):
+    """Related source finding stage"""
+    try:
+        logger.info(f"🔍 Starting source search...")
+        source_result = news_source_finder.find_related_sources(text)
+        if source_result['success']:
+            logger.info(f"✅ Found {len(source_result.get('sources', []))} related sources")
+            return source_result
+        logger.warning("⚠️ Source search was not successful")
+    except Exception as e:
+        logger.error(f"Source finding failed: {str(e)}")
+    return None
+
+class JobQueue:
+    """SQLite-backed queue of analysis jobs executed on a local thread pool
+
+    Rows outlive the process, so jobs interrupted by a restart are resumed, and
+    any worker process on the host can report any job's status. Jobs are claimed
+    with a conditional UPDATE, so two processes never run the same job."""
+
+    def __init__(self, path, executor):
+        self.path = path
+        self.executor = executor
+        self.lock = threading.Lock()
+        self.connection = None
+        self.connection_pid = None
+
+    def _connect(self):
+        """Open (or re-open after fork) this process's connection"""
+        if self.connection is None or self.connection_pid != os.getpid():
+            self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL, '
+                'partial TEXT NOT NULL, result TEXT, error TEXT, callback_url TEXT, '
+                'worker_pid INTEGER, created_at REAL NOT NULL, started_at REAL, finished_at REAL)'
+            )
+            self.connection.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)')
+            self.connection.commit()
+            self.connection_pid = os.getpid()
+        return self.connection
+
+    def _execute(self, sql, params=()):
+        with self.lock:
+            connection = self._connect()
+            cursor = connection.execute(sql, params)
+            connection.commit()
+            return cursor.rowcount
+
+    def submit(self, request_data, callback_url=None):
+        """Persist a queued job and hand it to the pool; returns the job id"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._execute(
+            'INSERT INTO jobs (id, status, request, partial, callback_url, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+            (job_id, 'queued', json.dumps(request_data), '{}', callback_url, now)
+        )
+        self._execute('DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?', (now - JOB_RETENTION,))
+        self.executor.submit(self._run, job_id)
+        return job_id
+
+    def get(self, job_id):
+        """Job status, partial results and (once finished) the full result, or None"""
+        with self.lock:
+            row = self._connect().execute(
+                'SELECT id, status, partial, result, error, created_at, started_at, finished_at FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'job_id': row[0],
+            'status': row[1],
+            'partial_results': json.loads(row[2]),
+            'result': json.loads(row[3]) if row[3] else None,
+            'error': row[4],
+            'created_at': row[5],
+            'started_at': row[6],
+            'finished_at': row[7]
+        }
+
+    def resume(self):
+        """Requeue jobs that were queued, or running in a process that no longer exists"""
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT id, status, worker_pid FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+        resumed = 0
+        for job_id, status, worker_pid in rows:
+            if status == 'running':
+                if _process_alive(worker_pid):
+                    continue
+                # Only one process gets to move an orphaned job back to the queue
+                if not self._execute("UPDATE jobs SET status = 'queued' WHERE id = ? AND status = 'running' "
+                                     "AND worker_pid = ?", (job_id, worker_pid)):
+                    continue
+            self.executor.submit(self._run, job_id)
+            resumed += 1
+        if resumed:
+            logger.info(f"🔁 Resumed {resumed} analysis job(s) from {self.path}")
+
+    def _run(self, job_id):
+        """Claim a queued job, run the analysis and record partial and final results"""
+        if not self._execute("UPDATE jobs SET status = 'running', worker_pid = ?, started_at = ? "
+                             "WHERE id = ? AND status = 'queued'", (os.getpid(), time.time(), job_id)):
+            return  # Another process (or a duplicate resume) claimed it
+
+        with self.lock:
+            request_json, callback_url = self._connect().execute(
+                'SELECT request, callback_url FROM jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+        request_data = json.loads(request_json)
+        partial = {}
+        partial_lock = threading.Lock()  # Stage and claim threads emit concurrently
+        finished = [False]
+
+        def record_partial(event, data):
+            # Claims accumulate; every other event is one stage result. Once the job has
+            # finished, late emits (e.g. a claim outliving its stage deadline) are dropped.
+            with partial_lock:
+                if finished[0]:
+                    return
+                if event == 'claim_verified':
+                    partial.setdefault('claims_verified', []).append(data)
+                else:
+                    partial[event] = data
+                # Written under the lock so an older snapshot never overwrites a newer one
+                self._execute("UPDATE jobs SET partial = ? WHERE id = ? AND status = 'running'",
+                              (json.dumps(partial, default=str), job_id))
+
+        def finish():
+            with partial_lock:
+                finished[0] = True
+
+        try:
+            text, url, enable_ai, find_sources, enable_real_time_check = parse_analysis_request(request_data)
+            timings, profile = parse_trace_options(request_data)
+            if not ensure_models_loaded():
+                raise RuntimeError('System not ready - models failed to load')
+            result = analyze_input(text, url, enable_ai, find_sources, enable_real_time_check, emit=record_partial,
+                                   timings=timings, profile=profile)
+            finish()
+            self._execute(
+                "UPDATE jobs SET status = 'completed', result = ?, finished_at = ? WHERE id = ?",
+                (json.dumps(result, default=str), time.time(), job_id)
+            )
+            logger.info(f"✅ Analysis job {job_id} completed")
+        except Exception as e:
+            logger.error(f"❌ Analysis job {job_id} failed: {str(e)}")
+            finish()
+            self._execute(
+                "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                (str(e), time.time(), job_id)
+            )
+
+        if callback_url:
+            self._send_callback(job_id, callback_url)
+
+    def _send_callback(self, job_id, callback_url):
+        """POST the finished job to its callback URL (best effort, no retries)"""
+        try:
+            # Re-checked at send time: the name may resolve differently than at submission
+            validate_callback_url(callback_url)
+            response = http_client.post(callback_url, json=self.get(job_id), timeout=JOB_CALLBACK_TIMEOUT,
+                                        allow_redirects=False)
+            logger.info(f"📨 Job {job_id} callback answered {response.status_code}")
+        except Exception as e:
+            logger.warning(f"⚠️ Job {job_id} callback to {callback_url} failed: {str(e)}")
+
+def validate_callback_url(callback_url):
+    """Reject callback URLs that would make the server POST into its own network
+
+    The host must be on JOB_CALLBACK_ALLOWED_HOSTS when that is set, and must only
+    resolve to public addresses (no loopback, private, link-local or reserved ranges)."""
+    parsed = urlparse(callback_url)
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise AnalysisInputError('callback_url must be an http(s) URL')
+    host = parsed.hostname.lower()
+    if JOB_CALLBACK_ALLOWED_HOSTS and not any(
+        host == allowed or host.endswith('.' + allowed) for allowed in JOB_CALLBACK_ALLOWED_HOSTS
+    ):
+        raise AnalysisInputError('callback_url host is not allowed')
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, parsed.port or None, proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError, ValueError):
+        raise AnalysisInputError('callback_url host could not be resolved')
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+        if not ip.is_global or ip.is_multicast:
+            raise AnalysisInputError('callback_url must resolve to a public address')
+
+def _process_alive(pid):
+    """Whether a local process with this pid exists"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Queue an analysis (same body as /api/analyze, plus optional callback_url) and return its id at once"""
+    try:
+        if not ensure_models_loaded():
+            return jsonify({'error': 'System not ready - models failed to load'}), 503
+        data = request.get_json()
+        parse_analysis_request(data)
+        parse_trace_options(data)
+
+        if not isinstance(data.get('callback_url') or '', str):
+            raise AnalysisInputError('callback_url must be a string')
+        callback_url = (data.get('callback_url') or '').strip() or None
+        if callback_url:
+            validate_callback_url(callback_url)
+
+        request_data = {key: value for key, value in data.items() if key != 'callback_url'}
+        job_id = job_queue.submit(request_data, callback_url)
+        status_url = f"/api/jobs/{job_id}"
+        response = jsonify({'success': True, 'job_id': job_id, 'status': 'queued', 'status_url': status_url})
+        response.headers['Location'] = status_url
+        return response, 202
+
+    except AnalysisInputError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Job submission error: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Job status with partial results so far, and the full analysis once completed"""
+    if not ensure_models_loaded():
+        return jsonify({'error': 'System not ready - models failed to load'}), 503
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_batch():
+    """Batch scoring endpoint: ML classification and content quality for many texts at once"""
+    try:
+        if not ensure_models_loaded():
+            return jsonify({'error': 'System not ready - models failed to load'}), 503
+
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No data provided'}), 400
+
+        texts = data.get('texts')
+        if not isinstance(texts, list) or not texts:
+            return jsonify({'error': 'A non-empty list of texts must be provided'}), 400
+        if len(texts) > MAX_BATCH_SIZE:
+            return jsonify({'error': f'Batch too large (maximum {MAX_BATCH_SIZE} texts)'}), 400
+
+        # Validate every item up front, then score the valid ones in a single pass
+        results = [None] * len(texts)
+        valid_indices = []
+        valid_texts = []
+        for index, item in enumerate(texts):
+            text = item.strip() if isinstance(item, str) else ''
+            if len(text) < 10:
+                results[index] = {
+                    'index': index,
+                    'success': False,
+                    'error': 'Text too short for analysis (minimum 10 characters)'
+                }
+                continue
+            valid_indices.append(index)
+            valid_texts.append(text)
+
+        if valid_texts:
+            start_time = time.time()
+            scores = credibility_scorer.calculate_final_scores(valid_texts)
+            logger.info(f"📦 Scored batch of {len(valid_texts)} texts in {time.time() - start_time:.2f}s")
+            for index, credibility_result in zip(valid_indices, scores):
+                results[index] = {
+                    'index': index,
+                    'success': True,
+                    'analysis': credibility_result
+                }
+
+            # Optional named entities, one nlp.pipe pass over the batch
+            if data.get('entities'):
+                start_time = time.time()
+                batch_entities = credibility_scorer.analyzer.extract_entities_batch(valid_texts)
+                logger.info(f"🏷️ Extracted entities for {len(valid_texts)} texts in {time.time() - start_time:.2f}s")
+                for index, text_entities in zip(valid_indices, batch_entities):
+                    results[index]['entities'] = text_entities
+
+        return jsonify({
+            'success': True,
+            'count': len(texts),
+            'scored': len(valid_texts),
+            'results': results
+        })
+
+    except Exception as e:
+        logger.error(f"Batch analysis error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/extract/bulk', methods=['POST'])
+def extract_bulk():
+    """Bulk extraction endpoint: one NDJSON record per URL as soon as it is extracted
+
+    Body: {"urls": [...], "score": false, "entities": false}. Emits an article
+    event per URL (with an ML/content-quality analysis when score is set and
+    named entities when entities is set), then a summary."""
+    if not ensure_models_loaded():
+        return jsonify({'error': 'System not ready - models failed to load'}), 503
+
+    data = request.get_json()
+    if not data:
+        return jsonify({'error': 'No data provided'}), 400
+    urls = data.get('urls')
+    if not isinstance(urls, list) or not urls:
+        return jsonify({'error': 'A non-empty list of urls must be provided'}), 400
+    if len(urls) > MAX_BULK_URLS:
+        return jsonify({'error': f'Too many URLs (maximum {MAX_BULK_URLS})'}), 400
+    score = bool(data.get('score', False))
+    entities = bool(data.get('entities', False))
+
+    def generate():
+        start_time = time.time()
+        extracted = 0
+        try:
+            for record in bulk_extract(urls, score=score, entities=entities):
+                extracted += record['success']
+                yield json.dumps({'event': 'article', 'data': record}, default=str) + '\n'
+        except Exception as e:
+            logger.error(f"Bulk extraction error: {str(e)}")
+            yield json.dumps({'event': 'error', 'data': {'error': str(e), 'status': 500}}) + '\n'
+            return
+        elapsed = time.time() - start_time
+        logger.info(f"📚 Bulk extracted {extracted}/{len(urls)} URLs in {elapsed:.2f}s")
+        yield json.dumps({'event': 'summary', 'data': {
+            'count': len(urls),
+            'extracted': extracted,
+            'failed': len(urls) - extracted,
+            'scored': extracted if score else 0,
+            'elapsed': round(elapsed, 3)
+        }}) + '\n'
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    return Response(generate(), mimetype='application/x-ndjson', headers=headers)
+
 def _determine_final_assessment(credibility_result, real_time_verification):
     """Determine final credibility assessment combining all factors"""
     final_score = credibility_result.get('credibility_score', 0.5)
@@ -2246,11 +4962,14 @@ def health():
         },
         'capabilities': {
             'real_time_fact_checking': True,
-            'google_search_integration': SERPAPI_AVAILABLE or is_api_key_configured(GOOGLE_SEARCH_API_KEY),
+            'google_search_integration': is_api_key_configured(SERPAPI_KEY) or is_api_key_configured(GOOGLE_SEARCH_API_KEY),
             'ai_powered_verification': GEMINI_AVAILABLE and is_api_key_configured(GEMINI_API_KEY),
             'multi_source_verification': True,
             'credibility_scoring': True
         },
+        'nlp_pipeline': nlp.pipe_names if nlp else [],
+        'caches': {name: cache.stats() for name, cache in caches.items()},
+        'http_pool': http_client.stats(),
         'timestamp': datetime.now().isoformat()
     })
 
@@ -2273,5 +4992,9 @@ if __name__ == '__main__':
     else:
         print("❌ Failed to load models")
 
-# For gunicorn/production: Don't load models during import
-# Models will be loaded lazily on first request
+# For gunicorn/production: with PRELOAD_MODELS=true (set by gunicorn.conf.py) the
+# ML components load here, in the master, before workers fork; network clients are
+# created per worker by the post_fork hook. Otherwise everything loads lazily on
+# the first request via ensure_models_loaded().
+if PRELOAD_MODELS and __name__ != '__main__':
+    load_ml_components()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark claim extraction against the previous regex implementation.
+
+The legacy patterns ran with re.DOTALL over the whole article, so inputs with
+long letter/space runs or unterminated triggers backtracked super-linearly
+(cubic for the chained .*? patterns: a 4 KB page could take over a minute).
+ClaimExtractor segments sentences once and runs forward-only trigger searches.
+
+Usage:
+    python benchmarks/claim_extraction.py [--sizes 1000,2000,4000,16000,50000] [--legacy-max 2000]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import FACTUAL_CLAIM_EXTRACTOR, VERIFIABLE_CLAIM_EXTRACTOR
+
+# The patterns RealTimeFactChecker._extract_verifiable_claims used to run
+LEGACY_VERIFIABLE_PATTERNS = [
+    r'([A-Z][a-zA-Z\s]+(?:is dead|died|passed away|was killed|is alive|is living).*?)',
+    r'([A-Z][a-zA-Z\s]+(?:is the|is a|serves as|became).*?(?:Prime Minister|President|CEO|Minister|Chief|Director|Leader).*?)',
+    r'((?:yesterday|today|last week|this month|recently).*?(?:announced|declared|happened|occurred|died|was elected).*?)',
+    r'((?:killed|affected|saved|earned|lost|spent).*?\d+.*?(?:people|dollars|lives|years).*?)',
+    r'([A-Z][a-zA-Z\s]+(?:Company|Corporation|Inc\.|Ltd\.).*?(?:announced|reported|filed|launched).*?)',
+    r'((?:in|at)\s+[A-Z][a-zA-Z\s]+.*?(?:earthquake|fire|explosion|attack|election|protest).*?)',
+    r'([A-Z][a-zA-Z\s]+(?:age|aged|years old|born in).*?\d+.*?)',
+    r'((?:scientists|researchers|doctors|studies).*?(?:discovered|found|proved|showed|revealed).*?)'
+]
+
+# The patterns FactVerificationSystem._extract_factual_claims used to run
+LEGACY_FACTUAL_PATTERNS = [
+    r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is dead|died|passed away|killed).*?(?:yesterday|today|ago|recently))',
+    r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is|was|became).*?(?:Prime Minister|President|CEO|Minister|Chief).*?)',
+    r'((?:killed|murdered|saved|affected).*?\d+.*?(?:people|persons|individuals))',
+    r'((?:just|recently|yesterday|today|last week).*?(?:happened|occurred|announced|declared).*?)',
+    r'([A-Z][a-z]+.*?(?:company|corporation|organization).*?(?:announced|declared|reported).*?)',
+    r'((?:scientists|researchers|doctors).*?(?:discovered|found|proved|showed).*?)',
+    r'((?:in|at) [A-Z][a-z]+.*?(?:election|war|conflict|disaster|earthquake).*?)'
+]
+
+ARTICLE_SENTENCES = (
+    "Officials said yesterday that the committee announced a review of the budget. "
+    "The storm killed 12 people and affected 4,000 residents in the coastal district. "
+    "Researchers at the institute found that the treatment showed promising results. "
+    "The company reported quarterly earnings above expectations on Tuesday. "
+    "Local reporters in Springfield covered the election campaign for weeks. "
+)
+
+
+def pathological_inputs(size):
+    """Inputs that make the legacy patterns backtrack, plus a realistic scraped page"""
+    return {
+        # One huge letter/space run: every [A-Z][a-zA-Z\s]+ start rescans to the end
+        'letter_run': ('Lorem ipsum dolor sit amet ' * (size // 27 + 1))[:size],
+        # Unterminated triggers: every lazy .*? scans to the end looking for the second half
+        'open_triggers': ('yesterday killed 7 scientists in Paris ' * (size // 39 + 1))[:size],
+        # Capitalised words with no sentence punctuation (navigation menus, tag clouds)
+        'title_case': ('Home News World Business Sport Opinion ' * (size // 39 + 1))[:size],
+        'article': (ARTICLE_SENTENCES * (size // len(ARTICLE_SENTENCES) + 1))[:size],
+    }
+
+
+def legacy_extract(text):
+    """Pattern passes of both legacy extractors (sentence keyword scans are cheap and omitted)"""
+    for pattern in LEGACY_VERIFIABLE_PATTERNS:
+        re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
+    for pattern in LEGACY_FACTUAL_PATTERNS:
+        re.findall(pattern, text, re.IGNORECASE)
+
+
+def current_extract(text):
+    VERIFIABLE_CLAIM_EXTRACTOR.extract(text)
+    FACTUAL_CLAIM_EXTRACTOR.extract(text)
+
+
+def time_call(func, text, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark claim extraction on pathological inputs")
+    parser.add_argument('--sizes', default='1000,2000,4000,16000,50000',
+                        help='Comma-separated input sizes in characters')
+    parser.add_argument('--legacy-max', type=int, default=2000,
+                        help='Largest size to run the legacy patterns on (they blow up quickly)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    print(f"{'input':<14}{'size':>8}{'legacy ms':>12}{'current ms':>12}")
+    for size in sizes:
+        for name, text in pathological_inputs(size).items():
+            legacy = time_call(legacy_extract, text, 1) if size <= args.legacy_max else None
+            current = time_call(current_extract, text, args.repeat)
+            legacy_column = f"{legacy:12.1f}" if legacy is not None else f"{'skipped':>12}"
+            print(f"{name:<14}{size:>8}{legacy_column}{current:12.2f}")
+
+
+if __name__ == "__main__":
+    main()
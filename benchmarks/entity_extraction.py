@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark named-entity extraction throughput (documents per second).
+
+Compares the full en_core_web_sm pipeline called once per document with the
+trimmed pipeline app.py loads (NER + sentencizer only, SPACY_EXCLUDE) run
+through nlp.pipe in batches, as the batch and bulk endpoints do.
+
+Usage:
+    python benchmarks/entity_extraction.py [--docs 500] [--batch-sizes 16,64,256] [--n-process 1]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app
+
+ARTICLE = (
+    "President Joe Biden met Prime Minister Rishi Sunak in Washington on Tuesday. "
+    "Apple Inc. reported $89.5 billion in revenue, while Microsoft announced a new "
+    "data centre in Dublin. The United Nations said 4,000 people were affected by "
+    "the flooding in Pakistan last week. "
+)
+
+
+def entity_sets(docs):
+    return [sorted((ent.text, ent.label_) for ent in doc.ents) for doc in docs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark spaCy entity extraction")
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--batch-sizes', default='16,64,256')
+    parser.add_argument('--n-process', type=int, default=1)
+    args = parser.parse_args()
+
+    if not app.SPACY_AVAILABLE:
+        print(f"❌ spaCy model {app.SPACY_MODEL} is not installed")
+        sys.exit(1)
+
+    import spacy
+    texts = [f"{ARTICLE * (1 + index % 4)} Report {index}." for index in range(args.docs)]
+
+    full = spacy.load(app.SPACY_MODEL)
+    print(f"Full pipeline:    {', '.join(full.pipe_names)}")
+    print(f"Trimmed pipeline: {', '.join(app.nlp.pipe_names)}")
+
+    start = time.perf_counter()
+    expected = entity_sets(full(text) for text in texts)
+    baseline = args.docs / (time.perf_counter() - start)
+    print(f"{'full, nlp(text) per doc':>32}: {baseline:8.1f} docs/s")
+
+    for batch_size in [int(size) for size in args.batch_sizes.split(',')]:
+        start = time.perf_counter()
+        actual = entity_sets(app.nlp.pipe(texts, batch_size=batch_size, n_process=args.n_process))
+        rate = args.docs / (time.perf_counter() - start)
+        mismatches = sum(1 for left, right in zip(expected, actual) if left != right)
+        print(f"{f'trimmed, pipe(batch_size={batch_size})':>32}: {rate:8.1f} docs/s "
+              f"({rate / baseline:.1f}x, {mismatches} docs with different entities)")
+
+
+if __name__ == "__main__":
+    main()
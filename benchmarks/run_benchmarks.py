@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Offline micro-benchmarks for the analysis hot paths.
+
+Runs in-process (no server, no network) over a fixed, generated corpus of
+short, medium and very long articles, and times each stage function on every
+size. Results are written as JSON; when a baseline exists the best (min)
+round times are compared against it. A benchmark slower by more than
+--tolerance is re-timed --confirm more times, and the run fails only if the
+slowdown holds every time (single runs on a shared machine are noisy).
+
+Usage:
+    python benchmarks/run_benchmarks.py [--output benchmarks/results.json]
+                                        [--baseline benchmarks/baseline.json]
+                                        [--save-baseline] [--tolerance 0.25] [--confirm 2]
+                                        [--only claims] [--no-textstat]
+
+Record a baseline on the machine that runs the comparison (timings are not
+portable between machines), e.g. before a change:
+    python benchmarks/run_benchmarks.py --save-baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import app
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PARAGRAPHS = (
+    "Officials said yesterday that the committee announced a review of the 2024 budget, "
+    "according to a statement released by the ministry. ",
+    "The storm killed 12 people and affected 4,000 residents in the coastal district, "
+    "the regional government confirmed on Tuesday. ",
+    "Researchers at the institute found that the treatment showed a 45% improvement in "
+    "a peer-reviewed study published in the journal. ",
+    "\"We are monitoring the situation closely,\" said Maria Lopez, a spokesperson for the agency. ",
+    "Acme Corporation reported quarterly earnings of $3.2 billion and launched a new product line. ",
+    "Local reporters in Springfield covered the election campaign for weeks before the vote. ",
+    "Shocking secret they don't want you to know: miracle cure revealed, doctors hate it!!! ",
+)
+
+# Corpus sizes in characters: a headline, a typical article, a long scraped page
+SIZES = {'short': 200, 'medium': 4000, 'long': 60000}
+
+SOURCE_DOMAINS = (
+    'reuters.com', 'www.bbc.com', 'apnews.com', 'nytimes.com', 'example-blog.net',
+    'news.example.org', 'www.theguardian.com', 'local-paper.com', 'aggregator.io'
+)
+
+
+def build_corpus():
+    """Deterministic article text for each size"""
+    corpus = {}
+    for name, size in SIZES.items():
+        parts = []
+        length = 0
+        index = 0
+        while length < size:
+            paragraph = PARAGRAPHS[index % len(PARAGRAPHS)].replace('2024', str(2000 + index % 25))
+            parts.append(paragraph)
+            length += len(paragraph)
+            index += 1
+        corpus[name] = ''.join(parts)[:size]
+    return corpus
+
+
+def build_html(text):
+    """Wrap an article in the boilerplate of a typical news page"""
+    paragraphs = ''.join(f"<p>{sentence.strip()}.</p>" for sentence in text.split('.') if sentence.strip())
+    navigation = ''.join(f'<li><a href="/section/{index}">Section {index}</a></li>' for index in range(60))
+    return (
+        "<html><head><title>Benchmark article</title>"
+        "<script>window.analytics = {track: function() {}};</script>"
+        "<style>body { font-family: serif; }</style></head><body>"
+        f"<nav><ul>{navigation}</ul></nav>"
+        f"<div class=\"page\"><article class=\"article-body\">{paragraphs}</article>"
+        "<aside>Related stories</aside></div>"
+        "<footer>Copyright</footer></body></html>"
+    ).encode('utf-8')
+
+
+def build_sources(count):
+    """Search results as _filter_and_rank_sources receives them"""
+    return [{
+        'title': f"Committee announces budget review {index}" if index % 7 else "Latest news home page",
+        'url': f"https://{SOURCE_DOMAINS[index % len(SOURCE_DOMAINS)]}/2024/story-{index % (count // 2 or 1)}",
+        'snippet': "Officials said the committee announced a review of the budget.",
+        'source': SOURCE_DOMAINS[index % len(SOURCE_DOMAINS)]
+    } for index in range(count)]
+
+
+def build_benchmarks(corpus):
+    """{name: {size: zero-argument callable}}
+
+    Every call gets a plain str, so per-request parsing is part of each timing."""
+    scorer = app.credibility_scorer
+    analyzer = scorer.analyzer
+    checker = app.RealTimeFactChecker()
+    finder = app.NewsSourceFinder()
+    extractor = app.ArticleExtractor()
+
+    benchmarks = {
+        'preprocess_text': {},
+        'get_ml_prediction': {},
+        'analyze_content_quality': {},
+        'detect_factual_statements': {},
+        'extract_verifiable_claims': {},
+        'extract_search_terms': {},
+        'filter_and_rank_sources': {},
+        'parse_article_html': {},
+    }
+    for size, text in corpus.items():
+        html = build_html(text)
+        sources = build_sources({'short': 10, 'medium': 50, 'long': 500}[size])
+        benchmarks['preprocess_text'][size] = lambda text=text: app.preprocess_text(text)
+        benchmarks['get_ml_prediction'][size] = lambda text=text: scorer.get_ml_prediction(text)
+        benchmarks['analyze_content_quality'][size] = lambda text=text: analyzer.analyze_content_quality(text)
+        benchmarks['detect_factual_statements'][size] = lambda text=text: scorer._detect_factual_statements(text)
+        benchmarks['extract_verifiable_claims'][size] = lambda text=text: checker._extract_verifiable_claims(text)
+        benchmarks['extract_search_terms'][size] = lambda text=text: finder._extract_search_terms(text)
+        benchmarks['filter_and_rank_sources'][size] = lambda sources=sources: finder._filter_and_rank_sources(sources)
+        benchmarks['parse_article_html'][size] = lambda html=html: extractor._parse_with_lxml(html)
+    return benchmarks
+
+
+def time_benchmark(func, repeat, min_time):
+    """Per-call seconds for each of `repeat` rounds, each round lasting at least min_time"""
+    func()  # Warm up caches and lazy imports
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or iterations >= 1_000_000:
+            break
+        iterations *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    rounds = [elapsed / iterations]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        rounds.append((time.perf_counter() - start) / iterations)
+    return rounds, iterations
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def slowdown(result, reference):
+    """Ratio of best round times, current over baseline"""
+    return result['min_ms'] / reference['min_ms'] if reference['min_ms'] else float('inf')
+
+
+def compare(results, baseline, tolerance, retime, confirm):
+    """Print min-time ratios against the baseline; returns the names that regressed
+
+    A benchmark past the tolerance is re-timed `confirm` times with retime(name)
+    and only counts as a regression if every re-run is past the tolerance too."""
+    regressions = []
+    print(f"\n{'benchmark':<42}{'baseline ms':>13}{'current ms':>13}{'ratio':>8}")
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            print(f"{name:<42}{'-':>13}{result['min_ms']:13.3f}{'new':>8}")
+            continue
+        ratio = slowdown(result, reference)
+        best_ms = result['min_ms']
+        flag = ''
+        if ratio > 1 + tolerance:
+            first_ratio = ratio
+            for _ in range(confirm):
+                best_ms = min(best_ms, retime(name)['min_ms'])
+                ratio = slowdown({'min_ms': best_ms}, reference)
+                if ratio <= 1 + tolerance:
+                    flag = f'  (noise: {first_ratio:.2f} on first run)'
+                    break
+            else:
+                regressions.append(name)
+                flag = f'  ❌ regression ({confirm + 1} runs)'
+        elif ratio < 1 - tolerance:
+            flag = '  ✅ faster'
+        print(f"{name:<42}{reference['min_ms']:13.3f}{best_ms:13.3f}{ratio:8.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis hot paths in-process")
+    parser.add_argument('--output', default=os.path.join(BENCHMARK_DIR, 'results.json'))
+    parser.add_argument('--baseline', default=os.path.join(BENCHMARK_DIR, 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help='Also write the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown of the best round before a benchmark counts as a regression')
+    parser.add_argument('--confirm', type=int, default=2,
+                        help='Re-timings that must all exceed the tolerance before a slowdown fails the run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per timing round')
+    parser.add_argument('--only', help='Run only benchmarks whose name contains this string')
+    parser.add_argument('--no-textstat', action='store_true',
+                        help='Skip textstat readability (it dominates analyze_content_quality)')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)  # Stage functions log per call
+    if args.no_textstat:
+        app.TEXTSTAT_AVAILABLE = False
+    if not app.load_ml_components():
+        print("❌ Failed to load the ML model")
+        sys.exit(1)
+
+    corpus = build_corpus()
+    results = {}
+    funcs = {}
+    print(f"{'benchmark':<42}{'median ms':>12}{'min ms':>12}{'iterations':>12}")
+    for name, sizes in build_benchmarks(corpus).items():
+        if args.only and args.only not in name:
+            continue
+        for size, func in sizes.items():
+            rounds, iterations = time_benchmark(func, args.repeat, args.min_time)
+            key = f"{name}/{size}"
+            funcs[key] = func
+            results[key] = {
+                'median_ms': statistics.median(rounds) * 1000,
+                'min_ms': min(rounds) * 1000,
+                'iterations': iterations,
+                'rounds': args.repeat,
+                'input_chars': len(corpus[size])
+            }
+            print(f"{key:<42}{results[key]['median_ms']:12.3f}{results[key]['min_ms']:12.3f}{iterations:12d}")
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'model_format': app.MODEL_FORMAT,
+        'textstat': app.TEXTSTAT_AVAILABLE,
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline saved to {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        def retime(key):
+            rounds, _ = time_benchmark(funcs[key], args.repeat, args.min_time)
+            return {'min_ms': min(rounds) * 1000}
+
+        regressions = compare(results, baseline['results'], args.tolerance, retime, args.confirm)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%} (baseline from commit {baseline.get('commit')})")
+    else:
+        print(f"ℹ️ No baseline at {args.baseline}; run with --save-baseline to create one")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Export the pickled TF-IDF vectorizer and classifier to flat NumPy arrays.
+
+The export is a directory of .npy files plus a meta.json that app.py
+memory-maps at startup (MODEL_FORMAT=auto|arrays), so workers skip
+unpickling the vocabulary dict and share the model pages after fork.
+
+Usage:
+    python export_model.py [--model fake_news_model.pkl]
+                           [--vectorizer tfidf_vectorizer.pkl]
+                           [--output model_artifacts] [--verify-sample 200]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+
+import numpy as np
+
+
+def export_vectorizer(vectorizer, output_dir):
+    """Write the vocabulary (sorted byte strings + column ids) and IDF vector"""
+    if vectorizer.analyzer != 'word' or vectorizer.preprocessor is not None or vectorizer.tokenizer is not None:
+        raise ValueError("Only the default word analyzer can be exported")
+    if vectorizer.strip_accents is not None:
+        raise ValueError("strip_accents is not supported by the array vectorizer")
+    if vectorizer.norm not in ('l1', 'l2', None):
+        raise ValueError(f"Unsupported norm: {vectorizer.norm}")
+
+    terms = sorted(vectorizer.vocabulary_.items())
+    encoded = [term.encode('utf-8') for term, _ in terms]
+    term_width = max(len(term) for term in encoded)
+    vocab_terms = np.array(encoded, dtype=f'S{term_width}')
+    vocab_columns = np.array([column for _, column in terms], dtype=np.int32)
+
+    # Byte order must agree with np.searchsorted on the S dtype
+    if not np.all(vocab_terms[:-1] < vocab_terms[1:]):
+        order = np.argsort(vocab_terms)
+        vocab_terms, vocab_columns = vocab_terms[order], vocab_columns[order]
+
+    np.save(os.path.join(output_dir, 'vocab_terms.npy'), vocab_terms)
+    np.save(os.path.join(output_dir, 'vocab_columns.npy'), vocab_columns)
+    if vectorizer.use_idf:
+        np.save(os.path.join(output_dir, 'idf.npy'), np.asarray(vectorizer.idf_, dtype=np.float64))
+
+    stop_words = vectorizer.get_stop_words()
+    return {
+        'lowercase': bool(vectorizer.lowercase),
+        'token_pattern': vectorizer.token_pattern,
+        'ngram_range': list(vectorizer.ngram_range),
+        'stop_words': sorted(stop_words) if stop_words else None,
+        'binary': bool(vectorizer.binary),
+        'sublinear_tf': bool(vectorizer.sublinear_tf),
+        'use_idf': bool(vectorizer.use_idf),
+        'norm': vectorizer.norm,
+        'n_features': len(vectorizer.vocabulary_),
+        'term_width': term_width
+    }
+
+
+def export_forest(model, output_dir):
+    """Concatenate every tree's node arrays, with child pointers made global"""
+    offsets = [0]
+    children_left, children_right, feature, threshold, leaf_proba = [], [], [], [], []
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        offset = offsets[-1]
+        left = tree.children_left.astype(np.int64)
+        right = tree.children_right.astype(np.int64)
+        children_left.append(np.where(left == -1, -1, left + offset))
+        children_right.append(np.where(right == -1, -1, right + offset))
+        feature.append(tree.feature.astype(np.int32))
+        threshold.append(tree.threshold.astype(np.float64))
+        # Same normalisation as DecisionTreeClassifier.predict_proba
+        values = tree.value[:, 0, :].astype(np.float64)
+        normalizer = values.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        leaf_proba.append(values / normalizer)
+        offsets.append(offset + tree.node_count)
+
+    np.save(os.path.join(output_dir, 'tree_offsets.npy'), np.array(offsets, dtype=np.int64))
+    np.save(os.path.join(output_dir, 'children_left.npy'), np.concatenate(children_left))
+    np.save(os.path.join(output_dir, 'children_right.npy'), np.concatenate(children_right))
+    np.save(os.path.join(output_dir, 'feature.npy'), np.concatenate(feature))
+    np.save(os.path.join(output_dir, 'threshold.npy'), np.concatenate(threshold))
+    np.save(os.path.join(output_dir, 'leaf_proba.npy'), np.concatenate(leaf_proba))
+    return {
+        'type': 'random_forest',
+        'n_trees': len(model.estimators_),
+        'n_nodes': offsets[-1]
+    }
+
+
+def export_linear(model, output_dir):
+    """Write coefficient and intercept arrays of a logistic-regression style model"""
+    np.save(os.path.join(output_dir, 'coef.npy'), np.asarray(model.coef_, dtype=np.float64))
+    np.save(os.path.join(output_dir, 'intercept.npy'), np.asarray(model.intercept_, dtype=np.float64))
+    return {'type': 'linear'}
+
+
+def export_model(model, output_dir, n_features):
+    """Dispatch on the classifier type"""
+    if hasattr(model, 'estimators_') and hasattr(model.estimators_[0], 'tree_'):
+        meta = export_forest(model, output_dir)
+    elif hasattr(model, 'coef_') and hasattr(model, 'predict_proba'):
+        meta = export_linear(model, output_dir)
+    else:
+        raise ValueError(f"Unsupported model type: {type(model).__name__}")
+    meta['classes'] = model.classes_.tolist()
+    meta['n_features'] = n_features
+    return meta
+
+
+def verify_export(model, vectorizer, output_dir, sample_size):
+    """Compare predict_proba of the export against the pickles on vocabulary-derived documents"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from app import load_array_artifacts
+
+    array_model, array_vectorizer = load_array_artifacts(output_dir)
+    rng = np.random.default_rng(42)
+    vocabulary = list(vectorizer.vocabulary_)
+    documents = [
+        ' '.join(rng.choice(vocabulary, size=rng.integers(5, 200)))
+        for _ in range(sample_size)
+    ]
+
+    expected_matrix = vectorizer.transform(documents)
+    actual_matrix = array_vectorizer.transform(documents)
+    matrix_error = abs(expected_matrix - actual_matrix).max() if expected_matrix.nnz else 0.0
+
+    expected = model.predict_proba(expected_matrix)
+    actual = array_model.predict_proba(actual_matrix)
+    proba_error = float(np.abs(expected - actual).max())
+    return float(matrix_error), proba_error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export model pickles to memory-mappable arrays")
+    parser.add_argument('--model', default='fake_news_model.pkl')
+    parser.add_argument('--vectorizer', default='tfidf_vectorizer.pkl')
+    parser.add_argument('--output', default='model_artifacts')
+    parser.add_argument('--verify-sample', type=int, default=200,
+                        help='Number of synthetic documents used to verify the export (0 to skip)')
+    args = parser.parse_args()
+
+    with open(args.model, 'rb') as f:
+        model = pickle.load(f)
+    with open(args.vectorizer, 'rb') as f:
+        vectorizer = pickle.load(f)
+
+    os.makedirs(args.output, exist_ok=True)
+    print(f"📦 Exporting {type(vectorizer).__name__} + {type(model).__name__} to {args.output}/")
+
+    vectorizer_meta = export_vectorizer(vectorizer, args.output)
+    model_meta = export_model(model, args.output, vectorizer_meta['n_features'])
+    with open(os.path.join(args.output, 'meta.json'), 'w') as f:
+        json.dump({'format_version': 1, 'vectorizer': vectorizer_meta, 'model': model_meta}, f, indent=2)
+
+    total_bytes = sum(
+        os.path.getsize(os.path.join(args.output, name)) for name in os.listdir(args.output)
+    )
+    print(f"✅ Wrote {len(os.listdir(args.output))} files ({total_bytes / 1024 / 1024:.1f} MB)")
+
+    if args.verify_sample:
+        matrix_error, proba_error = verify_export(model, vectorizer, args.output, args.verify_sample)
+        print(f"🔍 Max TF-IDF difference: {matrix_error:.2e}, max probability difference: {proba_error:.2e}")
+        if proba_error > 1e-9:
+            print("❌ Exported model does not reproduce the pickled model")
+            sys.exit(1)
+        print("✅ Export reproduces the pickled model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the external providers, for offline load testing.
+
+One stdlib HTTP server answers in the response shapes app.py consumes:
+
+    /serpapi/search.json          SerpAPI Google results (organic_results)
+    /google/customsearch/v1       Google Custom Search JSON API (items)
+    .../models/<model>:generateContent
+                                  Gemini REST (google-generativeai, transport='rest')
+    /news/rss/search              Google News RSS feed
+    /sites/<domain>/search        Search pages of the directly queried news sites
+    /articles/<id>                Article pages (ETag/Last-Modified, answers 304)
+    /_stats                       Request, error and latency counters per provider
+
+Each provider gets a latency distribution and an error rate, so the whole
+pipeline's throughput and tail latency can be measured without paid quota
+or network variance. Point app.py at it with the environment printed on
+startup (SERPAPI_BASE_URL, GOOGLE_CSE_BASE_URL, GEMINI_BASE_URL, ...).
+
+Usage:
+    python fake_providers.py [--port 8765] [--latency gemini=lognormal:1500:0.5]
+                             [--latency fixed:50] [--error-rate 0.02]
+                             [--error-rate serpapi=0.1] [--seed 1]
+
+Latency specs: fixed:MS, uniform:LOW:HIGH, lognormal:MEDIAN:SIGMA, exp:MEAN
+(all in milliseconds; a bare number means fixed). Without a provider= prefix
+a --latency/--error-rate applies to every provider.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+PROVIDERS = ('serpapi', 'google_cse', 'gemini', 'news', 'sites', 'articles')
+
+# Roughly what the real services take from a well-connected server
+DEFAULT_LATENCY = {
+    'serpapi': 'lognormal:600:0.4',
+    'google_cse': 'lognormal:300:0.4',
+    'gemini': 'lognormal:1500:0.5',
+    'news': 'lognormal:250:0.5',
+    'sites': 'lognormal:400:0.5',
+    'articles': 'lognormal:200:0.6',
+}
+
+PARAGRAPHS = (
+    "Officials said yesterday that the committee announced a review of the budget, "
+    "according to a statement released by the ministry.",
+    "The storm killed 12 people and affected 4,000 residents in the coastal district, "
+    "the regional government confirmed on Tuesday.",
+    "Researchers at the institute found that the treatment showed a 45% improvement in "
+    "a peer-reviewed study published in the journal.",
+    "\"We are monitoring the situation closely,\" said Maria Lopez, a spokesperson for the agency.",
+    "Acme Corporation reported quarterly earnings of $3.2 billion and launched a new product line.",
+    "Shocking secret they don't want you to know: miracle cure revealed, doctors hate it!",
+)
+
+VERDICTS = ('TRUE', 'FALSE', 'PARTIALLY_TRUE', 'INSUFFICIENT_INFO')
+
+
+def parse_latency(spec):
+    """Latency spec -> zero-argument sampler returning seconds"""
+    parts = spec.split(':')
+    kind, values = (parts[0], [float(value) for value in parts[1:]]) if len(parts) > 1 else ('fixed', [float(spec)])
+    if kind == 'fixed':
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'lognormal':
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(0, sigma) * median / 1000
+    if kind == 'exp':
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def parse_overrides(items, parse_value):
+    """['gemini=SPEC', 'SPEC'] -> {provider: value} (unprefixed items apply to all)"""
+    overrides = {}
+    for item in items or []:
+        provider, _, value = item.rpartition('=')
+        if provider and provider not in PROVIDERS:
+            raise ValueError(f"Unknown provider {provider!r} (expected one of {', '.join(PROVIDERS)})")
+        for name in ([provider] if provider else PROVIDERS):
+            overrides[name] = parse_value(value)
+    return overrides
+
+
+class FakeProviderServer:
+    """Threaded HTTP server with per-provider latency, error injection and counters"""
+
+    def __init__(self, host='127.0.0.1', port=8765, latency=None, error_rate=None, seed=None):
+        self.latency = {name: parse_latency(DEFAULT_LATENCY[name]) for name in PROVIDERS}
+        self.latency.update(latency or {})
+        self.error_rate = {name: 0.0 for name in PROVIDERS}
+        self.error_rate.update(error_rate or {})
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {name: {'requests': 0, 'errors': 0, 'not_modified': 0, 'latency_total': 0.0}
+                      for name in PROVIDERS}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def environment(self):
+        """Environment variables that point app.py at this server"""
+        base = self.base_url
+        return {
+            'SERPAPI_BASE_URL': f"{base}/serpapi",
+            'SERPAPI_KEY': 'fake-serpapi-key',
+            'GOOGLE_CSE_BASE_URL': f"{base}/google",
+            'GOOGLE_NEWS_BASE_URL': f"{base}/news",
+            'NEWS_SITES_BASE_URL': f"{base}/sites",
+            'GEMINI_BASE_URL': base,
+            'GEMINI_API_KEY': 'fake-gemini-key',
+        }
+
+    def article_url(self, article_id):
+        return f"{self.base_url}/articles/{article_id}"
+
+    def start(self):
+        """Serve on a background thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: dict(counters, latency_mean=counters['latency_total'] / counters['requests']
+                           if counters['requests'] else 0.0)
+                for name, counters in self.stats.items()
+            }
+
+    def _delay(self, provider):
+        """Sleep for this provider's sampled latency; returns True when the call should fail"""
+        with self.lock:
+            delay = max(0.0, self.latency[provider](self.random))
+            failed = self.random.random() < self.error_rate[provider]
+            counters = self.stats[provider]
+            counters['requests'] += 1
+            counters['errors'] += failed
+            counters['latency_total'] += delay
+        time.sleep(delay)
+        return failed
+
+    def _error_status(self):
+        with self.lock:
+            return self.random.choice((429, 500, 503))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._dispatch()
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.body = self.rfile.read(length) if length else b''
+                self._dispatch()
+
+            def _dispatch(self):
+                parsed = urlparse(self.path)
+                path = parsed.path
+                query = {name: values[0] for name, values in parse_qs(parsed.query).items()}
+                if path == '/_stats':
+                    return self._send_json(200, server.snapshot())
+                if path.endswith(':generateContent'):
+                    return self._route('gemini', server._gemini, query)
+                for prefix, provider, handler in (
+                    ('/serpapi/search.json', 'serpapi', server._serpapi),
+                    ('/google/customsearch/v1', 'google_cse', server._google_cse),
+                    ('/news/rss/search', 'news', server._news_rss),
+                    ('/sites/', 'sites', server._site_search),
+                    ('/articles/', 'articles', server._article),
+                ):
+                    if path.startswith(prefix):
+                        return self._route(provider, handler, query)
+                self._send(404, b'Not found', 'text/plain')
+
+            def _route(self, provider, handler, query):
+                if server._delay(provider):
+                    status = server._error_status()
+                    return self._send_json(status, {'error': {'code': status, 'message': 'Injected failure'}})
+                handler(self, query)
+
+            def _send(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body and self.command != 'HEAD':
+                    self.wfile.write(body)
+
+            def _send_json(self, status, data):
+                self._send(status, json.dumps(data).encode('utf-8'), 'application/json')
+
+        return Handler
+
+    def _results(self, query, count):
+        """Search hits whose titles repeat the query terms, linking to fake articles"""
+        terms = ' '.join(query.split()) or 'news'
+        with self.lock:
+            article_ids = [self.random.randrange(100000) for _ in range(count)]
+        return [{
+            'title': f"{terms.title()} - report {article_id}",
+            'link': self.article_url(article_id),
+            'snippet': PARAGRAPHS[article_id % len(PARAGRAPHS)]
+        } for article_id in article_ids]
+
+    def _serpapi(self, handler, query):
+        results = self._results(query.get('q', ''), int(query.get('num', 5)))
+        handler._send_json(200, {
+            'search_metadata': {'status': 'Success'},
+            'organic_results': [dict(result, position=index + 1) for index, result in enumerate(results)]
+        })
+
+    def _google_cse(self, handler, query):
+        results = self._results(query.get('q', ''), int(query.get('num', 5)))
+        handler._send_json(200, {'kind': 'customsearch#search', 'items': results})
+
+    def _news_rss(self, handler, query):
+        items = ''.join(
+            f"<item><title>{result['title']}</title><link>{result['link']}</link>"
+            f"<description>{result['snippet']}</description>"
+            f"<pubDate>{formatdate(usegmt=True)}</pubDate><source url=\"{self.base_url}\">Fake Wire</source></item>"
+            for result in self._results(query.get('q', '').replace('+', ' '), 10)
+        )
+        body = f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{items}</channel></rss>'
+        handler._send(200, body.encode('utf-8'), 'application/rss+xml')
+
+    def _site_search(self, handler, query):
+        domain = unquote(urlparse(handler.path).path[len('/sites/'):].split('/', 1)[0])
+        links = ''.join(
+            f'<li><a href="https://www.{domain}/article/{quote(query.get("q", "news"))}-{index}">'
+            f'{query.get("q", "news")} story {index}</a></li>'
+            for index in range(5)
+        )
+        handler._send(200, f"<html><body><ul>{links}</ul></body></html>".encode('utf-8'), 'text/html')
+
+    def _article(self, handler, query):
+        article_id = urlparse(handler.path).path[len('/articles/'):].strip('/') or '0'
+        etag = f'"article-{article_id}-v1"'
+        if handler.headers.get('If-None-Match') == etag:
+            with self.lock:
+                self.stats['articles']['not_modified'] += 1
+            return handler._send(304, b'', 'text/html', {'ETag': etag})
+
+        seed = sum(map(ord, article_id))
+        paragraphs = int(query.get('paragraphs', 4 + seed % 20))
+        body_html = ''.join(f"<p>{PARAGRAPHS[(seed + index) % len(PARAGRAPHS)]}</p>" for index in range(paragraphs))
+        page = (
+            f"<html><head><title>Fake article {article_id}</title></head><body>"
+            "<nav><a href=\"/\">Home</a></nav>"
+            f"<article>{body_html}</article><footer>Fake Wire</footer></body></html>"
+        )
+        handler._send(200, page.encode('utf-8'), 'text/html; charset=utf-8', {
+            'ETag': etag,
+            'Last-Modified': formatdate(1700000000 + seed, usegmt=True),
+        })
+
+    def _gemini(self, handler, query):
+        try:
+            request_body = json.loads(getattr(handler, 'body', b'') or b'{}')
+            prompt = ' '.join(
+                part.get('text', '')
+                for content in request_body.get('contents', [])
+                for part in content.get('parts', [])
+            )
+        except ValueError:
+            prompt = ''
+        with self.lock:
+            verdict = self.random.choice(VERDICTS)
+            confidence = round(self.random.uniform(0.5, 0.95), 2)
+
+        if 'VERIFICATION_STATUS' in prompt:
+            text = (
+                f"VERIFICATION_STATUS: {verdict}\nCONFIDENCE_SCORE: {confidence}\n"
+                "EXPLANATION: Simulated assessment from the local stand-in.\n"
+                "CURRENT_FACTS: No real facts were consulted.\nCONTRADICTIONS: None\n"
+                "RELIABILITY_NOTES: Synthetic search results."
+            )
+        elif 'STATUS:' in prompt:
+            text = (
+                f"STATUS: {verdict.replace('INSUFFICIENT_INFO', 'UNCLEAR')}\nCONFIDENCE: {confidence}\n"
+                "EXPLANATION: Simulated assessment from the local stand-in.\nFACTS: No real facts were consulted."
+            )
+        else:
+            text = json.dumps({
+                'summary': 'Simulated summary of the article from the local stand-in.',
+                'credibility_assessment': {'TRUE': 'True', 'FALSE': 'False'}.get(verdict, 'Mixed'),
+                'key_points': ['First simulated point', 'Second simulated point', 'Third simulated point'],
+                'entities': ['Maria Lopez', 'Acme Corporation'],
+                'fact_check_reasoning': 'Synthetic response for load testing.',
+                'related_topics': ['Budget', 'Weather']
+            })
+
+        handler._send_json(200, {
+            'candidates': [{
+                'content': {'parts': [{'text': text}], 'role': 'model'},
+                'finishReason': 1 if 'enum-encoding=int' in unquote(urlparse(handler.path).query) else 'STOP',
+                'index': 0,
+                'safetyRatings': []
+            }],
+            'promptFeedback': {'safetyRatings': []}
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake SerpAPI/CSE/Gemini/news responses for load testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', action='append', metavar='[PROVIDER=]SPEC',
+                        help='Latency distribution, e.g. gemini=lognormal:1500:0.5 (repeatable)')
+    parser.add_argument('--error-rate', action='append', metavar='[PROVIDER=]RATE',
+                        help='Fraction of calls answered with 429/500/503 (repeatable)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible latencies and failures')
+    args = parser.parse_args()
+
+    server = FakeProviderServer(
+        args.host,
+        args.port,
+        latency=parse_overrides(args.latency, parse_latency),
+        error_rate=parse_overrides(args.error_rate, float),
+        seed=args.seed
+    )
+    print(f"🧪 Fake providers listening on {server.base_url}")
+    print("   Point the app at them with:")
+    for name, value in server.environment().items():
+        print(f"   export {name}={value}")
+    print(f"   Article URLs: {server.article_url('<id>')}    Counters: {server.base_url}/_stats")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Gunicorn configuration for the Fake News Detection System.
+
+The master imports app.py with PRELOAD_MODELS=true, so the ML model,
+vectorizer, stopwords and spaCy pipeline are loaded once before fork and
+shared copy-on-write by every worker. Network clients (Gemini, HTTP
+sessions, caches) are created per worker in post_fork.
+
+Provider rate limits (SERPAPI_RATE_PER_SEC etc.) are server-wide: each
+worker gets rate/workers and burst/workers in post_fork.
+
+Workers write metrics snapshots to METRICS_DIR; /metrics merges them, so a
+scrape reports the whole server whichever worker answers it.
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+
+# Must be set before gunicorn imports app.py
+os.environ.setdefault("PRELOAD_MODELS", "true")
+os.environ.setdefault(
+    "METRICS_DIR", os.path.join(tempfile.gettempdir(), f"fake-news-metrics-{os.getenv('PORT', '5000')}")
+)
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+preload_app = True
+
+
+def on_starting(server):
+    """Drop metrics left behind by a previous run of the server"""
+    shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
+
+
+def when_ready(server):
+    """Master has loaded the app: move preloaded objects out of the GC's reach
+
+    Without this, the first collection in each worker touches every object
+    header and un-shares the model pages."""
+    gc.freeze()
+    server.log.info("Models preloaded in master; objects frozen for copy-on-write sharing")
+
+
+def post_fork(server, worker):
+    """Take this worker's share of the provider rate limits and create its network clients"""
+    import app
+
+    # Each worker has its own token buckets, so split the server-wide quotas between them
+    app.share_rate_limits(server.cfg.workers)
+    app.init_network_clients()
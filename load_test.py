@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: replay a JSONL corpus of analyze requests and report
+latency percentiles, throughput, error rates and peak memory.
+
+Each corpus line is either an /api/analyze body ({"text": ...} or
+{"url": ...}, plus any flags) or a document with a "body" (and optional
+"title"), such as the repo's requests.jsonl, which is sent as text.
+
+The target is an in-process server (the app is imported and served on a
+free port, optionally against fake_providers.py stand-ins) or a running
+server given with --server. Load is closed-loop (--concurrency workers that
+each send the next request as soon as the previous one answers) or
+open-loop (--rate arrivals per second; latency is measured from the
+scheduled send time, so queueing delay is not hidden).
+
+Per-stage latencies come from /api/analyze/stream: the time from the
+request start to each stage's event.
+
+Usage:
+    python load_test.py --corpus requests.jsonl [--server http://localhost:5000]
+                        [--endpoint analyze --endpoint stream] [--concurrency 8 | --rate 5]
+                        [--requests 200 | --duration 60] [--fake-providers]
+                        [--pid 1234] [--output report.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ENDPOINTS = {
+    'analyze': '/api/analyze',
+    'stream': '/api/analyze/stream',
+    'batch': '/api/analyze/batch',
+}
+
+
+def load_corpus(path, allow_cache):
+    """Analyze request bodies from a JSONL file"""
+    bodies = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if 'text' in record or 'url' in record:
+                body = dict(record)
+            elif record.get('body'):
+                body = {'text': f"{record.get('title', '')} {record['body']}".strip()}
+            else:
+                continue
+            if not allow_cache:
+                body['cache'] = False  # Repeated corpus entries would otherwise be cache hits
+            bodies.append(body)
+    return bodies
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def read_rss(pid):
+    """Resident set size of a process in bytes (Linux /proc), or None"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class MemorySampler:
+    """Samples the summed RSS of the given processes and keeps the peak"""
+
+    def __init__(self, pids, interval=0.2):
+        self.pids = pids
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stopped.is_set():
+            sizes = [read_rss(pid) for pid in self.pids]
+            self.peak = max(self.peak, sum(size for size in sizes if size))
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        return self.peak
+
+
+class LoadTest:
+    """Sends requests, records latencies per endpoint and stage, counts errors"""
+
+    def __init__(self, base_url, bodies, endpoints, batch_size, timeout):
+        self.base_url = base_url.rstrip('/')
+        self.bodies = bodies
+        self.endpoints = endpoints
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.sequence = 0
+        self.latencies = defaultdict(list)  # endpoint -> seconds
+        self.stage_latencies = defaultdict(list)  # stage event -> seconds since request start
+        self.errors = defaultdict(int)
+        self.error_samples = defaultdict(list)
+        self.local = threading.local()
+
+    def _session(self):
+        if not hasattr(self.local, 'session'):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def _next(self):
+        with self.lock:
+            sequence = self.sequence
+            self.sequence += 1
+        endpoint = self.endpoints[sequence % len(self.endpoints)]
+        if endpoint == 'batch':
+            texts = [self.bodies[(sequence + offset) % len(self.bodies)].get('text', '')
+                     for offset in range(self.batch_size)]
+            return endpoint, {'texts': texts}
+        return endpoint, self.bodies[sequence % len(self.bodies)]
+
+    def send(self, scheduled=None):
+        """One request; latency counts from `scheduled` (open loop) or from now"""
+        endpoint, body = self._next()
+        started = scheduled if scheduled is not None else time.perf_counter()
+        stages = {}
+        error = None
+        try:
+            url = self.base_url + ENDPOINTS[endpoint]
+            if endpoint == 'stream':
+                with self._session().post(url, json=body, stream=True, timeout=self.timeout) as response:
+                    if response.status_code != 200:
+                        error = f"HTTP {response.status_code}"
+                    else:
+                        for line in response.iter_lines():
+                            if not line:
+                                continue
+                            event = json.loads(line)['event']
+                            stages.setdefault(event, time.perf_counter() - started)
+                            if event == 'error':
+                                error = 'stream error event'
+            else:
+                response = self._session().post(url, json=body, timeout=self.timeout)
+                if response.status_code != 200:
+                    error = f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            error = type(e).__name__
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            if error:
+                self.errors[endpoint] += 1
+                if len(self.error_samples[endpoint]) < 5:
+                    self.error_samples[endpoint].append(error)
+            else:
+                self.latencies[endpoint].append(elapsed)
+                for event, offset in stages.items():
+                    self.stage_latencies[event].append(offset)
+
+    def run_closed(self, concurrency, total, deadline):
+        """concurrency workers, each sending back-to-back until total/deadline"""
+        remaining = [total]
+
+        def worker():
+            while time.perf_counter() < deadline:
+                with self.lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+                self.send()
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def run_open(self, rate, total, deadline, max_in_flight, poisson):
+        """Arrivals at `rate` per second (Poisson or evenly spaced), sent from a bounded pool"""
+        rng = random.Random(1)
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='load') as executor:
+            next_send = time.perf_counter()
+            for _ in range(total):
+                if next_send >= deadline:
+                    break
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self.send, next_send)
+                next_send += rng.expovariate(rate) if poisson else 1.0 / rate
+
+
+def summarize(values):
+    return {
+        'count': len(values),
+        'p50': percentile(values, 0.50),
+        'p95': percentile(values, 0.95),
+        'p99': percentile(values, 0.99),
+        'max': max(values) if values else None,
+        'mean': sum(values) / len(values) if values else None,
+    }
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"  {'name':<26}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in rows.items():
+        if not stats['count']:
+            print(f"  {name:<26}{0:>7}")
+            continue
+        print(f"  {name:<26}{stats['count']:>7}" + ''.join(
+            f"{stats[key] * 1000:10.1f}" for key in ('p50', 'p95', 'p99', 'max')))
+
+
+def start_in_process_server(fake_providers, fake_latency, fake_error_rate):
+    """Import the app (after pointing it at the fake providers) and serve it on a free port"""
+    fake_server = None
+    if fake_providers:
+        from fake_providers import FakeProviderServer, parse_latency, parse_overrides
+        fake_server = FakeProviderServer(
+            port=0,
+            latency=parse_overrides(fake_latency, parse_latency),
+            error_rate=parse_overrides(fake_error_rate, float),
+            seed=1
+        ).start()
+        os.environ.update(fake_server.environment())
+        print(f"🧪 Fake providers on {fake_server.base_url}")
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app
+    from werkzeug.serving import make_server
+
+    if not app.ensure_models_loaded():
+        print("❌ Failed to load models")
+        sys.exit(1)
+    server = make_server('127.0.0.1', 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", server, fake_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay analyze requests and report latency percentiles")
+    parser.add_argument('--corpus', default='requests.jsonl', help='JSONL file of request bodies')
+    parser.add_argument('--server', help='Base URL of a running server (default: serve the app in-process)')
+    parser.add_argument('--endpoint', action='append', choices=sorted(ENDPOINTS),
+                        help='Endpoint(s) to exercise, round-robin (default: analyze and stream)')
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument('--concurrency', type=int, help='Closed loop: number of concurrent clients (default 4)')
+    load.add_argument('--rate', type=float, help='Open loop: request arrivals per second')
+    parser.add_argument('--poisson', action='store_true', help='Exponential inter-arrival times in --rate mode')
+    parser.add_argument('--max-in-flight', type=int, default=64, help='Client threads in --rate mode')
+    parser.add_argument('--requests', type=int, help='Total requests (default: one pass over the corpus)')
+    parser.add_argument('--duration', type=float, help='Stop sending after this many seconds')
+    parser.add_argument('--batch-size', type=int, default=32, help='Texts per /api/analyze/batch request')
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--allow-cache', action='store_true', help='Let repeated bodies hit the response cache')
+    parser.add_argument('--fake-providers', action='store_true',
+                        help='In-process mode: point the app at fake_providers.py stand-ins')
+    parser.add_argument('--fake-latency', action='append', metavar='[PROVIDER=]SPEC')
+    parser.add_argument('--fake-error-rate', action='append', metavar='[PROVIDER=]RATE')
+    parser.add_argument('--pid', type=int, action='append',
+                        help='Server process(es) whose RSS to sample (e.g. gunicorn workers)')
+    parser.add_argument('--output', help='Write the report as JSON')
+    args = parser.parse_args()
+
+    bodies = load_corpus(args.corpus, args.allow_cache)
+    if not bodies:
+        print(f"❌ No requests in {args.corpus}")
+        sys.exit(1)
+    endpoints = args.endpoint or ['analyze', 'stream']
+
+    server = fake_server = None
+    if args.server:
+        base_url = args.server
+        pids = args.pid or []
+    else:
+        base_url, server, fake_server = start_in_process_server(
+            args.fake_providers, args.fake_latency, args.fake_error_rate
+        )
+        pids = [os.getpid()]
+
+    total = args.requests or (len(bodies) if not args.duration else sys.maxsize)
+    deadline = time.perf_counter() + args.duration if args.duration else float('inf')
+    test = LoadTest(base_url, bodies, endpoints, args.batch_size, args.timeout)
+    mode = f"rate {args.rate}/s" if args.rate else f"concurrency {args.concurrency or 4}"
+    print(f"🚀 {base_url}: {', '.join(endpoints)} with {mode} ({len(bodies)} corpus entries)")
+
+    sampler = MemorySampler(pids).start()
+    started = time.perf_counter()
+    if args.rate:
+        test.run_open(args.rate, total, deadline, args.max_in_flight, args.poisson)
+    else:
+        test.run_closed(args.concurrency or 4, total, deadline)
+    wall = time.perf_counter() - started
+    peak_rss = sampler.stop()
+    if not args.server:
+        peak_rss = max(peak_rss, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+
+    completed = sum(len(values) for values in test.latencies.values())
+    failed = sum(test.errors.values())
+    report = {
+        'target': base_url,
+        'mode': {'rate': args.rate, 'poisson': args.poisson} if args.rate else {'concurrency': args.concurrency or 4},
+        'wall_seconds': wall,
+        'requests': completed + failed,
+        'throughput_rps': completed / wall if wall else None,
+        'error_rate': failed / (completed + failed) if completed + failed else None,
+        'endpoints': {
+            endpoint: dict(summarize(test.latencies[endpoint]), errors=test.errors[endpoint],
+                           error_samples=test.error_samples[endpoint])
+            for endpoint in endpoints
+        },
+        'stages': {event: summarize(values) for event, values in sorted(test.stage_latencies.items())},
+        'peak_rss_bytes': peak_rss or None,
+    }
+    if fake_server:
+        report['fake_providers'] = fake_server.snapshot()
+
+    print_table("⏱️ Latency per endpoint", report['endpoints'])
+    if report['stages']:
+        print_table("⏱️ Time to stage event (stream)", report['stages'])
+    print(f"\n📈 {report['requests']} requests in {wall:.1f}s: {report['throughput_rps'] or 0:.2f} req/s, "
+          f"error rate {(report['error_rate'] or 0):.1%}")
+    for endpoint in endpoints:
+        if test.errors[endpoint]:
+            print(f"   ❌ {endpoint}: {test.errors[endpoint]} errors, e.g. {', '.join(test.error_samples[endpoint])}")
+    if peak_rss:
+        print(f"🧠 Peak RSS: {peak_rss / 1024 / 1024:.0f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.output}")
+
+    if server:
+        server.shutdown()
+    if fake_server:
+        fake_server.stop()
+
+
+if __name__ == "__main__":
+    main()
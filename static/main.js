@@ -72,20 +72,32 @@ async function analyzeNews() {
             find_sources: verifySourcesChecked
         };
         
-        const response = await fetch('/api/analyze', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify(requestData)
-        });
-        
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
+        let result;
+        if (window.ReadableStream && window.TextDecoder) {
+            // Render each stage as it finishes; the last event carries the complete result
+            const progress = createProgress(requestData);
+            result = await streamAnalysis(requestData, event => {
+                if (event.event !== 'result' && event.event !== 'error') {
+                    updateProgress(progress, event);
+                    renderProgress(progress);
+                }
+            });
+        } else {
+            const response = await fetch('/api/analyze', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify(requestData)
+            });
+            
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            
+            result = await response.json();
         }
         
-        const result = await response.json();
-        
         if (result.success) {
             displayResults(result);
         } else {
@@ -105,6 +117,130 @@ async function analyzeNews() {
     }
 }
 
+// Read NDJSON events from the streaming endpoint, returning the final result
+async function streamAnalysis(requestData, onEvent) {
+    const response = await fetch('/api/analyze/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(requestData)
+    });
+    
+    if (response.status === 400) {
+        return await response.json();
+    }
+    if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+    
+    const handleLine = line => {
+        if (!line.trim()) return;
+        const event = JSON.parse(line);
+        if (event.event === 'result') {
+            result = event.data;
+        } else if (event.event === 'error') {
+            result = { success: false, error: event.data.error };
+        }
+        onEvent(event);
+    };
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let newline;
+        while ((newline = buffer.indexOf('\n')) >= 0) {
+            handleLine(buffer.slice(0, newline));
+            buffer = buffer.slice(newline + 1);
+        }
+    }
+    handleLine(buffer + decoder.decode());
+    
+    if (!result) {
+        throw new Error('Analysis stream ended without a result');
+    }
+    return result;
+}
+
+// Partial results collected while the analysis stream is open
+function createProgress(requestData) {
+    const pending = { real_time_verification: 'Real-time fact verification' };
+    if (requestData.ai_analysis) pending.ai_analysis = 'AI insights';
+    if (requestData.find_sources) pending.related_sources = 'Related sources';
+    return { mlResult: null, quality: null, claims: [], pending: pending };
+}
+
+function updateProgress(progress, event) {
+    if (event.event === 'ml_result') {
+        progress.mlResult = event.data;
+    } else if (event.event === 'content_quality') {
+        progress.quality = event.data;
+    } else if (event.event === 'claim_verified') {
+        progress.claims[event.data.index] = event.data;
+        progress.claimTotal = event.data.total;
+    } else {
+        delete progress.pending[event.event];
+    }
+}
+
+// Show partial results (ML verdict first, then claims) until the full result arrives
+function renderProgress(progress) {
+    const resultsContainer = document.getElementById('results');
+    let html = '';
+    
+    if (progress.mlResult) {
+        const ml = progress.mlResult;
+        html += `
+        <div class="analysis-card" style="background: var(--gray-50); border: 1px solid var(--gray-200); border-radius: var(--radius-lg); padding: 1.5rem; margin-bottom: 1.5rem;">
+            <h4 style="display: flex; align-items: center; gap: 0.5rem; font-size: 1.125rem; font-weight: 600; margin-bottom: 1rem;">
+                <i class="fas fa-robot" style="color: var(--primary-color);"></i>
+                Preliminary Verdict: ${ml.final_assessment}
+            </h4>
+            <p style="margin-bottom: 0.5rem;">ML Score: ${Math.round((ml.final_score || 0.5) * 100)}%</p>
+            ${progress.quality ? `
+            <p style="margin-bottom: 0.5rem; font-size: 0.9rem; color: #6c757d;">
+                ${progress.quality.word_count} words, ${progress.quality.factual_indicators} factual indicators${progress.quality.has_quotes ? ', quotes present' : ''}
+            </p>` : ''}
+            <div class="score-bar" style="height: 8px; background: var(--gray-200); border-radius: 4px; margin-top: 0.75rem; overflow: hidden;">
+                <div class="score-fill" style="height: 100%; background: var(--primary-gradient); border-radius: 4px; width: ${(ml.final_score || 0.5) * 100}%; transition: width 0.8s ease;"></div>
+            </div>
+        </div>`;
+    }
+    
+    const claims = progress.claims.filter(Boolean);
+    if (claims.length > 0) {
+        html += `
+        <div class="verification-section" style="background: #e8f5e8; border: 2px solid #28a745; border-radius: var(--radius-lg); padding: 1.5rem; margin-bottom: 1.5rem;">
+            <h5 style="font-size: 1rem; font-weight: 600; margin-bottom: 0.75rem;">
+                Claims verified: ${claims.length}/${progress.claimTotal}
+            </h5>
+            ${claims.map(item => `
+                <div class="claim-item" style="background: white; border: 1px solid #c3e6cb; border-radius: 6px; padding: 0.75rem; margin-bottom: 0.5rem; font-size: 0.9rem;">
+                    <strong>${item.verification?.verification_status || 'UNVERIFIED'}</strong>:
+                    "${item.claim.substring(0, 100)}${item.claim.length > 100 ? '...' : ''}"
+                </div>
+            `).join('')}
+        </div>`;
+    }
+    
+    const pending = Object.values(progress.pending);
+    if (pending.length > 0) {
+        html += `
+        <div style="text-align: center; font-size: 0.9rem; color: var(--gray-500);">
+            <i class="fas fa-spinner fa-spin"></i> Still working on: ${pending.join(', ')}
+        </div>`;
+    }
+    
+    resultsContainer.innerHTML = html;
+    resultsContainer.classList.remove('hidden');
+}
+
 // Display analysis results
 function displayResults(data) {
     const resultsContainer = document.getElementById('results');
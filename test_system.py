@@ -6,6 +6,7 @@ System test script to verify the fake news detection system is working correctly
 import requests
 import json
 import sys
+import time
 
 def test_api_endpoint(url, data):
     """Test an API endpoint with given data."""
@@ -84,6 +85,76 @@ def main():
     else:
         print(f"⚠️ Error handling test unexpected result: {status}, {result}")
     
+    # Test 5: Batch scoring
+    print("\n🔍 Test 5: Batch Scoring")
+    batch_request = {"texts": [real_news["text"], fake_news["text"], "short"]}
+    
+    status, result = test_api_endpoint(f"{base_url}/api/analyze/batch", batch_request)
+    if status == 200 and len(result.get('results', [])) == 3:
+        print("✅ Batch scoring successful")
+        print(f"   Scored: {result.get('scored')}/{result.get('count')}")
+        for item in result['results']:
+            if item.get('success'):
+                print(f"   [{item['index']}] {item['analysis']['final_assessment']} ({item['analysis']['final_score']:.2f})")
+            else:
+                print(f"   [{item['index']}] Rejected: {item.get('error')}")
+    else:
+        print(f"❌ Batch scoring failed: {status}, {result}")
+        return False
+    
+    # Test 6: Streaming analysis
+    print("\n🔍 Test 6: Streaming Analysis")
+    try:
+        response = requests.post(f"{base_url}/api/analyze/stream", json=real_news, stream=True, timeout=60)
+        events = [json.loads(line) for line in response.iter_lines() if line]
+        event_names = [event['event'] for event in events]
+        if response.status_code == 200 and event_names and event_names[-1] == 'result':
+            print("✅ Streaming analysis successful")
+            print(f"   Events: {', '.join(event_names)}")
+        else:
+            print(f"❌ Streaming analysis failed: {response.status_code}, {event_names}")
+            return False
+    except Exception as e:
+        print(f"❌ Streaming analysis error: {e}")
+        return False
+    
+    # Test 7: Asynchronous job
+    print("\n🔍 Test 7: Asynchronous Job")
+    status, result = test_api_endpoint(f"{base_url}/api/jobs", real_news)
+    if status != 202:
+        print(f"❌ Job submission failed: {status}, {result}")
+        return False
+    job = {}
+    for _ in range(60):
+        job = requests.get(f"{base_url}{result['status_url']}", timeout=10).json()
+        if job.get('status') in ('completed', 'failed'):
+            break
+        time.sleep(1)
+    if job.get('status') == 'completed':
+        print("✅ Asynchronous job completed")
+        print(f"   Job: {job['job_id']}")
+        print(f"   Partial results recorded: {', '.join(job['partial_results'])}")
+    else:
+        print(f"❌ Asynchronous job did not complete: {job.get('status')}, {job.get('error')}")
+        return False
+    
+    # Test 8: Bulk URL extraction
+    print("\n🔍 Test 8: Bulk Extraction")
+    try:
+        bulk_request = {'urls': [f"{base_url}/", "not-a-url"], 'score': True}
+        response = requests.post(f"{base_url}/api/extract/bulk", json=bulk_request, stream=True, timeout=60)
+        events = [json.loads(line) for line in response.iter_lines() if line]
+        records = [event['data'] for event in events if event['event'] == 'article']
+        if response.status_code == 200 and len(records) == 2 and events[-1]['event'] == 'summary':
+            print("✅ Bulk extraction successful")
+            print(f"   Summary: {events[-1]['data']}")
+        else:
+            print(f"❌ Bulk extraction failed: {response.status_code}, {events}")
+            return False
+    except Exception as e:
+        print(f"❌ Bulk extraction error: {e}")
+        return False
+    
     print("\n🎉 ALL TESTS COMPLETED SUCCESSFULLY!")
     print("✅ The fake news detection system is working correctly.")
     print("✅ Web interface is accessible at http://localhost:5000")
@@ -0,0 +1,100 @@
+"""
+Stages fed one shared AnalysisDocument must return exactly what the original
+implementations returned for the plain text, whichever stage computes a
+memoized view first.
+"""
+
+import itertools
+import re
+from collections import Counter
+
+import pytest
+
+import app
+from test_claim_extraction import SENTENCES, baseline_factual_claims, baseline_verifiable_claims
+from test_text_preprocessing import (
+    STOP_WORDS, TEXTS, baseline_analyze_content_quality, baseline_detect_factual_statements,
+    baseline_preprocess_text,
+)
+
+
+def baseline_extract_search_terms(text):
+    """NewsSourceFinder._extract_search_terms before the rewrite"""
+    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+
+    stop_words = {
+        'news', 'article', 'report', 'says', 'said', 'according', 'sources',
+        'breaking', 'update', 'latest', 'today', 'yesterday', 'this', 'that',
+        'with', 'from', 'they', 'have', 'been', 'will', 'were', 'their',
+        'and', 'the', 'for', 'are', 'but', 'not', 'you', 'all', 'can'
+    }
+
+    filtered_words = [w for w in words if w not in stop_words and len(w) > 3]
+    word_freq = Counter(filtered_words)
+    top_words = [word for word, count in word_freq.most_common(8)]
+
+    quoted_phrases = re.findall(r'"([^"]*)"', text)
+
+    entities = []
+    if app.SPACY_AVAILABLE and app.nlp:
+        try:
+            doc = app.nlp(text[:500])
+            for ent in doc.ents:
+                if ent.label_ in ['PERSON', 'ORG', 'GPE'] and len(ent.text) > 2:
+                    entities.append(ent.text.lower())
+        except:
+            pass
+
+    return top_words[:5] + quoted_phrases[:2] + entities[:3]
+
+
+def quality(text):
+    result = app.AdvancedAnalyzer().analyze_content_quality(text)
+    result.pop('readability_score')
+    return result
+
+
+STAGES = {
+    'preprocess': (app.preprocess_text, lambda text: baseline_preprocess_text(text, STOP_WORDS)),
+    'quality': (quality, baseline_analyze_content_quality),
+    'factual_boost': (
+        lambda text: app.CredibilityScorer(None, None)._detect_factual_statements(text),
+        lambda text: pytest.approx(baseline_detect_factual_statements(text)),
+    ),
+    'search_terms': (app.NewsSourceFinder()._extract_search_terms, baseline_extract_search_terms),
+    'verifiable_claims': (app.VERIFIABLE_CLAIM_EXTRACTOR.extract, baseline_verifiable_claims),
+    'factual_claims': (app.FACTUAL_CLAIM_EXTRACTOR.extract, baseline_factual_claims),
+}
+
+# Run the stages forwards, backwards and interleaved, so each view is first built by a different consumer
+STAGE_ORDERS = [list(STAGES), list(reversed(STAGES)), list(STAGES)[1::2] + list(STAGES)[::2]]
+
+
+@pytest.fixture(autouse=True)
+def stop_words(monkeypatch):
+    monkeypatch.setattr(app, 'stop_words', STOP_WORDS)
+
+
+@pytest.mark.parametrize('order', STAGE_ORDERS, ids=['forward', 'reverse', 'interleaved'])
+# None of these texts has a claim crossing a sentence boundary or a trigger inside a word,
+# where the claim extractors deliberately differ (see test_claim_extraction)
+@pytest.mark.parametrize('text', TEXTS + SENTENCES)
+def test_shared_document_matches_baseline(text, order):
+    document = app.AnalysisDocument.of(text)
+    for name in order:
+        stage, baseline = STAGES[name]
+        assert stage(document) == baseline(str(text)), name
+
+
+def test_document_is_the_text():
+    text = "The Prime Minister of India is Narendra Modi."
+    document = app.AnalysisDocument.of(text)
+    assert document == text and isinstance(document, str)
+    assert app.AnalysisDocument.of(document) is document
+    assert document.text_lower is document.text_lower
+
+
+@pytest.mark.parametrize('texts', [TEXTS, list(itertools.chain(TEXTS, TEXTS))])
+def test_preprocess_texts_accepts_documents(texts):
+    documents = [app.AnalysisDocument.of(text) for text in texts]
+    assert app.preprocess_texts(documents) == [baseline_preprocess_text(text, STOP_WORDS) for text in texts]
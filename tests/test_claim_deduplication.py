@@ -0,0 +1,79 @@
+"""
+ClaimDeduplicator (MinHash/LSH candidates) must keep exactly the claims the
+original all-pairs Jaccard filter kept.
+"""
+
+import random
+
+import pytest
+
+import app
+
+
+def baseline_similarity(text1, text2):
+    """RealTimeFactChecker._similarity before the rewrite"""
+    words1 = set(text1.lower().split())
+    words2 = set(text2.lower().split())
+    if not words1 or not words2:
+        return 0
+    return len(words1.intersection(words2)) / len(words1.union(words2))
+
+
+def baseline_deduplicate(claims):
+    """The de-duplication tail of _extract_verifiable_claims before the rewrite"""
+    unique_claims = []
+    for claim in claims:
+        if not any(baseline_similarity(claim, existing) > 0.8 for existing in unique_claims):
+            unique_claims.append(claim)
+    return unique_claims[:10]
+
+
+def near_duplicate_claims(seed, count):
+    """Claims drawn around a few base sentences, with words dropped, added and re-cased"""
+    rng = random.Random(seed)
+    vocabulary = [f"word{index}" for index in range(40)]
+    bases = [rng.sample(vocabulary, rng.randint(4, 14)) for _ in range(rng.randint(1, 6))]
+    claims = []
+    for _ in range(count):
+        words = list(rng.choice(bases))
+        for _ in range(rng.randint(0, 3)):
+            if words and rng.random() < 0.5:
+                words.pop(rng.randrange(len(words)))
+            else:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(vocabulary))
+        if words and rng.random() < 0.2:
+            words[0] = words[0].upper()
+        claims.append(' '.join(words))
+    return claims
+
+
+CLAIM_LISTS = [
+    [],
+    ["", "  ", "The minister resigned today", ""],
+    # Jaccard exactly 0.8 is kept, just above it is dropped
+    ["a b c d e", "a b c d", "a b c d e f g", "a b c d e f", "A B C D E F"],
+    ["The Prime Minister died yesterday", "the prime minister died yesterday", "Prime Minister died yesterday"],
+    [f"distinct claim number {index}" for index in range(25)],
+] + [near_duplicate_claims(seed, count) for seed, count in enumerate([5, 10, 20, 40, 80, 160] * 5)]
+
+
+@pytest.mark.parametrize('claims', CLAIM_LISTS)
+def test_deduplicate_matches_baseline(claims):
+    assert app.CLAIM_DEDUPLICATOR.deduplicate(claims, limit=10) == baseline_deduplicate(claims)
+
+
+@pytest.mark.parametrize('claims', CLAIM_LISTS)
+def test_deduplicate_without_limit_keeps_baseline_prefix(claims):
+    kept = app.CLAIM_DEDUPLICATOR.deduplicate(claims)
+    assert kept[:10] == baseline_deduplicate(claims)
+
+
+def test_extract_verifiable_claims_matches_baseline():
+    text = (
+        "The famous actor died yesterday. The famous actor died yesterday, reports said. "
+        "John Smith became the Prime Minister. Officials said yesterday that the committee announced a review. "
+        "The storm killed 12 people and affected 4,000 residents. Researchers at the institute found a cure."
+    )
+    checker = app.RealTimeFactChecker()
+    claims = app.VERIFIABLE_CLAIM_EXTRACTOR.extract(text)
+    assert checker._extract_verifiable_claims(text) == baseline_deduplicate(claims)
@@ -0,0 +1,156 @@
+"""
+ClaimExtractor must reproduce the original backtracking regex extractors, apart
+from two documented differences: claims no longer cross sentence boundaries,
+and triggers match whole words only.
+"""
+
+import re
+
+import pytest
+
+import app
+
+# Claims that sit inside one sentence and use whole-word triggers, where the
+# rewrite and the original patterns agree exactly
+SENTENCES = [
+    "The famous actor died",
+    "John Smith died yesterday",
+    "Smith died yesterday",
+    "John died and Mary died",
+    "Officials said yesterday that the committee announced a review",
+    "The storm killed 12 people and affected 4,000 residents",
+    "The company earned 300 dollars in 12 years",
+    "Researchers at the institute found that the treatment worked",
+    "John Smith became the Prime Minister",
+    "Sadly, the former Director is a Chief Executive Leader",
+    "Reporters in Springfield covered the election",
+    "Crowds gathered in the square for a protest",
+    "In Boston fire crews fought a fire; later a protest formed",
+    "Acme Corporation announced record profits",
+    "Company Company reported losses",
+    "The Boston Company quietly announced layoffs and then filed suit",
+    "The singer was aged 45 when she was born in 1950",
+    "Scientists discovered a new species; doctors showed it was safe",
+    "Local officials just declared an emergency after the earthquake",
+    "Mary Jones was recently elected President of the club",
+    "Experts say the war at Verdun was a disaster for everyone involved",
+    "Anna Lee killed   3 people   ago,\nthen recently\nwas elected",
+    "Nothing verifiable here at all, just an opinion",
+]
+
+ARTICLE = (
+    "Officials said yesterday that the committee announced a review of the budget. "
+    "The storm killed 12 people and affected 4,000 residents in the coastal district. "
+    "Researchers at the institute found that the treatment showed promising results. "
+    "The company reported quarterly earnings above expectations on Tuesday. "
+    "Local reporters in Springfield covered the election campaign for weeks."
+)
+
+
+def baseline_verifiable_claims(text):
+    """RealTimeFactChecker._extract_verifiable_claims before the rewrite, up to de-duplication"""
+    claims = []
+
+    patterns = [
+        r'([A-Z][a-zA-Z\s]+(?:is dead|died|passed away|was killed|is alive|is living).*?)',
+        r'([A-Z][a-zA-Z\s]+(?:is the|is a|serves as|became).*?(?:Prime Minister|President|CEO|Minister|Chief|Director|Leader).*?)',
+        r'((?:yesterday|today|last week|this month|recently).*?(?:announced|declared|happened|occurred|died|was elected).*?)',
+        r'((?:killed|affected|saved|earned|lost|spent).*?\d+.*?(?:people|dollars|lives|years).*?)',
+        r'([A-Z][a-zA-Z\s]+(?:Company|Corporation|Inc\.|Ltd\.).*?(?:announced|reported|filed|launched).*?)',
+        r'((?:in|at)\s+[A-Z][a-zA-Z\s]+.*?(?:earthquake|fire|explosion|attack|election|protest).*?)',
+        r'([A-Z][a-zA-Z\s]+(?:age|aged|years old|born in).*?\d+.*?)',
+        r'((?:scientists|researchers|doctors|studies).*?(?:discovered|found|proved|showed|revealed).*?)'
+    ]
+
+    for pattern in patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
+        for match in matches:
+            cleaned_claim = re.sub(r'\s+', ' ', match.strip())
+            if 10 < len(cleaned_claim) < 200:
+                claims.append(cleaned_claim)
+
+    sentences = re.split(r'[.!?]+', text)
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if 20 < len(sentence) < 150:
+            if any(keyword in sentence.lower() for keyword in [
+                'prime minister', 'president', 'died', 'killed', 'announced', 'elected',
+                'discovered', 'research shows', 'study found', 'experts say', 'according to'
+            ]):
+                claims.append(sentence)
+    return claims
+
+
+def baseline_factual_claims(text):
+    """FactVerificationSystem._extract_factual_claims before the rewrite, up to de-duplication"""
+    claims = []
+
+    patterns = [
+        r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is dead|died|passed away|killed).*?(?:yesterday|today|ago|recently))',
+        r'([A-Z][a-z]+ [A-Z][a-z]+.*?(?:is|was|became).*?(?:Prime Minister|President|CEO|Minister|Chief).*?)',
+        r'((?:killed|murdered|saved|affected).*?\d+.*?(?:people|persons|individuals))',
+        r'((?:just|recently|yesterday|today|last week).*?(?:happened|occurred|announced|declared).*?)',
+        r'([A-Z][a-z]+.*?(?:company|corporation|organization).*?(?:announced|declared|reported).*?)',
+        r'((?:scientists|researchers|doctors).*?(?:discovered|found|proved|showed).*?)',
+        r'((?:in|at) [A-Z][a-z]+.*?(?:election|war|conflict|disaster|earthquake).*?)'
+    ]
+
+    for pattern in patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        for match in matches:
+            if len(match) > 10:
+                claims.append(match.strip())
+
+    sentences = re.split(r'[.!?]+', text)
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if len(sentence) > 20 and any(keyword in sentence.lower() for keyword in [
+            'prime minister', 'president', 'died', 'killed', 'murdered',
+            'announced', 'declared', 'discovered', 'proved', 'election',
+            'war', 'disaster', 'company', 'billion', 'million'
+        ]):
+            claims.append(sentence)
+    return claims
+
+
+@pytest.mark.parametrize('text', SENTENCES)
+def test_verifiable_claims_match_baseline(text):
+    assert app.VERIFIABLE_CLAIM_EXTRACTOR.extract(text) == baseline_verifiable_claims(text)
+
+
+@pytest.mark.parametrize('text', SENTENCES)
+def test_factual_claims_match_baseline(text):
+    assert app.FACTUAL_CLAIM_EXTRACTOR.extract(text) == baseline_factual_claims(text)
+
+
+@pytest.mark.parametrize('text', SENTENCES)
+def test_extract_factual_claims_keeps_extraction_order(text):
+    # Documented difference: duplicates are dropped in order instead of through a set
+    expected = list(dict.fromkeys(baseline_factual_claims(text)))[:5]
+    assert app.FactVerificationSystem()._extract_factual_claims(text) == expected
+
+
+def test_claims_do_not_cross_sentence_boundaries():
+    text = "The committee met yesterday. Officials announced a review."
+    assert baseline_verifiable_claims(text) == ['yesterday. Officials announced', 'Officials announced a review']
+    assert app.VERIFIABLE_CLAIM_EXTRACTOR.extract(text) == ['Officials announced a review']
+
+    # "Inc." and "Ltd." end a sentence, so a company claim through them always crossed one
+    text = "Apple Inc. announced a new phone"
+    assert baseline_verifiable_claims(text) == ['Apple Inc. announced', 'announced a new phone']
+    assert app.VERIFIABLE_CLAIM_EXTRACTOR.extract(text) == ['announced a new phone']
+
+    assert any('.' in claim for claim in baseline_factual_claims(ARTICLE))
+    for extractor in (app.VERIFIABLE_CLAIM_EXTRACTOR, app.FACTUAL_CLAIM_EXTRACTOR):
+        claims = extractor.extract(ARTICLE)
+        assert claims and not any('.' in claim for claim in claims)
+
+
+def test_triggers_match_whole_words():
+    text = "The domain Hall protest drew crowds"
+    assert baseline_verifiable_claims(text) == ['in Hall protest']
+    assert app.VERIFIABLE_CLAIM_EXTRACTOR.extract(text) == []
+
+    text = "Their main Senate election"
+    assert baseline_factual_claims(text) == ['in Senate election', 'Their main Senate election']
+    assert app.FACTUAL_CLAIM_EXTRACTOR.extract(text) == ['Their main Senate election']
@@ -0,0 +1,189 @@
+"""
+The single-pass preprocessing and content analysis must match the original
+multi-pass implementations exactly on fixed inputs.
+"""
+
+import re
+
+import pytest
+
+import app
+
+STOP_WORDS = {'the', 'a', 'an', 'and', 'of', 'in', 'is', 'was', 'to', 'on', 'at', 'by', 'for', 'with', 'that', 'this'}
+
+TEXTS = [
+    "",
+    "   ",
+    "The Prime Minister of India is Narendra Modi.",
+    "Narendra Modi is alive and well, sources say",
+    "Mahatma Gandhi is dead. He was born in 1869 in Porbandar.",
+    "Paris is the capital of France and is located in Western Europe.",
+    "According to a study published in the journal, 45 percent of adults agreed.",
+    "The company earned $1,250,000.50 in 2021, a 12.5% increase year over year.",
+    "Read more at https://example.com/story?id=42 or www.example.org/news today!",
+    "Metadata, databases and data-driven reports: the government's official analysis.",
+    "A peer-reviewed paper by a PhD researcher at the university's institute.",
+    "It was founded in 1998.\nThe 2004 report came a year later.",
+    "Built in 1650\nin the ad hoc style",
+    "Founded 1650 with no marker\n\n1999\nnothing here either",
+    "World War II ended in 1945; the population of Berlin is 3.6 million people.",
+    "\"This is a quote,\" said the official. \"And another one!\" she added?!",
+    "Héllo wörld — naïve café façade; ÀÉÎ are not ASCII letters",
+    "Scientists discovered a new species, also called the blue frog, which consists of 3 subspecies.",
+    "The border is bounded by mountains; the temperature of the lake is 4 degrees.",
+    "Short claim 2020 AD",
+    " ".join(["Researchers"] * 30 + ["reported", "1999", "data"] * 10),
+]
+
+
+def baseline_preprocess_text(text, stop_words):
+    """preprocess_text before the single-pass rewrite"""
+    if text is None:
+        return ""
+    text = str(text).lower()
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'[^a-zA-Z\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    if stop_words:
+        words = text.split()
+        words = [word for word in words if word not in stop_words and len(word) > 2]
+        return ' '.join(words)
+    return text
+
+
+def baseline_analyze_content_quality(text):
+    """AdvancedAnalyzer.analyze_content_quality before the rewrite (readability omitted)"""
+    word_count = len(text.split())
+    sentences = re.split(r'[.!?]+', text)
+    sentence_count = len([s for s in sentences if s.strip()])
+    text_lower = text.lower()
+
+    factual_words = [
+        'according', 'research', 'study', 'report', 'data', 'statistics',
+        'survey', 'analysis', 'findings', 'evidence', 'documented',
+        'government', 'official', 'ministry', 'department', 'agency',
+        'authority', 'commission', 'parliament', 'congress',
+        'university', 'institute', 'published', 'journal', 'peer-reviewed',
+        'professor', 'doctor', 'phd', 'researcher',
+        'established', 'founded', 'located', 'situated', 'population',
+        'capital', 'currency', 'area', 'distance', 'height', 'depth'
+    ]
+    factual_count = sum(text_lower.count(word) for word in factual_words)
+
+    factual_patterns = [
+        r'\d{4}',
+        r'\d+(?:,\d{3})*',
+        r'\d+\s*(?:million|billion|thousand|percent|km|miles|meters)',
+        r'(born|died|established|founded) (?:in|on) \d{4}',
+        r'(prime minister|president|capital|currency) (?:of|is)',
+        r'(located|situated) in \w+',
+    ]
+    pattern_matches = 0
+    for pattern in factual_patterns:
+        pattern_matches += len(re.findall(pattern, text_lower))
+
+    quotes = len(re.findall(r'"[^"]+"', text))
+
+    authoritative_phrases = [
+        'according to', 'official statement', 'government announced',
+        'research shows', 'study reveals', 'data indicates',
+        'confirmed by', 'verified by', 'reported by'
+    ]
+    authoritative_count = sum(1 for phrase in authoritative_phrases if phrase in text_lower)
+
+    is_factual_statement = False
+    if word_count <= 20 and (factual_count > 0 or pattern_matches > 0 or authoritative_count > 0):
+        is_factual_statement = True
+
+    return {
+        'word_count': word_count,
+        'sentence_count': sentence_count,
+        'factual_indicators': factual_count + pattern_matches,
+        'has_quotes': quotes > 0,
+        'quote_count': quotes,
+        'authoritative_phrases': authoritative_count,
+        'is_factual_statement': is_factual_statement,
+        'pattern_matches': pattern_matches
+    }
+
+
+def baseline_detect_factual_statements(text):
+    """CredibilityScorer._detect_factual_statements before the rewrite"""
+    text_lower = text.lower()
+
+    person_status_patterns = [
+        r'(salman khan|shah rukh khan|aamir khan|akshay kumar) is (alive|living)',
+        r'(narendra modi|modi) is (alive|living|prime minister)',
+        r'(apj abdul kalam|kalam) is (dead|deceased|died)',
+        r'(mahatma gandhi|gandhi) is (dead|deceased|died)',
+        r'(jawaharlal nehru|nehru) is (dead|deceased|died)',
+    ]
+    for pattern in person_status_patterns:
+        if re.search(pattern, text_lower):
+            return 0.4
+
+    factual_patterns = [
+        r'(prime minister|president|king|queen|chancellor|governor) (of|is)',
+        r'(capital|currency) (of|is)',
+        r'(born|died) (in|on|at)',
+        r'(located|situated) in',
+        r'(border|borders|bounded) (by|with)',
+        r'(population|area|size) (of|is)',
+        r'(discovered|invented|founded) (in|by)',
+        r'(temperature|distance|speed|weight) (of|is)',
+        r'(world war|independence|revolution) (started|ended|began)',
+        r'(known as|also called|referred to as)',
+        r'(consists of|composed of|made of)',
+        r'(established|founded|created) (in|on)',
+        r'\d{4}.*?(year|ad|bc|ce)',
+        r'\d+\s*(million|billion|thousand|percent|km|miles)',
+    ]
+    boost = 0.0
+    matches = 0
+    for pattern in factual_patterns:
+        if re.search(pattern, text_lower):
+            matches += 1
+            boost += 0.1
+
+    word_count = len(text.split())
+    if word_count <= 15 and matches > 0:
+        boost += 0.15
+
+    factual_keywords = [
+        'prime minister', 'president', 'capital', 'currency', 'population',
+        'area', 'located', 'founded', 'established', 'discovered', 'invented',
+        'born', 'died', 'known as', 'also called', 'consists of'
+    ]
+    keyword_matches = sum(1 for keyword in factual_keywords if keyword in text_lower)
+    if keyword_matches > 0:
+        boost += keyword_matches * 0.05
+
+    return min(0.4, boost)
+
+
+@pytest.fixture(params=[set(), STOP_WORDS], ids=['no-stopwords', 'stopwords'])
+def stop_words(request, monkeypatch):
+    monkeypatch.setattr(app, 'stop_words', request.param)
+    return request.param
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_preprocess_text_matches_baseline(text, stop_words):
+    assert app.preprocess_text(text) == baseline_preprocess_text(text, stop_words)
+
+
+def test_preprocess_texts_matches_baseline(stop_words):
+    assert app.preprocess_texts(TEXTS) == [baseline_preprocess_text(text, stop_words) for text in TEXTS]
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_analyze_content_quality_matches_baseline(text):
+    result = app.AdvancedAnalyzer().analyze_content_quality(text)
+    result.pop('readability_score')
+    assert result == baseline_analyze_content_quality(text)
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_detect_factual_statements_matches_baseline(text):
+    scorer = app.CredibilityScorer(None, None)
+    assert scorer._detect_factual_statements(text) == pytest.approx(baseline_detect_factual_statements(text))
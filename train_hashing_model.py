@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Train the hashing-vectorizer variant of the fake news classifier.
+
+Instead of a fitted TfidfVectorizer (whose vocabulary dict dominates memory
+and load time), terms are hashed into a fixed number of columns and only an
+IDF vector sized to the hash space is stored. The output directory uses the
+same array format as export_model.py, so app.py loads it with:
+
+    MODEL_FORMAT=arrays MODEL_ARTIFACTS_DIR=hashing_artifacts python app.py
+
+Usage:
+    python train_hashing_model.py --fake Fake.csv --true True.csv
+                                  [--output hashing_artifacts] [--n-features 262144]
+                                  [--classifier logistic|forest]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import classification_report
+from sklearn.model_selection import train_test_split
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import app
+from export_model import export_model
+
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+def load_dataset(fake_path, true_path):
+    """Load the Fake/True CSVs (title + text) with labels 0 = fake, 1 = real"""
+    fake = pd.read_csv(fake_path)
+    fake['label'] = 0
+    true = pd.read_csv(true_path)
+    true['label'] = 1
+    df = pd.concat([fake, true], ignore_index=True)
+    df['full_text'] = df['title'].fillna('') + ' ' + df['text'].fillna('')
+    return df
+
+
+def build_classifier(name):
+    """Same hyperparameters as the notebook"""
+    if name == 'forest':
+        return RandomForestClassifier(
+            n_estimators=100,
+            max_depth=20,
+            min_samples_split=10,
+            n_jobs=-1,
+            class_weight='balanced'
+        )
+    return LogisticRegression(max_iter=1000, C=1.0, class_weight='balanced')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a hashing-vectorizer fake news model")
+    parser.add_argument('--fake', default='Fake.csv')
+    parser.add_argument('--true', default='True.csv')
+    parser.add_argument('--output', default='hashing_artifacts')
+    parser.add_argument('--n-features', type=int, default=2 ** 18,
+                        help='Size of the hash space (and of the IDF vector)')
+    parser.add_argument('--classifier', choices=['logistic', 'forest'], default='logistic')
+    args = parser.parse_args()
+
+    print("📰 Loading dataset...")
+    df = load_dataset(args.fake, args.true)
+    print(f"   {len(df)} articles ({(df['label'] == 1).sum()} real, {(df['label'] == 0).sum()} fake)")
+
+    print("🧹 Preprocessing text...")
+    app.stop_words = app.load_stop_words()
+    df['processed_text'] = app.preprocess_texts(df['full_text'].tolist())
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        df['processed_text'],
+        df['label'],
+        test_size=0.2,
+        random_state=42,
+        stratify=df['label']
+    )
+
+    vectorizer_meta = {
+        'type': 'hashing',
+        'n_features': args.n_features,
+        'ngram_range': [1, 2],
+        'token_pattern': TOKEN_PATTERN,
+        'lowercase': True,
+        'binary': False,
+        'sublinear_tf': False,
+        'use_idf': True,
+        'norm': 'l2'
+    }
+
+    print(f"#️⃣ Hashing into {args.n_features} features and fitting IDF...")
+    hasher = HashingVectorizer(
+        n_features=args.n_features,
+        ngram_range=(1, 2),
+        token_pattern=TOKEN_PATTERN,
+        lowercase=True,
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float64
+    )
+    transformer = TfidfTransformer(norm='l2', use_idf=True, smooth_idf=True, sublinear_tf=False)
+    X_train_tfidf = transformer.fit_transform(hasher.transform(X_train))
+    X_test_tfidf = transformer.transform(hasher.transform(X_test))
+
+    print(f"🤖 Training {args.classifier} classifier...")
+    start_time = time.time()
+    classifier = build_classifier(args.classifier)
+    classifier.fit(X_train_tfidf, y_train)
+    print(f"   Trained in {time.time() - start_time:.1f}s")
+    print(classification_report(y_test, classifier.predict(X_test_tfidf), target_names=['Fake', 'Real']))
+
+    os.makedirs(args.output, exist_ok=True)
+    np.save(os.path.join(args.output, 'idf.npy'), np.asarray(transformer.idf_, dtype=np.float64))
+    model_meta = export_model(classifier, args.output, args.n_features)
+    with open(os.path.join(args.output, 'meta.json'), 'w') as f:
+        json.dump({'format_version': 1, 'vectorizer': vectorizer_meta, 'model': model_meta}, f, indent=2)
+
+    # The runtime path must reproduce the training pipeline exactly
+    runtime_model, runtime_vectorizer = app.load_array_artifacts(args.output)
+    sample = X_test.tolist()[:500]
+    expected = classifier.predict_proba(transformer.transform(hasher.transform(sample)))
+    actual = runtime_model.predict_proba(runtime_vectorizer.transform(sample))
+    error = float(np.abs(expected - actual).max())
+    print(f"🔍 Max probability difference between training and runtime pipelines: {error:.2e}")
+    if error > 1e-9:
+        print("❌ Runtime pipeline does not reproduce the trained model")
+        sys.exit(1)
+
+    total_bytes = sum(os.path.getsize(os.path.join(args.output, name)) for name in os.listdir(args.output))
+    print(f"✅ Wrote {args.output}/ ({total_bytes / 1024 / 1024:.1f} MB, no vocabulary)")
+
+
+if __name__ == "__main__":
+    main()